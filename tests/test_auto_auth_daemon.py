@@ -32,7 +32,10 @@ class TestRefreshAuth:
 
         assert result is True
         assert client._auth_cache_time == 0.0
-        # _init_client was called again (YTMusic instantiated twice: init + refresh)
+        # Construction is lazy, so only refresh_auth instantiated YTMusic
+        assert mock_ytmusic_cls.call_count == 1
+
+        client.refresh_auth()
         assert mock_ytmusic_cls.call_count == 2
 
     @patch("ytmpd.ytmusic.YTMusic")
@@ -4,10 +4,23 @@ import json
 import signal
 from unittest.mock import Mock, patch
 
+import pytest
+
 from ytmpd.daemon import YTMPDaemon
 from ytmpd.sync_engine import SyncResult
 
 
+@pytest.fixture(autouse=True)
+def mock_track_store():
+    """Keep daemon tests from opening a real track mapping database.
+
+    Several tests run with a MagicMock config, and a real TrackStore would
+    create SQLite files under a ``MagicMock/...`` path in the working directory.
+    """
+    with patch("ytmpd.daemon.TrackStore") as mock_store:
+        yield mock_store
+
+
 class TestDaemonInit:
     """Tests for daemon initialization."""
 
@@ -177,6 +190,61 @@ class TestPerformSync:
         assert daemon.state["last_sync_result"]["playlists_synced"] == 3
         assert daemon.state["last_sync_result"]["tracks_added"] == 50
 
+    @patch("ytmpd.daemon.YTMusicClient")
+    @patch("ytmpd.daemon.MPDClient")
+    @patch("ytmpd.daemon.StreamResolver")
+    @patch("ytmpd.daemon.SyncEngine")
+    @patch("ytmpd.daemon.load_config")
+    @patch("ytmpd.daemon.get_config_dir")
+    def test_perform_sync_clears_proxy_negative_cache(
+        self,
+        mock_get_config_dir,
+        mock_load_config,
+        mock_sync_engine_class,
+        mock_resolver,
+        mock_mpd,
+        mock_ytmusic,
+        tmp_path,
+    ):
+        """Test that a sync makes the proxy forget 404s for possibly added tracks."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "browser.json").touch()
+        mock_get_config_dir.return_value = config_dir
+
+        mock_load_config.return_value = {
+            "mpd_socket_path": "/tmp/mpd.sock",
+            "stream_cache_hours": 5,
+            "playlist_prefix": "YT: ",
+            "sync_interval_minutes": 30,
+            "enable_auto_sync": True,
+            "proxy_enabled": True,
+            "proxy_host": "localhost",
+            "proxy_port": 8080,
+            "proxy_track_mapping_db": "/tmp/track_mapping.db",
+        }
+
+        mock_sync_engine = Mock()
+        mock_sync_engine.sync_all_playlists.return_value = SyncResult(
+            success=True,
+            playlists_synced=1,
+            playlists_failed=0,
+            tracks_added=1,
+            tracks_failed=0,
+            duration_seconds=1.0,
+            errors=[],
+        )
+        mock_sync_engine_class.return_value = mock_sync_engine
+
+        daemon = YTMPDaemon()
+        daemon._proxy_loop = Mock()
+
+        daemon._perform_sync()
+
+        daemon._proxy_loop.call_soon_threadsafe.assert_called_once_with(
+            daemon.proxy_server.forget_negative, None
+        )
+
     @patch("ytmpd.daemon.YTMusicClient")
     @patch("ytmpd.daemon.MPDClient")
     @patch("ytmpd.daemon.StreamResolver")
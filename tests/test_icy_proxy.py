@@ -1,5 +1,6 @@
 """Unit tests for ICYProxyServer."""
 
+import time
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -82,6 +83,16 @@ class TestICYProxyServer(AioHTTPTestCase):
         data = await resp.json()
         assert data["status"] == "ok"
         assert data["service"] == "icy-proxy"
+        assert resp.headers["ETag"] == '"ok"'
+
+    async def test_health_check_not_modified(self) -> None:
+        """Test health check honors If-None-Match with a 304."""
+        resp = await self.client.get("/health", headers={"If-None-Match": '"ok"'})
+        assert resp.status == 304
+        assert await resp.read() == b""
+
+        resp = await self.client.get("/health", headers={"If-None-Match": '"stale"'})
+        assert resp.status == 200
 
     async def test_invalid_video_id_format(self) -> None:
         """Test proxy request with invalid video_id format."""
@@ -120,9 +131,11 @@ async def test_server_start_stop(populated_store: TrackStore) -> None:
     await proxy.start()
     assert proxy.runner is not None
     assert proxy.site is not None
+    assert proxy._executor is not None
 
     # Stop server
     await proxy.stop()
+    assert proxy._executor is None
 
 
 @pytest.mark.asyncio
@@ -312,21 +325,41 @@ async def test_connection_tracking() -> None:
 
     assert proxy._active_connections == 0
 
-    # Simulate connection increment
-    async with proxy._connection_lock:
-        proxy._active_connections += 1
-
-    assert proxy._active_connections == 1
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "notfound123"}
 
-    # Simulate connection decrement
-    async with proxy._connection_lock:
-        proxy._active_connections -= 1
+    # Counter is released after the request completes, even on error
+    with pytest.raises(web.HTTPNotFound):
+        await proxy._handle_proxy_request(mock_request)
 
     assert proxy._active_connections == 0
 
     track_store.close()
 
 
+@pytest.mark.asyncio
+async def test_connection_limit_rejects_without_lookup() -> None:
+    """Test requests over the limit are rejected before touching the store."""
+    track_store = Mock()
+
+    proxy = ICYProxyServer(track_store, max_concurrent_streams=2)
+    proxy._active_connections = 2
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "dQw4w9WgXcQ"}
+
+    with pytest.raises(web.HTTPServiceUnavailable) as exc_info:
+        await proxy._handle_proxy_request(mock_request)
+
+    assert exc_info.value.headers["Retry-After"] == "1"
+    assert exc_info.value.text == "Too many concurrent streams"
+    track_store.get_track_min.assert_not_called()
+    track_store.get_track.assert_not_called()
+    assert proxy._active_connections == 2
+
+
 # ==================== Phase 4: Additional Coverage Tests ====================
 
 
@@ -367,9 +400,8 @@ async def test_handle_proxy_request_with_url_refresh(populated_store: TrackStore
         port=8888
     )
 
-    # Call handler - should raise HTTPTemporaryRedirect
-    with pytest.raises(web.HTTPTemporaryRedirect) as exc_info:
-        await proxy._handle_proxy_request(mock_request)
+    # Call handler - should return an HTTP 307 redirect
+    response = await proxy._handle_proxy_request(mock_request)
 
     # Verify URL refresh was called
     mock_resolver.resolve_video_id.assert_called_once_with("expired_vid")
@@ -379,7 +411,7 @@ async def test_handle_proxy_request_with_url_refresh(populated_store: TrackStore
     assert track["stream_url"] == "https://new-url.com/stream"
 
     # Verify response is HTTP redirect to new URL
-    assert exc_info.value.location == "https://new-url.com/stream"
+    assert response.headers["Location"] == "https://new-url.com/stream"
 
 
 @pytest.mark.asyncio
@@ -416,12 +448,11 @@ async def test_handle_proxy_request_url_refresh_failure_continues(populated_stor
         port=8888
     )
 
-    # Should raise HTTPTemporaryRedirect, continuing with old URL after refresh failure
-    with pytest.raises(web.HTTPTemporaryRedirect) as exc_info:
-        await proxy._handle_proxy_request(mock_request)
+    # Should redirect, continuing with old URL after refresh failure
+    response = await proxy._handle_proxy_request(mock_request)
 
     # Verify response is HTTP redirect to old URL (fallback after refresh failure)
-    assert exc_info.value.location == "https://old-url.com/stream"
+    assert response.headers["Location"] == "https://old-url.com/stream"
 
 
 @pytest.mark.asyncio
@@ -441,10 +472,441 @@ async def test_handle_proxy_request_redirect_success(populated_store: TrackStore
 
     proxy = ICYProxyServer(populated_store, host="localhost", port=8888)
 
-    # Call handler - should raise HTTPTemporaryRedirect
-    with pytest.raises(web.HTTPTemporaryRedirect) as exc_info:
-        await proxy._handle_proxy_request(mock_request)
+    # Call handler - should return an HTTP 307 redirect
+    response = await proxy._handle_proxy_request(mock_request)
 
     # Verify response is HTTP 307 redirect
-    assert exc_info.value.location == "https://youtube.com/stream/test1"
+    assert response.headers["Location"] == "https://youtube.com/stream/test1"
+    assert response.status == 307
+    assert response.reason == "Temporary Redirect"
+    assert response.body is None
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_are_coalesced(track_store: TrackStore) -> None:
+    """Test concurrent refreshes for the same video_id share one resolver call."""
+    import asyncio
+    import time
+
+    def slow_resolve(video_id: str) -> str:
+        time.sleep(0.05)
+        return f"https://new-url.com/{video_id}"
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=slow_resolve)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    urls = await asyncio.gather(
+        proxy._refresh_stream_url("test_video_1"),
+        proxy._refresh_stream_url("test_video_1"),
+        proxy._refresh_stream_url("test_video_1"),
+    )
+
+    assert urls == ["https://new-url.com/test_video_1"] * 3
+    mock_resolver.resolve_video_id.assert_called_once_with("test_video_1")
+    assert proxy._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_refresh_does_not_cancel_waiters(track_store: TrackStore) -> None:
+    """Test a waiter resolves on its own when the refresh it joined is cancelled."""
+    import asyncio
+    import time
+
+    def slow_resolve(video_id: str) -> str:
+        time.sleep(0.05)
+        return f"https://new-url.com/{video_id}"
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=slow_resolve)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    first = asyncio.create_task(proxy._refresh_stream_url("test_video_1"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(proxy._refresh_stream_url("test_video_1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "https://new-url.com/test_video_1"
+    assert first.cancelled()
+    assert mock_resolver.resolve_video_id.call_count == 2
+    assert proxy._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_refresh_failure_propagates(track_store: TrackStore) -> None:
+    """Test waiters on a coalesced refresh all see the failure."""
+    import asyncio
+    import time
+
+    from ytmpd.exceptions import URLRefreshError
+
+    def slow_fail(video_id: str) -> None:
+        time.sleep(0.05)
+        return None
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=slow_fail)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    results = await asyncio.gather(
+        proxy._refresh_stream_url("test_video_1"),
+        proxy._refresh_stream_url("test_video_1"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, URLRefreshError) for r in results)
+    mock_resolver.resolve_video_id.assert_called_once_with("test_video_1")
+
+
+@pytest.mark.asyncio
+async def test_aimd_limit_decreases_on_failure_and_recovers(track_store: TrackStore) -> None:
+    """Test the effective concurrency limit adapts to resolver outcomes."""
+    from ytmpd.exceptions import URLRefreshError
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(return_value=None)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver, max_concurrent_streams=8)
+    assert proxy._effective_max == 8
+
+    # Failure halves the limit
+    with pytest.raises(URLRefreshError):
+        await proxy._refresh_stream_url("test_video_1")
+    assert proxy._effective_max == 4
+
+    # Fast successes grow it additively, capped at max_concurrent_streams
+    mock_resolver.resolve_video_id = Mock(return_value="https://new-url.com/stream")
+    for _ in range(20):
+        await proxy._refresh_stream_url("test_video_1")
+    assert proxy._effective_max == 8
+
+
+def test_aimd_limit_decreases_on_slow_resolver(track_store: TrackStore) -> None:
+    """Test a high rolling latency shrinks the limit but never below the minimum."""
+    from ytmpd.icy_proxy import AIMD_TARGET_LATENCY_SECONDS, MIN_CONCURRENT_STREAMS
+
+    proxy = ICYProxyServer(track_store, max_concurrent_streams=4)
+
+    for _ in range(10):
+        proxy._record_resolver_latency(AIMD_TARGET_LATENCY_SECONDS * 5)
+
+    assert proxy._effective_max == MIN_CONCURRENT_STREAMS
+
+
+@pytest.mark.asyncio
+async def test_reduced_limit_does_not_gate_cached_redirects(track_store: TrackStore) -> None:
+    """Test a shrunken resolver limit leaves requests for fresh URLs unaffected."""
+    from ytmpd.icy_proxy import MIN_CONCURRENT_STREAMS
+
+    track_store.add_track("dQw4w9WgXcQ", "https://youtube.com/stream/1", "Title", "Artist")
+
+    proxy = ICYProxyServer(track_store, max_concurrent_streams=4)
+    proxy._effective_max = float(MIN_CONCURRENT_STREAMS)
+    proxy._last_resolver_failure = time.monotonic()
+    proxy._active_connections = 2
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "dQw4w9WgXcQ"}
+
+    response = await proxy._handle_proxy_request(mock_request)
+
+    assert response.status == 307
+    assert proxy._active_connections == 2
+
+
+@pytest.mark.asyncio
+async def test_refreshes_wait_for_resolution_slot(track_store: TrackStore) -> None:
+    """Test concurrent refreshes beyond the adaptive limit queue for the resolver."""
+    import asyncio
+    import threading
+
+    release = threading.Event()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def resolve(video_id: str) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(5)
+        with lock:
+            active -= 1
+        return f"https://new-url.com/{video_id}"
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=resolve)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver, max_concurrent_streams=4)
+    proxy._effective_max = 1.0
+    proxy._last_resolver_failure = time.monotonic()
+
+    tasks = [
+        asyncio.create_task(proxy._refresh_stream_url(f"test_video_{i}")) for i in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    urls = await asyncio.gather(*tasks)
+
+    assert urls == [f"https://new-url.com/test_video_{i}" for i in range(3)]
+    assert peak == 1
+    assert proxy._active_resolutions == 0
+
+
+def test_aimd_limit_resets_after_idle_period(track_store: TrackStore) -> None:
+    """Test the adaptive limit recovers once resolver failures stop."""
+    from ytmpd.icy_proxy import AIMD_IDLE_RESET_SECONDS, MIN_CONCURRENT_STREAMS
+
+    proxy = ICYProxyServer(track_store, max_concurrent_streams=8)
+    for _ in range(5):
+        proxy._decrease_concurrency()
+    assert proxy._resolution_limit() == MIN_CONCURRENT_STREAMS
+
+    proxy._last_resolver_failure -= AIMD_IDLE_RESET_SECONDS
+    assert proxy._resolution_limit() == 8
+    assert proxy._effective_max == 8
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_negatively_cached() -> None:
+    """Test repeated requests for an unknown video_id skip the store lookup."""
+    track_store = Mock()
+    track_store.get_track_min = Mock(return_value=None)
+
+    proxy = ICYProxyServer(track_store)
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "notfound123"}
+
+    for _ in range(3):
+        with pytest.raises(web.HTTPNotFound):
+            await proxy._handle_proxy_request(mock_request)
+
+    track_store.get_track_min.assert_called_once_with("notfound123")
+    assert proxy._active_connections == 0
+
+
+@pytest.mark.asyncio
+async def test_forget_negative_allows_newly_added_track() -> None:
+    """Test a forgotten 404 is looked up again once the track is added."""
+    track_store = Mock()
+    track_store.get_track_min = Mock(return_value=None)
+
+    proxy = ICYProxyServer(track_store)
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "dQw4w9WgXcQ"}
+
+    with pytest.raises(web.HTTPNotFound):
+        await proxy._handle_proxy_request(mock_request)
+
+    assert proxy.forget_negative(["dQw4w9WgXcQ", "unknownvid1"]) == 1
+
+    track_store.get_track_min = Mock(return_value=("https://youtube.com/stream", time.time()))
+    response = await proxy._handle_proxy_request(mock_request)
+
+    assert response.status == 307
+    assert proxy.forget_negative() == 0
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_entry_expires(track_store: TrackStore) -> None:
+    """Test an expired negative cache entry falls through to a fresh lookup."""
+    proxy = ICYProxyServer(track_store)
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "dQw4w9WgXcQ"}
+
+    with pytest.raises(web.HTTPNotFound):
+        await proxy._handle_proxy_request(mock_request)
+
+    # Track appears (e.g. after a sync) and the cached 404 has expired
+    track_store.add_track("dQw4w9WgXcQ", "https://youtube.com/stream/x", "Title", "Artist")
+    expires_at, error_class, text = proxy._negative_cache["dQw4w9WgXcQ"]
+    proxy._negative_cache["dQw4w9WgXcQ"] = (0.0, error_class, text)
+
+    response = await proxy._handle_proxy_request(mock_request)
+    assert response.status == 307
+    assert "dQw4w9WgXcQ" not in proxy._negative_cache
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_refresh_suspends_further_refreshes(track_store: TrackStore) -> None:
+    """Test a rate-limit error blocks refreshes for the retry-after window."""
+    from ytmpd.exceptions import URLRefreshError
+
+    class RateLimitError(Exception):
+        retry_after = 60
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=RateLimitError("HTTP Error 429"))
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    with pytest.raises(URLRefreshError):
+        await proxy._refresh_stream_url("test_video_1")
+
+    with pytest.raises(URLRefreshError, match="rate limited"):
+        await proxy._refresh_stream_url("test_video_2")
+
+    # Second refresh never reached the resolver
+    mock_resolver.resolve_video_id.assert_called_once_with("test_video_1")
+
+
+@pytest.mark.asyncio
+async def test_resolver_429_starts_refresh_cooldown(track_store: TrackStore) -> None:
+    """Test a real resolver hitting yt-dlp HTTP 429 suspends further refreshes."""
+    import yt_dlp
+
+    from ytmpd.exceptions import URLRefreshError
+    from ytmpd.icy_proxy import RATE_LIMIT_COOLDOWN_SECONDS
+    from ytmpd.stream_resolver import StreamResolver
+
+    with patch("ytmpd.stream_resolver.yt_dlp.YoutubeDL") as mock_ydl_class:
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError(
+            "ERROR: Unable to download webpage: HTTP Error 429: Too Many Requests"
+        )
+        mock_ydl_class.return_value = mock_ydl
+        proxy = ICYProxyServer(track_store, stream_resolver=StreamResolver())
+
+        with pytest.raises(URLRefreshError):
+            await proxy._refresh_stream_url("test_video_1")
+        with pytest.raises(URLRefreshError, match="rate limited"):
+            await proxy._refresh_stream_url("test_video_2")
+
+    assert mock_ydl.extract_info.call_count == 1
+    remaining = proxy._refresh_block_until - time.monotonic()
+    assert 0 < remaining <= RATE_LIMIT_COOLDOWN_SECONDS
+
+
+def test_retry_after_seconds_detection() -> None:
+    """Test rate-limit detection from resolver errors."""
+    from ytmpd.exceptions import RateLimitedError
+    from ytmpd.icy_proxy import RATE_LIMIT_COOLDOWN_SECONDS, _retry_after_seconds
+
+    error = Exception("boom")
+    error.retry_after = "12"  # type: ignore[attr-defined]
+    assert _retry_after_seconds(error) == 12.0
+
+    assert _retry_after_seconds(RateLimitedError("Too Many Requests")) == (
+        RATE_LIMIT_COOLDOWN_SECONDS
+    )
+    assert _retry_after_seconds(RateLimitedError("slow down", retry_after=5)) == 5.0
+    assert _retry_after_seconds(Exception("Video unavailable")) is None
+    # Only the error type counts: digits in a video ID are not a 429
+    assert _retry_after_seconds(Exception("Video a4290bcdefg unavailable")) is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_url_is_not_double_wrapped(track_store: TrackStore) -> None:
+    """Test an empty resolver result raises a single, unwrapped URLRefreshError."""
+    from ytmpd.exceptions import URLRefreshError
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(return_value=None)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    with pytest.raises(URLRefreshError) as exc_info:
+        await proxy._refresh_stream_url("test_video_1")
+
+    assert str(exc_info.value) == "Failed to resolve new URL for test_video_1"
+    assert exc_info.value.__cause__ is None
+
+
+@pytest.mark.asyncio
+async def test_handle_proxy_request_lazy_resolution(track_store: TrackStore) -> None:
+    """Test unresolved tracks are resolved on demand and saved to the store."""
+    track_store.add_track("lazyvideo01", None, "Lazy Track", "Artist")
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(return_value="https://new-url.com/lazy")
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "lazyvideo01"}
+
+    response = await proxy._handle_proxy_request(mock_request)
+
+    assert response.headers["Location"] == "https://new-url.com/lazy"
+    assert track_store.get_track("lazyvideo01")["stream_url"] == "https://new-url.com/lazy"
+
+
+@pytest.mark.asyncio
+async def test_handle_proxy_request_lazy_resolution_failure(track_store: TrackStore) -> None:
+    """Test unresolved tracks that fail to resolve return 502."""
+    track_store.add_track("lazyvideo01", None, "Lazy Track", "Artist")
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(return_value=None)
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver)
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "lazyvideo01"}
+
+    with pytest.raises(web.HTTPBadGateway):
+        await proxy._handle_proxy_request(mock_request)
+
+    assert proxy._active_connections == 0
+
+
+@pytest.mark.asyncio
+async def test_refreshed_urls_are_written_behind(track_store: TrackStore) -> None:
+    """Test resolved URLs are saved via the write-behind queue while running."""
+    track_store.add_track("lazyvideo01", None, "Lazy Track 1", "Artist")
+    track_store.add_track("lazyvideo02", None, "Lazy Track 2", "Artist")
+
+    mock_resolver = Mock()
+    mock_resolver.resolve_video_id = Mock(side_effect=lambda vid: f"https://new-url.com/{vid}")
+
+    proxy = ICYProxyServer(track_store, stream_resolver=mock_resolver, port=8767)
+    await proxy.start()
+
+    for video_id in ("lazyvideo01", "lazyvideo02"):
+        mock_request = Mock(spec=web.Request)
+        mock_request.remote = "127.0.0.1"
+        mock_request.match_info = {"video_id": video_id}
+        response = await proxy._handle_proxy_request(mock_request)
+        assert response.status == 307
+
+    # Stopping flushes any pending updates
+    await proxy.stop()
+
+    assert track_store.get_track("lazyvideo01")["stream_url"] == "https://new-url.com/lazyvideo01"
+    assert track_store.get_track("lazyvideo02")["stream_url"] == "https://new-url.com/lazyvideo02"
+
+
+@pytest.mark.asyncio
+async def test_handle_proxy_request_uses_full_row_for_info_logging(
+    populated_store: TrackStore, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the full track row is fetched only when the INFO log line is emitted."""
+    import logging
+
+    mock_request = Mock(spec=web.Request)
+    mock_request.remote = "127.0.0.1"
+    mock_request.match_info = {"video_id": "test_video1"}
+    populated_store.add_track("test_video1", "https://youtube.com/stream/1", "Song", "Band")
+
+    proxy = ICYProxyServer(populated_store)
+
+    with caplog.at_level(logging.INFO, logger="ytmpd.icy_proxy"):
+        response = await proxy._handle_proxy_request(mock_request)
+        assert response.status == 307
 
+    assert "track=Band - Song" in caplog.text
@@ -329,20 +329,16 @@ class TestM3ULikeIndicator:
 
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
-    def test_m3u_liked_track_has_indicator(self, mock_path, mock_mpd_base):
+    def test_m3u_liked_track_has_indicator(self, mock_path, mock_mpd_base, tmp_path):
         """EXTINF line for liked track should contain [+1]."""
         mock_path.return_value.expanduser.return_value.exists.return_value = True
         mock_client = Mock()
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = self._make_tracks()
         liked_ids = {"vid1"}
@@ -355,25 +351,21 @@ class TestM3ULikeIndicator:
             like_indicator=indicator,
         )
 
-        written = mock_playlist_file.write_text.call_args[0][0]
+        written = (tmp_path / "Test.m3u").read_text(encoding="utf-8")
         assert "#EXTINF:-1,Artist A - Liked Song [+1]" in written
 
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
-    def test_m3u_non_liked_track_no_indicator(self, mock_path, mock_mpd_base):
+    def test_m3u_non_liked_track_no_indicator(self, mock_path, mock_mpd_base, tmp_path):
         """EXTINF line for non-liked track should NOT contain indicator."""
         mock_path.return_value.expanduser.return_value.exists.return_value = True
         mock_client = Mock()
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = self._make_tracks()
         liked_ids = {"vid1"}
@@ -386,26 +378,22 @@ class TestM3ULikeIndicator:
             like_indicator=indicator,
         )
 
-        written = mock_playlist_file.write_text.call_args[0][0]
+        written = (tmp_path / "Test.m3u").read_text(encoding="utf-8")
         assert "#EXTINF:-1,Artist B - Other Song\n" in written
         assert "Other Song [+1]" not in written
 
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
-    def test_m3u_left_alignment(self, mock_path, mock_mpd_base):
+    def test_m3u_left_alignment(self, mock_path, mock_mpd_base, tmp_path):
         """Left-aligned indicator should appear before artist-title."""
         mock_path.return_value.expanduser.return_value.exists.return_value = True
         mock_client = Mock()
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = [self._make_tracks()[0]]  # liked track only
         liked_ids = {"vid1"}
@@ -418,25 +406,21 @@ class TestM3ULikeIndicator:
             like_indicator=indicator,
         )
 
-        written = mock_playlist_file.write_text.call_args[0][0]
+        written = (tmp_path / "Test.m3u").read_text(encoding="utf-8")
         assert "#EXTINF:-1,[+1] Artist A - Liked Song" in written
 
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
-    def test_m3u_indicator_disabled(self, mock_path, mock_mpd_base):
+    def test_m3u_indicator_disabled(self, mock_path, mock_mpd_base, tmp_path):
         """Disabled indicator should not modify EXTINF lines."""
         mock_path.return_value.expanduser.return_value.exists.return_value = True
         mock_client = Mock()
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = [self._make_tracks()[0]]
         liked_ids = {"vid1"}
@@ -449,7 +433,7 @@ class TestM3ULikeIndicator:
             like_indicator=indicator,
         )
 
-        written = mock_playlist_file.write_text.call_args[0][0]
+        written = (tmp_path / "Test.m3u").read_text(encoding="utf-8")
         assert "#EXTINF:-1,Artist A - Liked Song\n" in written
         assert "[+1]" not in written
 
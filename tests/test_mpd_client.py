@@ -1,5 +1,7 @@
 """Tests for MPD client module."""
 
+import os
+import socket
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -24,6 +26,20 @@ class TestMPDClientInit:
         client = MPDClient("~/mpd/socket")
         assert client.socket_path == str(Path.home() / "mpd" / "socket")
 
+    def test_init_parses_host_port_as_tcp(self):
+        """Test that host:port selects a TCP connection."""
+        client = MPDClient("localhost:6600")
+        assert client.connection_type == "tcp"
+        assert client.host == "localhost"
+        assert client.port == 6600
+
+    def test_init_path_with_colon_is_unix_socket(self):
+        """Test that a socket path containing a colon stays a Unix socket."""
+        client = MPDClient("/run/mpd:1/socket")
+        assert client.connection_type == "unix"
+        assert client.socket_path == "/run/mpd:1/socket"
+        assert client.host is None
+
     def test_init_starts_disconnected(self):
         """Test that client starts in disconnected state."""
         client = MPDClient("/path/to/socket")
@@ -242,7 +258,56 @@ class TestMPDClientPlaylists:
 
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
-    def test_create_or_replace_playlist_new(self, mock_path, mock_mpd_base):
+    def test_playlists_exist(self, mock_path, mock_mpd_base):
+        """Test checking many names with one listplaylists call."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.listplaylists.return_value = [
+            {"playlist": "Playlist 1"},
+            {"playlist": "Playlist 2"},
+        ]
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        result = client.playlists_exist(["Playlist 1", "Playlist 3", "Playlist 2"])
+
+        assert result == {"Playlist 1": True, "Playlist 3": False, "Playlist 2": True}
+        mock_client.listplaylists.assert_called_once()
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_playlist_exists_uses_cached_listing(self, mock_path, mock_mpd_base):
+        """Test that repeated lookups reuse one listplaylists result until invalidated."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.listplaylists.return_value = [{"playlist": "Playlist 1"}]
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        assert client.playlist_exists("Playlist 1")
+        assert not client.playlist_exists("Playlist 2")
+        assert client.list_playlists() == ["Playlist 1"]
+        assert mock_client.listplaylists.call_count == 1
+
+        # Deleting a playlist invalidates the cache
+        client.clear_playlist("Playlist 1")
+        mock_client.listplaylists.return_value = []
+        assert not client.playlist_exists("Playlist 1")
+        assert mock_client.listplaylists.call_count == 2
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_create_or_replace_playlist_new(self, mock_path, mock_mpd_base, tmp_path):
         """Test creating a new playlist."""
         # Mock socket exists
         mock_path.return_value.expanduser.return_value.exists.return_value = True
@@ -252,14 +317,9 @@ class TestMPDClientPlaylists:
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        # Mock playlist directory and file
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = [
             TrackWithMetadata(url="http://example.com/track1.m4a", title="Track 1", artist="Artist 1", video_id="test_video_id"),
@@ -268,8 +328,7 @@ class TestMPDClientPlaylists:
         client.create_or_replace_playlist("Test Playlist", tracks)
 
         # Verify M3U file was written
-        mock_playlist_file.write_text.assert_called_once()
-        written_content = mock_playlist_file.write_text.call_args[0][0]
+        written_content = (tmp_path / "Test Playlist.m3u").read_text(encoding="utf-8")
         assert "#EXTM3U" in written_content
         assert "#EXTINF:-1,Artist 1 - Track 1" in written_content
         assert "http://example.com/track1.m4a" in written_content
@@ -279,7 +338,7 @@ class TestMPDClientPlaylists:
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
     def test_create_or_replace_playlist_replaces_existing(
-        self, mock_path, mock_mpd_base
+        self, mock_path, mock_mpd_base, tmp_path
     ):
         """Test replacing an existing playlist."""
         # Mock socket exists
@@ -290,21 +349,15 @@ class TestMPDClientPlaylists:
         mock_client.listplaylists.return_value = [{"playlist": "Test Playlist"}]
         mock_mpd_base.return_value = mock_client
 
-        # Mock playlist directory and file
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = [TrackWithMetadata(url="http://example.com/track1.m4a", title="Track 1", artist="Artist 1", video_id="test_video_id")]
         client.create_or_replace_playlist("Test Playlist", tracks)
 
         # Verify M3U file was written (replaces existing file automatically)
-        mock_playlist_file.write_text.assert_called_once()
-        written_content = mock_playlist_file.write_text.call_args[0][0]
+        written_content = (tmp_path / "Test Playlist.m3u").read_text(encoding="utf-8")
         assert "#EXTM3U" in written_content
         assert "http://example.com/track1.m4a" in written_content
 
@@ -331,7 +384,7 @@ class TestMPDClientPlaylists:
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
     def test_create_or_replace_playlist_handles_invalid_urls(
-        self, mock_path, mock_mpd_base
+        self, mock_path, mock_mpd_base, tmp_path
     ):
         """Test that all URLs are written to M3U file (MPD validates them later)."""
         # Mock socket exists
@@ -342,14 +395,9 @@ class TestMPDClientPlaylists:
         mock_client.listplaylists.return_value = []
         mock_mpd_base.return_value = mock_client
 
-        # Mock playlist directory and file
-        mock_playlist_dir = Mock()
-        mock_playlist_file = Mock()
-        mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
-
         client = MPDClient("/path/to/socket")
         client.connect()
-        client.playlist_directory = mock_playlist_dir
+        client.playlist_directory = tmp_path
 
         tracks = [
             TrackWithMetadata(url="http://example.com/track1.m4a", title="Track 1", artist="Artist 1", video_id="test_video_id"),
@@ -359,8 +407,7 @@ class TestMPDClientPlaylists:
         client.create_or_replace_playlist("Test Playlist", tracks)
 
         # All tracks should be written to M3U file
-        mock_playlist_file.write_text.assert_called_once()
-        written_content = mock_playlist_file.write_text.call_args[0][0]
+        written_content = (tmp_path / "Test Playlist.m3u").read_text(encoding="utf-8")
         assert "http://example.com/track1.m4a" in written_content
         assert "http://example.com/invalid.m4a" in written_content
         assert "http://example.com/track2.m4a" in written_content
@@ -380,7 +427,9 @@ class TestMPDClientPlaylists:
         # Mock playlist directory and file that raises an error on write
         mock_playlist_dir = Mock()
         mock_playlist_file = Mock()
-        mock_playlist_file.write_text.side_effect = PermissionError("Cannot write")
+        mock_playlist_file.with_suffix.return_value.open.side_effect = PermissionError(
+            "Cannot write"
+        )
         mock_playlist_dir.__truediv__ = Mock(return_value=mock_playlist_file)
 
         client = MPDClient("/path/to/socket")
@@ -394,6 +443,116 @@ class TestMPDClientPlaylists:
 
         assert "Error creating M3U playlist" in str(exc_info.value)
 
+    def test_list_playlists_fs(self, tmp_path):
+        """Test listing playlist files straight from disk."""
+        client = MPDClient("/dev/null", playlist_directory=str(tmp_path / "playlists"))
+        assert client.list_playlists_fs() == []
+
+        (tmp_path / "playlists").mkdir()
+        (tmp_path / "playlists" / "YT: Mix.m3u").write_text("#EXTM3U\n")
+        (tmp_path / "playlists" / "notes.txt").write_text("")
+        (tmp_path / "playlists" / "Dir.m3u").mkdir()
+        youtube_dir = tmp_path / "music" / "_youtube"
+        youtube_dir.mkdir(parents=True)
+        (youtube_dir / "YT: Liked.xspf").write_text("")
+
+        assert client.list_playlists_fs() == ["YT: Mix"]
+        assert client.list_playlists_fs(
+            "xspf", mpd_music_directory=str(tmp_path / "music")
+        ) == ["YT: Liked"]
+
+    def test_create_m3u_playlist_with_proxy(self, tmp_path):
+        """Test M3U output uses proxy URLs when the proxy is enabled."""
+        client = MPDClient("/dev/null")
+        client.playlist_directory = tmp_path
+
+        tracks = [
+            TrackWithMetadata(url="http://example.com/track1.m4a", title="Track 1", artist="Artist 1", video_id="vid1"),
+        ]
+        with patch.object(client, "_ensure_connected"):
+            client.create_or_replace_playlist(
+                "Test Playlist",
+                tracks,
+                proxy_config={"enabled": True, "host": "localhost", "port": 8080},
+            )
+
+        content = (tmp_path / "Test Playlist.m3u").read_text(encoding="utf-8")
+        assert content == (
+            "#EXTM3U\n#EXTINF:-1,Artist 1 - Track 1\nhttp://localhost:8080/proxy/vid1\n"
+        )
+
+    def test_create_xspf_playlist_with_proxy(self, tmp_path):
+        """Test XSPF output uses proxy URLs and millisecond durations."""
+        client = MPDClient("/dev/null")
+
+        tracks = [
+            TrackWithMetadata(url="http://example.com/track1.m4a", title="Track 1", artist="Artist 1", video_id="vid1", duration_seconds=180.5),
+            TrackWithMetadata(url="http://example.com/track2.m4a", title="Track 2", artist="Artist 2", video_id="vid2"),
+        ]
+        with patch.object(client, "_ensure_connected"):
+            client.create_or_replace_playlist(
+                "Test Playlist",
+                tracks,
+                proxy_config={"enabled": True, "host": "localhost", "port": 8080},
+                playlist_format="xspf",
+                mpd_music_directory=str(tmp_path),
+            )
+
+        content = (tmp_path / "_youtube" / "Test Playlist.xspf").read_text(encoding="utf-8")
+        assert "<location>http://localhost:8080/proxy/vid1</location>" in content
+        assert "<location>http://localhost:8080/proxy/vid2</location>" in content
+        assert "<duration>180500</duration>" in content
+        assert content.count("<duration>") == 1
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_create_or_replace_playlist_failed_write_keeps_old_file(
+        self, mock_path, mock_mpd_base, tmp_path
+    ):
+        """Test that a write failing midway leaves the existing playlist intact."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+        client.playlist_directory = tmp_path
+
+        playlist_file = tmp_path / "Test Playlist.m3u"
+        playlist_file.write_text("#EXTM3U\nold\n", encoding="utf-8")
+
+        tracks = [TrackWithMetadata(url="http://example.com/track.m4a", title="Track", artist="Artist", video_id="test_video_id")]
+
+        with patch.object(client, "_apply_like_indicator", side_effect=RuntimeError("boom")):
+            with pytest.raises(MPDPlaylistError):
+                client.create_or_replace_playlist("Test Playlist", tracks)
+
+        assert playlist_file.read_text(encoding="utf-8") == "#EXTM3U\nold\n"
+        assert list(tmp_path.iterdir()) == [playlist_file]
+
+    def test_playlist_file_is_synced_before_replace(self, tmp_path):
+        """Test that the temp file is fsynced before it replaces the playlist."""
+        client = MPDClient("/dev/null")
+        client.playlist_directory = tmp_path
+
+        calls = []
+        tracks = [TrackWithMetadata(url="http://example.com/track.m4a", title="Track", artist="Artist", video_id="test_video_id")]
+        with (
+            patch.object(client, "_ensure_connected"),
+            patch("ytmpd.mpd_client.os.fsync", side_effect=lambda fd: calls.append("fsync")),
+            patch(
+                "ytmpd.mpd_client.os.replace",
+                side_effect=lambda src, dst: calls.append("replace") or os.rename(src, dst),
+            ),
+        ):
+            client.create_or_replace_playlist("Test Playlist", tracks)
+
+        assert calls == ["fsync", "replace"]
+        assert (tmp_path / "Test Playlist.m3u").exists()
+
     @patch("ytmpd.mpd_client.MPDClientBase")
     @patch("ytmpd.mpd_client.Path")
     def test_clear_playlist_success(self, mock_path, mock_mpd_base):
@@ -470,6 +629,96 @@ class TestMPDClientPlaylists:
 
         assert "does not exist" in str(exc_info.value)
 
+    @patch("ytmpd.mpd_client.PLAYLIST_ADD_BATCH_SIZE", 2)
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_add_urls_to_playlist_batches_commands(self, mock_path, mock_mpd_base):
+        """Test adding many URLs pipelines playlistadd in command lists."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        urls = [f"http://example.com/track{i}.m4a" for i in range(3)]
+        client.add_urls_to_playlist("Test Playlist", urls)
+
+        assert mock_client.playlistadd.call_args_list == [
+            (("Test Playlist", url),) for url in urls
+        ]
+        # 3 URLs with batch size 2 -> two command lists
+        assert mock_client.command_list_ok_begin.call_count == 2
+        assert mock_client.command_list_end.call_count == 2
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_add_urls_to_playlist_not_found(self, mock_path, mock_mpd_base):
+        """Test batched add to non-existent playlist raises error."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.command_list_end.side_effect = CommandError("No such playlist")
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        with pytest.raises(MPDPlaylistError) as exc_info:
+            client.add_urls_to_playlist("NonExistent", ["http://example.com/track.m4a"])
+
+        assert "does not exist" in str(exc_info.value)
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_replace_playlist_via_mpd(self, mock_path, mock_mpd_base):
+        """Test replacing a playlist removes it and re-adds URLs in one command list."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.rm.side_effect = CommandError("No such playlist")
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        urls = ["http://example.com/track1.m4a", "http://example.com/track2.m4a"]
+        client.replace_playlist_via_mpd("New Playlist", urls)
+
+        mock_client.rm.assert_called_once_with("New Playlist")
+        assert mock_client.playlistadd.call_args_list == [
+            (("New Playlist", url),) for url in urls
+        ]
+        mock_client.command_list_ok_begin.assert_called_once()
+        mock_client.command_list_end.assert_called_once()
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_replace_playlist_via_mpd_rm_error(self, mock_path, mock_mpd_base):
+        """Test that unexpected rm failures abort the replace."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.rm.side_effect = CommandError("Permission denied")
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        with pytest.raises(MPDPlaylistError):
+            client.replace_playlist_via_mpd("Test Playlist", ["http://example.com/track.m4a"])
+
+        mock_client.playlistadd.assert_not_called()
+
 
 class TestMPDClientReconnection:
     """Tests for reconnection logic."""
@@ -500,6 +749,147 @@ class TestMPDClientReconnection:
         # And set internal state correctly
         assert not client._connected
 
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_recent_success_skips_ping(self, mock_path, mock_mpd_base):
+        """Test that commands right after a successful one don't ping first."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.currentsong.return_value = {}
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        client.currentsong()
+        client.add_to_playlist("Test Playlist", "http://example.com/track.m4a")
+        mock_client.ping.assert_not_called()
+
+        # A lost connection forces the next command to verify first
+        mock_client.playlistadd.side_effect = ConnectionError("Connection lost")
+        with pytest.raises(MPDConnectionError):
+            client.add_to_playlist("Test Playlist", "http://example.com/track.m4a")
+
+        client.currentsong()
+        mock_client.ping.assert_called_once()
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_cached_playlist_listing_does_not_refresh_health(self, mock_path, mock_mpd_base):
+        """Test that a playlist cache hit doesn't count as a successful MPD command."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.listplaylists.return_value = [{"playlist": "Favorites"}]
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        client.list_playlists()
+        client._last_ok = 0.0
+
+        assert client.list_playlists() == ["Favorites"]
+        mock_client.listplaylists.assert_called_once()
+        assert client._last_ok == 0.0
+
+    @patch("ytmpd.mpd_client.CONNECTION_CHECK_INTERVAL_SECONDS", 0.0)
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_stale_connection_is_pinged(self, mock_path, mock_mpd_base):
+        """Test that commands ping first once the last success is stale."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.currentsong.return_value = {}
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+
+        client.currentsong()
+        mock_client.ping.assert_called_once()
+
+    @patch("ytmpd.mpd_client.time.sleep")
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_reconnect_backs_off_only_after_failures(self, mock_path, mock_mpd_base, mock_sleep):
+        """Test that reconnecting retries immediately and backs off between failures."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client: first reconnect attempt fails, second succeeds
+        mock_client = Mock()
+        mock_client.currentsong.return_value = {}
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        mock_client.connect.side_effect = [ConnectionError("refused"), None]
+        client.currentsong()
+
+        assert mock_client.connect.call_count == 2
+        mock_sleep.assert_called_once_with(0.05)
+
+    @patch("ytmpd.mpd_client.time.sleep")
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_reconnect_gives_up_after_attempts(self, mock_path, mock_mpd_base, mock_sleep):
+        """Test that reconnecting raises once all attempts fail."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        mock_client = Mock()
+        mock_client.connect.side_effect = ConnectionError("refused")
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        with pytest.raises(MPDConnectionError):
+            client.currentsong()
+
+        assert mock_client.connect.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
+    @patch("ytmpd.mpd_client.CONNECTION_MAX_AGE_SECONDS", 0.0)
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    @patch("ytmpd.mpd_client.Path")
+    def test_old_connection_is_recycled(self, mock_path, mock_mpd_base):
+        """Test that a connection past its max age is reopened before the next command."""
+        # Mock socket exists
+        mock_path.return_value.expanduser.return_value.exists.return_value = True
+
+        # Mock MPD client
+        mock_client = Mock()
+        mock_client.currentsong.return_value = {}
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("/path/to/socket")
+        client.connect()
+        client.currentsong()
+
+        mock_client.close.assert_called_once()
+        assert mock_client.connect.call_count == 2
+        assert client._connected
+
+    @patch("ytmpd.mpd_client.MPDClientBase")
+    def test_tcp_connection_enables_keepalive(self, mock_mpd_base):
+        """Test that TCP connections turn on SO_KEEPALIVE."""
+        mock_client = Mock()
+        mock_mpd_base.return_value = mock_client
+
+        client = MPDClient("localhost:6600")
+        client.connect()
+
+        mock_client._sock.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+        )
+
 
 class TestMPDClientContextManager:
     """Tests for context manager support."""
@@ -3,6 +3,8 @@
 Tests the RatingManager state machine and all state transitions.
 """
 
+import dataclasses
+
 import pytest
 
 from ytmpd.rating import RatingAction, RatingManager, RatingState, RatingTransition
@@ -12,10 +14,14 @@ class TestRatingStateEnum:
     """Tests for RatingState enum."""
 
     def test_rating_state_values(self):
-        """Verify enum values match API expectations."""
-        assert RatingState.NEUTRAL.value == "INDIFFERENT"
-        assert RatingState.LIKED.value == "LIKE"
-        assert RatingState.DISLIKED.value == "DISLIKE"
+        """Verify API values match API expectations."""
+        assert RatingState.NEUTRAL.api_value == "INDIFFERENT"
+        assert RatingState.LIKED.api_value == "LIKE"
+        assert RatingState.DISLIKED.api_value == "DISLIKE"
+
+    def test_rating_state_is_int(self):
+        """Verify states are plain integers for cheap hashing."""
+        assert [int(state) for state in RatingState] == [0, 1, 2]
 
 
 class TestRatingActionEnum:
@@ -23,8 +29,8 @@ class TestRatingActionEnum:
 
     def test_rating_action_values(self):
         """Verify enum values."""
-        assert RatingAction.LIKE.value == "like"
-        assert RatingAction.DISLIKE.value == "dislike"
+        assert RatingAction.LIKE == 0
+        assert RatingAction.DISLIKE == 1
 
 
 class TestRatingTransition:
@@ -46,6 +52,13 @@ class TestRatingTransition:
         assert transition.api_value == "LIKE"
         assert transition.user_message == "✓ Liked"
 
+    def test_transition_is_immutable(self):
+        """Verify shared transition results cannot be modified."""
+        transition = RatingManager().apply_action(RatingState.NEUTRAL, RatingAction.LIKE)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            transition.new_state = RatingState.DISLIKED
+
 
 class TestRatingManagerApplyAction:
     """Tests for RatingManager.apply_action() - all 6 state transitions."""
@@ -221,6 +234,15 @@ class TestRatingManagerEdgeCases:
             f"Expected {expected_transitions} transitions, " f"but found {actual_transitions}"
         )
 
+    def test_prebuilt_table_matches_transitions(self):
+        """Verify the prebuilt table mirrors the transition spec."""
+        manager = RatingManager()
+
+        assert manager._TABLE.keys() == manager._TRANSITIONS.keys()
+        for (state, action), (new_state, api_value, message) in manager._TRANSITIONS.items():
+            result = manager.apply_action(state, action)
+            assert result == RatingTransition(state, action, new_state, api_value, message)
+
     def test_all_transitions_return_valid_api_values(self):
         """Verify all transitions return valid API values."""
         manager = RatingManager()
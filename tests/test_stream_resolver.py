@@ -2,14 +2,28 @@
 Tests for ytmpd/stream_resolver.py - Stream URL resolver with yt-dlp integration.
 """
 
+import json
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 import yt_dlp
 
-from ytmpd.stream_resolver import StreamResolver, CachedURL
+from ytmpd.exceptions import RateLimitedError
+from ytmpd.stream_resolver import PROCESS_POOL_MIN_BATCH, StreamResolver, CachedURL
+
+
+def make_entry(url, video_id, age_hours=0.0, cache_hours=5):
+    """Build a CachedURL cached age_hours ago under a cache_hours TTL."""
+    return CachedURL(
+        url=url,
+        cached_at=time.time() - age_hours * 3600,
+        video_id=video_id,
+        expires_at=time.monotonic() + (cache_hours - age_hours) * 3600,
+    )
 
 
 class TestCachedURL:
@@ -17,16 +31,19 @@ class TestCachedURL:
 
     def test_cached_url_creation(self):
         """Test creating a CachedURL instance."""
-        now = datetime.now()
+        now = time.time()
+        deadline = time.monotonic() + 3600
         cached = CachedURL(
             url="https://example.com/audio.m4a",
             cached_at=now,
-            video_id="dQw4w9WgXcQ"
+            video_id="dQw4w9WgXcQ",
+            expires_at=deadline,
         )
 
         assert cached.url == "https://example.com/audio.m4a"
         assert cached.cached_at == now
         assert cached.video_id == "dQw4w9WgXcQ"
+        assert cached.expires_at == deadline
 
 
 class TestStreamResolverInit:
@@ -44,46 +61,20 @@ class TestStreamResolverInit:
         assert resolver._cache_hours == 3
         assert resolver._cache == {}
 
+    def test_init_max_workers(self):
+        """Test worker pool defaults to the CPU heuristic and can be overridden."""
+        assert 4 <= StreamResolver()._max_workers <= 16
+        assert StreamResolver(max_workers=2)._max_workers == 2
+
 
 class TestStreamResolverCaching:
     """Tests for caching functionality."""
 
-    def test_is_cache_valid_miss(self):
-        """Test cache miss for non-existent video."""
-        resolver = StreamResolver()
-        assert not resolver._is_cache_valid("nonexistent")
-
-    def test_is_cache_valid_hit(self):
-        """Test cache hit for recently cached video."""
-        resolver = StreamResolver(cache_hours=5)
-        resolver._cache["vid123"] = CachedURL(
-            url="https://example.com/audio.m4a",
-            cached_at=datetime.now(),
-            video_id="vid123"
-        )
-
-        assert resolver._is_cache_valid("vid123")
-
-    def test_is_cache_valid_expired(self):
-        """Test cache miss for expired entry."""
-        resolver = StreamResolver(cache_hours=5)
-        # Cache entry from 6 hours ago (expired)
-        old_time = datetime.now() - timedelta(hours=6)
-        resolver._cache["vid123"] = CachedURL(
-            url="https://example.com/audio.m4a",
-            cached_at=old_time,
-            video_id="vid123"
-        )
-
-        assert not resolver._is_cache_valid("vid123")
-        # Verify expired entry was removed
-        assert "vid123" not in resolver._cache
-
     def test_clear_cache(self):
         """Test clearing the cache."""
         resolver = StreamResolver()
-        resolver._cache["vid1"] = CachedURL("url1", datetime.now(), "vid1")
-        resolver._cache["vid2"] = CachedURL("url2", datetime.now(), "vid2")
+        resolver._cache["vid1"] = make_entry("url1", "vid1")
+        resolver._cache["vid2"] = make_entry("url2", "vid2")
 
         assert len(resolver._cache) == 2
 
@@ -96,25 +87,152 @@ class TestStreamResolverCaching:
         resolver = StreamResolver(cache_hours=5)
 
         # Add fresh entry
-        resolver._cache["vid1"] = CachedURL(
-            url="url1",
-            cached_at=datetime.now(),
-            video_id="vid1"
-        )
+        resolver._cache["vid1"] = make_entry("url1", "vid1")
 
         # Add expired entry
-        old_time = datetime.now() - timedelta(hours=6)
-        resolver._cache["vid2"] = CachedURL(
-            url="url2",
-            cached_at=old_time,
-            video_id="vid2"
-        )
+        resolver._cache["vid2"] = make_entry("url2", "vid2", age_hours=6)
 
         stats = resolver.get_cache_stats()
 
         assert stats['cache_size'] == 2
         assert stats['valid_count'] == 1
         assert stats['expired_count'] == 1
+        # Stats are read-only; purging is explicit
+        assert "vid2" in resolver._cache
+
+    def test_cache_evicts_oldest_beyond_bound(self):
+        """Test the cache drops the oldest entries once max_cache_entries is hit."""
+        resolver = StreamResolver(max_cache_entries=2)
+        for video_id in ('vid1', 'vid2', 'vid3'):
+            resolver._store(make_entry(f'https://{video_id}', video_id))
+
+        assert list(resolver._cache) == ['vid2', 'vid3']
+
+    def test_purge_expired(self):
+        """Test purge_expired drops only expired entries."""
+        resolver = StreamResolver(cache_hours=5)
+        resolver._cache["fresh"] = make_entry("u1", "fresh")
+        resolver._cache["stale"] = make_entry("u2", "stale", age_hours=6)
+
+        assert resolver.purge_expired() == 1
+        assert list(resolver._cache) == ["fresh"]
+
+    def test_cache_scans_safe_during_concurrent_inserts(self):
+        """Test purge_expired and get_cache_stats don't race cache inserts."""
+        resolver = StreamResolver(cache_hours=5, max_cache_entries=100_000)
+        stop = threading.Event()
+
+        def insert() -> None:
+            i = 0
+            while not stop.is_set():
+                resolver._store(make_entry("u", f"vid{i}", age_hours=6 if i % 2 else 0))
+                i += 1
+
+        writer = threading.Thread(target=insert)
+        writer.start()
+        try:
+            for _ in range(200):
+                resolver.purge_expired()
+                resolver.get_cache_stats()
+        finally:
+            stop.set()
+            writer.join()
+
+        assert resolver.get_cache_stats()["cache_size"] == len(resolver._cache)
+
+
+class TestStreamResolverPersistence:
+    """Tests for the on-disk cache journal."""
+
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_resolve_appends_to_journal_and_reloads(self, mock_ydl_class, tmp_path):
+        """Test each resolution appends one line and a new resolver reloads it."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+        resolver.resolve_video_id('video_a')
+        resolver.resolve_video_id('video_b')
+        resolver.close()
+
+        journal = tmp_path / 'cache.jsonl'
+        assert len(journal.read_text().splitlines()) == 2
+
+        reloaded = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+        assert set(reloaded._cache) == {'video_a', 'video_b'}
+
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_batch_flushes_journal_once(self, mock_ydl_class, tmp_path):
+        """Test a batch hands all new entries to the writer in one flush."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+        with patch.object(resolver, '_append_batch') as mock_append:
+            resolver.resolve_batch(['vid1', 'vid2', 'vid3'])
+            resolver.close()
+
+        mock_append.assert_called_once()
+        assert {entry.video_id for entry in mock_append.call_args[0][0]} == {'vid1', 'vid2', 'vid3'}
+
+    def test_load_keeps_last_entry_and_skips_torn_lines(self, tmp_path):
+        """Test journal replay keeps the newest entry per video and ignores bad lines."""
+        now = time.time()
+        journal = tmp_path / 'cache.jsonl'
+        journal.write_text(
+            json.dumps({'video_id': 'v', 'url': 'https://old', 'cached_at': int(now)}) + '\n'
+            + json.dumps({'video_id': 'v', 'url': 'https://new', 'cached_at': int(now)}) + '\n'
+            + '{"video_id": "tor'
+        )
+
+        resolver = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+
+        assert resolver._cache['v'].url == 'https://new'
+        # 3 lines for 1 entry exceeds the 2x threshold
+        resolver._compact_cache()
+        assert len(journal.read_text().splitlines()) == 1
+        assert not (tmp_path / 'cache.jsonl.tmp').exists()
+
+    def test_compaction_failure_keeps_previous_journal(self, tmp_path):
+        """Test a failed compaction leaves the existing journal untouched."""
+        resolver = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+        resolver._append_batch([make_entry('https://a', 'v')])
+        journal = tmp_path / 'cache.jsonl'
+        before = journal.read_bytes()
+
+        with patch('ytmpd.stream_resolver.os.replace', side_effect=OSError('disk full')):
+            resolver._compact_cache(force=True)
+
+        assert journal.read_bytes() == before
+        assert not (tmp_path / 'cache.jsonl.tmp').exists()
+
+    def test_journal_roundtrip_without_orjson(self, tmp_path, monkeypatch):
+        """Test the stdlib json fallback writes journals that load back identically."""
+        monkeypatch.setattr('ytmpd.stream_resolver.orjson', None)
+        entry = make_entry('https://a', 'v')
+        resolver = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+        resolver._append_batch([entry])
+
+        reloaded = StreamResolver(cache_file=str(tmp_path / 'cache.json'))
+
+        assert reloaded._cache['v'].cached_at == int(entry.cached_at)
+        # Remaining lifetime carries over onto the monotonic clock
+        assert reloaded._cache['v'].expires_at == pytest.approx(entry.expires_at, abs=2)
+
+    def test_migrates_legacy_json_snapshot(self, tmp_path):
+        """Test a legacy JSON dict cache is loaded and rewritten as a journal."""
+        legacy = tmp_path / 'cache.json'
+        legacy.write_text(json.dumps({
+            'v': {'url': 'https://a', 'cached_at': datetime.now().isoformat(), 'video_id': 'v'}
+        }))
+
+        resolver = StreamResolver(cache_file=str(legacy))
+
+        assert resolver._cache['v'].url == 'https://a'
+        lines = (tmp_path / 'cache.jsonl').read_text().splitlines()
+        assert json.loads(lines[0])['video_id'] == 'v'
 
 
 class TestStreamResolverExtraction:
@@ -123,12 +241,12 @@ class TestStreamResolverExtraction:
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_extract_url_success(self, mock_ydl_class):
         """Test successful URL extraction."""
-        # Mock yt-dlp context manager
+        # Mock yt-dlp instance
         mock_ydl = MagicMock()
         mock_ydl.extract_info.return_value = {
             'url': 'https://example.com/audio.m4a'
         }
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('dQw4w9WgXcQ')
@@ -136,15 +254,30 @@ class TestStreamResolverExtraction:
         assert url == 'https://example.com/audio.m4a'
         mock_ydl.extract_info.assert_called_once_with(
             'https://youtube.com/watch?v=dQw4w9WgXcQ',
-            download=False
+            download=False,
+            ie_key='Youtube'
         )
 
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_extract_url_reuses_thread_instance(self, mock_ydl_class):
+        """Test the YoutubeDL instance is built once per thread and reused."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver()
+        resolver._extract_url('video_a')
+        resolver._extract_url('video_b')
+
+        mock_ydl_class.assert_called_once()
+        assert mock_ydl.extract_info.call_count == 2
+
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_extract_url_no_info(self, mock_ydl_class):
         """Test extraction when no info is returned."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.return_value = None
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('bad_video')
@@ -156,7 +289,7 @@ class TestStreamResolverExtraction:
         """Test extraction when info lacks URL field."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.return_value = {'title': 'Some Title'}
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('bad_video')
@@ -168,7 +301,7 @@ class TestStreamResolverExtraction:
         """Test extraction of private video."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError('This video is private')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('private_vid')
@@ -180,7 +313,7 @@ class TestStreamResolverExtraction:
         """Test extraction of unavailable video."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError('Video unavailable')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('unavailable_vid')
@@ -194,7 +327,7 @@ class TestStreamResolverExtraction:
         mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError(
             'Video blocked in your region'
         )
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('blocked_vid')
@@ -208,19 +341,38 @@ class TestStreamResolverExtraction:
         mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError(
             'This video has been removed'
         )
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('removed_vid')
 
         assert url is None
 
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_resolve_rate_limited_raises_without_retrying(self, mock_ydl_class):
+        """Test an HTTP 429 surfaces as RateLimitedError after a single attempt."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError(
+            'ERROR: Unable to download webpage: HTTP Error 429: Too Many Requests'
+        )
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver()
+        with pytest.raises(RateLimitedError) as exc_info:
+            resolver.resolve_video_id('limited_vid')
+
+        assert exc_info.value.retry_after is None
+        assert mock_ydl.extract_info.call_count == 1
+        # A later call isn't stuck behind the failed in-flight entry
+        with pytest.raises(RateLimitedError):
+            resolver.resolve_video_id('limited_vid')
+
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_extract_url_extractor_error(self, mock_ydl_class):
         """Test extraction with extractor error."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.side_effect = yt_dlp.utils.ExtractorError('Extractor failed')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('error_vid')
@@ -237,37 +389,43 @@ class TestStreamResolverExtraction:
             Exception('Network timeout'),
             {'url': 'https://example.com/audio.m4a'}
         ]
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('network_fail_vid')
 
         assert url == 'https://example.com/audio.m4a'
         assert mock_ydl.extract_info.call_count == 2
-        mock_sleep.assert_called_once_with(1)
+        # First backoff is 1s plus up to 50% jitter
+        mock_sleep.assert_called_once()
+        assert 1 <= mock_sleep.call_args[0][0] <= 1.5
 
     @patch('ytmpd.stream_resolver.time.sleep')
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_extract_url_network_error_retry_fails(self, mock_ydl_class, mock_sleep):
-        """Test extraction retries on network error and fails."""
+        """Test extraction retries on network error with backoff and fails."""
         mock_ydl = MagicMock()
-        # Both attempts fail
+        # All attempts fail
         mock_ydl.extract_info.side_effect = Exception('Network timeout')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('network_fail_vid')
 
         assert url is None
-        assert mock_ydl.extract_info.call_count == 2
-        mock_sleep.assert_called_once_with(1)
+        assert mock_ydl.extract_info.call_count == 4
+        # Geometric backoff (1s, 2s, 4s) with up to 50% jitter
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        for delay, base in zip(delays, (1, 2, 4)):
+            assert base <= delay <= base * 1.5
 
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_extract_url_unexpected_error(self, mock_ydl_class):
         """Test extraction with unexpected error."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.side_effect = RuntimeError('Unexpected error')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver._extract_url('error_vid')
@@ -285,7 +443,7 @@ class TestStreamResolverResolveVideoId:
         mock_ydl.extract_info.return_value = {
             'url': 'https://example.com/audio.m4a'
         }
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver.resolve_video_id('dQw4w9WgXcQ')
@@ -300,11 +458,7 @@ class TestStreamResolverResolveVideoId:
         """Test resolving video ID with cache hit."""
         resolver = StreamResolver()
         # Pre-populate cache
-        resolver._cache['cached_vid'] = CachedURL(
-            url='https://cached.com/audio.m4a',
-            cached_at=datetime.now(),
-            video_id='cached_vid'
-        )
+        resolver._cache['cached_vid'] = make_entry('https://cached.com/audio.m4a', 'cached_vid')
 
         url = resolver.resolve_video_id('cached_vid')
 
@@ -317,7 +471,7 @@ class TestStreamResolverResolveVideoId:
         """Test resolving video ID when extraction fails."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.side_effect = yt_dlp.utils.DownloadError('Video unavailable')
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         url = resolver.resolve_video_id('bad_vid')
@@ -333,16 +487,11 @@ class TestStreamResolverResolveVideoId:
         mock_ydl.extract_info.return_value = {
             'url': 'https://new.com/audio.m4a'
         }
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver(cache_hours=5)
         # Add expired entry
-        old_time = datetime.now() - timedelta(hours=6)
-        resolver._cache['expired_vid'] = CachedURL(
-            url='https://old.com/audio.m4a',
-            cached_at=old_time,
-            video_id='expired_vid'
-        )
+        resolver._cache['expired_vid'] = make_entry('https://old.com/audio.m4a', 'expired_vid', age_hours=6)
 
         url = resolver.resolve_video_id('expired_vid')
 
@@ -351,8 +500,32 @@ class TestStreamResolverResolveVideoId:
         # Should have new cached entry
         assert resolver._cache['expired_vid'].url == 'https://new.com/audio.m4a'
         # Cached_at should be recent
-        age = datetime.now() - resolver._cache['expired_vid'].cached_at
-        assert age.total_seconds() < 2  # Within last 2 seconds
+        age = time.time() - resolver._cache['expired_vid'].cached_at
+        assert age < 2  # Within last 2 seconds
+
+
+class TestStreamResolverPrefetch:
+    """Tests for prefetch() method."""
+
+    def test_prefetch_warms_cache(self):
+        """Test prefetched IDs end up cached and cached IDs are skipped."""
+        resolver = StreamResolver()
+        resolver._cache['cached_vid'] = make_entry('https://cached', 'cached_vid')
+
+        with patch.object(resolver, '_extract_url', return_value='https://new') as mock_extract:
+            scheduled = resolver.prefetch(['cached_vid', 'vid1', 'vid1'])
+            resolver._prefetch_executor.shutdown(wait=True)
+
+        assert scheduled == 1
+        mock_extract.assert_called_once_with('vid1')
+        assert resolver._cache['vid1'].url == 'https://new'
+
+    def test_prefetch_after_close_is_noop(self):
+        """Test prefetch does nothing once the resolver is closed."""
+        resolver = StreamResolver()
+        resolver.close()
+
+        assert resolver.prefetch(['vid1']) == 0
 
 
 class TestStreamResolverBatchResolution:
@@ -367,17 +540,30 @@ class TestStreamResolverBatchResolution:
         assert results == {}
         mock_ydl_class.assert_not_called()
 
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_resolve_batch_accepts_iterable(self, mock_ydl_class):
+        """Test batch resolution consumes generators, including empty ones."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver()
+        assert resolver.resolve_batch(v for v in []) == {}
+
+        results = resolver.resolve_batch(v for v in ['vid1', 'vid2', 'vid1'])
+        assert set(results) == {'vid1', 'vid2'}
+
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_resolve_batch_all_success(self, mock_ydl_class):
         """Test batch resolution where all videos succeed."""
         mock_ydl = MagicMock()
 
-        def mock_extract(url, download):
+        def mock_extract(url, download, ie_key=None):
             video_id = url.split('=')[1]
             return {'url': f'https://example.com/{video_id}.m4a'}
 
         mock_ydl.extract_info.side_effect = mock_extract
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         video_ids = ['vid1', 'vid2', 'vid3']
@@ -393,14 +579,14 @@ class TestStreamResolverBatchResolution:
         """Test batch resolution where some videos fail."""
         mock_ydl = MagicMock()
 
-        def mock_extract(url, download):
+        def mock_extract(url, download, ie_key=None):
             video_id = url.split('=')[1]
             if video_id == 'bad_vid':
                 raise yt_dlp.utils.DownloadError('Video unavailable')
             return {'url': f'https://example.com/{video_id}.m4a'}
 
         mock_ydl.extract_info.side_effect = mock_extract
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         video_ids = ['vid1', 'bad_vid', 'vid3']
@@ -416,15 +602,11 @@ class TestStreamResolverBatchResolution:
         """Test batch resolution uses cached entries."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.return_value = {'url': 'https://new.com/audio.m4a'}
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         # Pre-populate cache for one video
-        resolver._cache['cached_vid'] = CachedURL(
-            url='https://cached.com/audio.m4a',
-            cached_at=datetime.now(),
-            video_id='cached_vid'
-        )
+        resolver._cache['cached_vid'] = make_entry('https://cached.com/audio.m4a', 'cached_vid')
 
         video_ids = ['cached_vid', 'new_vid']
         results = resolver.resolve_batch(video_ids)
@@ -440,14 +622,14 @@ class TestStreamResolverBatchResolution:
         """Test batch resolution handles exceptions gracefully."""
         mock_ydl = MagicMock()
 
-        def mock_extract(url, download):
+        def mock_extract(url, download, ie_key=None):
             video_id = url.split('=')[1]
             if video_id == 'exception_vid':
                 raise RuntimeError('Unexpected error')
             return {'url': f'https://example.com/{video_id}.m4a'}
 
         mock_ydl.extract_info.side_effect = mock_extract
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         video_ids = ['vid1', 'exception_vid', 'vid3']
@@ -459,12 +641,109 @@ class TestStreamResolverBatchResolution:
         assert 'exception_vid' not in results
         assert 'vid3' in results
 
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_resolve_batch_deduplicates(self, mock_ydl_class):
+        """Test duplicate IDs in a batch are extracted once."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver()
+        results = resolver.resolve_batch(['vid1', 'vid1', 'vid2', 'vid1'])
+
+        assert set(results) == {'vid1', 'vid2'}
+        assert mock_ydl.extract_info.call_count == 2
+
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_resolve_batch_process_pool(self, mock_ydl_class):
+        """Test large batches go through the process pool and are cached in the parent."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = lambda url, download, ie_key=None: {
+            'url': f"https://example.com/{url.split('=')[1]}.m4a"
+        }
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver(use_processes=True)
+        resolver._cache['cached'] = make_entry('https://cached', 'cached')
+        video_ids = ['cached'] + [f'vid{i}' for i in range(PROCESS_POOL_MIN_BATCH)]
+
+        # Same-process stand-in so the yt-dlp mock applies to the workers
+        with patch(
+            'ytmpd.stream_resolver.ProcessPoolExecutor',
+            side_effect=lambda max_workers, initializer: ThreadPoolExecutor(
+                max_workers, initializer=initializer
+            ),
+        ) as mock_pool:
+            results = resolver.resolve_batch(video_ids)
+
+        mock_pool.assert_called_once()
+        assert results['cached'] == 'https://cached'
+        assert results['vid0'] == 'https://example.com/vid0.m4a'
+        assert len(results) == len(video_ids)
+        assert resolver._cache['vid0'].url == 'https://example.com/vid0.m4a'
+
+    @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
+    def test_iter_resolve_batch_chunks(self, mock_ydl_class):
+        """Test iter_resolve_batch yields every ID, one worker pool per chunk."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = lambda url, download, ie_key=None: (
+            None if url.endswith('bad') else {'url': f"https://example.com/{url.split('=')[1]}.m4a"}
+        )
+        mock_ydl_class.return_value = mock_ydl
+
+        resolver = StreamResolver()
+        with patch('ytmpd.stream_resolver.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_pool:
+            results = dict(resolver.iter_resolve_batch(['v1', 'v2', 'v3', 'bad', 'v5'], chunk_size=2))
+
+        assert mock_pool.call_count == 3
+        assert results == {
+            'v1': 'https://example.com/v1.m4a',
+            'v2': 'https://example.com/v2.m4a',
+            'v3': 'https://example.com/v3.m4a',
+            'bad': None,
+            'v5': 'https://example.com/v5.m4a',
+        }
+
+    def test_iter_resolve_batch_rejects_bad_chunk_size(self):
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            list(StreamResolver().iter_resolve_batch(['v1'], chunk_size=0))
+
+    def test_concurrent_resolves_share_extraction(self):
+        """Test a second caller waits for the in-flight extraction of the same video."""
+        resolver = StreamResolver()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_extract(video_id):
+            calls.append(video_id)
+            started.set()
+            release.wait(5)
+            return 'https://example.com/audio.m4a'
+
+        with patch.object(resolver, '_extract_url', side_effect=slow_extract):
+            first = {}
+            t = threading.Thread(target=lambda: first.update(url=resolver.resolve_video_id('vid')))
+            t.start()
+            assert started.wait(5)
+
+            second = {}
+            t2 = threading.Thread(target=lambda: second.update(url=resolver.resolve_video_id('vid')))
+            t2.start()
+            release.set()
+            t.join(5)
+            t2.join(5)
+
+        assert calls == ['vid']
+        assert first['url'] == second['url'] == 'https://example.com/audio.m4a'
+
     @patch('ytmpd.stream_resolver.yt_dlp.YoutubeDL')
     def test_resolve_batch_parallel_processing(self, mock_ydl_class):
         """Test batch resolution processes videos in parallel."""
         mock_ydl = MagicMock()
         mock_ydl.extract_info.return_value = {'url': 'https://example.com/audio.m4a'}
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl_class.return_value = mock_ydl
 
         resolver = StreamResolver()
         # Test with 15 videos to verify parallel processing (should use max 10 workers)
@@ -473,3 +752,20 @@ class TestStreamResolverBatchResolution:
 
         assert len(results) == 15
         assert mock_ydl.extract_info.call_count == 15
+
+    def test_resolve_batch_cancels_queued_on_stop(self):
+        """Test batch resolution drops queued videos once should_stop() is set."""
+        resolver = StreamResolver(should_stop_callback=lambda: True)
+        calls = []
+
+        def slow_resolve(video_id):
+            calls.append(video_id)
+            time.sleep(0.05)
+            return f'https://example.com/{video_id}.m4a'
+
+        with patch.object(resolver, 'resolve_video_id', side_effect=slow_resolve):
+            results = resolver.resolve_batch([f'vid{i}' for i in range(50)])
+
+        # Only the videos already running when the stop was seen get resolved
+        assert len(calls) < 50
+        assert len(results) <= len(calls)
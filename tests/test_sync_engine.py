@@ -2,7 +2,8 @@
 Tests for the sync engine module.
 """
 
-from unittest.mock import Mock
+import threading
+from unittest.mock import Mock, patch
 
 from ytmpd.exceptions import (
     MPDConnectionError,
@@ -11,7 +12,8 @@ from ytmpd.exceptions import (
 )
 from ytmpd.mpd_client import TrackWithMetadata
 from ytmpd.sync_engine import SyncEngine, SyncPreview, SyncResult
-from ytmpd.ytmusic import Playlist, Track
+from ytmpd.track_store import TrackStore
+from ytmpd.ytmusic import Playlist, Track, YTMusicClient
 
 
 class TestSyncEngineInit:
@@ -64,31 +66,25 @@ class TestSyncAllPlaylists:
             Playlist(id="PL1", name="Favorites", track_count=3),
             Playlist(id="PL2", name="Workout", track_count=2),
         ]
-        ytmusic.get_playlist_tracks.side_effect = [
-            [
+        # Playlists sync in parallel, so fakes are keyed by input, not call order
+        tracks_by_playlist = {
+            "PL1": [
                 Track(video_id="vid1", title="Song 1", artist="Artist 1"),
                 Track(video_id="vid2", title="Song 2", artist="Artist 2"),
                 Track(video_id="vid3", title="Song 3", artist="Artist 3"),
             ],
-            [
+            "PL2": [
                 Track(video_id="vid4", title="Song 4", artist="Artist 4"),
                 Track(video_id="vid5", title="Song 5", artist="Artist 5"),
             ],
-        ]
+        }
+        ytmusic.get_playlist_tracks.side_effect = tracks_by_playlist.__getitem__
 
         mpd = Mock()
         resolver = Mock()
-        resolver.resolve_batch.side_effect = [
-            {
-                "vid1": "http://example.com/1.m4a",
-                "vid2": "http://example.com/2.m4a",
-                "vid3": "http://example.com/3.m4a",
-            },
-            {
-                "vid4": "http://example.com/4.m4a",
-                "vid5": "http://example.com/5.m4a",
-            },
-        ]
+        resolver.resolve_batch.side_effect = lambda video_ids: {
+            video_id: f"http://example.com/{video_id[3:]}.m4a" for video_id in video_ids
+        }
 
         engine = SyncEngine(ytmusic, mpd, resolver, playlist_prefix="YT: ", sync_liked_songs=False)
         result = engine.sync_all_playlists()
@@ -157,6 +153,237 @@ class TestSyncAllPlaylists:
             is_liked_playlist=False,
         )
 
+    def test_sync_all_playlists_runs_in_parallel(self):
+        """Test playlists are synced concurrently up to sync_workers."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=1),
+            Playlist(id="PL2", name="Workout", track_count=1),
+        ]
+        ytmusic.get_playlist_tracks.side_effect = lambda playlist_id: [
+            Track(video_id=f"vid_{playlist_id}", title="Song", artist="Artist")
+        ]
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+        # Both playlists must be mid-sync at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        track_store = Mock()
+        track_store.add_tracks.side_effect = lambda rows: barrier.wait()
+
+        engine = SyncEngine(
+            ytmusic,
+            mpd,
+            resolver,
+            track_store=track_store,
+            sync_liked_songs=False,
+            sync_workers=2,
+        )
+        result = engine.sync_all_playlists()
+
+        assert result.success is True
+        assert result.playlists_synced == 2
+        assert mpd.create_or_replace_playlist.call_count == 2
+
+    def test_sync_all_playlists_resolves_shared_ids_once(self):
+        """Test videos shared across playlists are resolved in a single batch."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=2),
+        ]
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+            Track(video_id="vid2", title="Song 2", artist="Artist 2"),
+        ]
+        ytmusic.get_liked_songs.return_value = [
+            Track(video_id="vid2", title="Song 2", artist="Artist 2"),
+            Track(video_id="vid3", title="Song 3", artist="Artist 3"),
+        ]
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+
+        engine = SyncEngine(ytmusic, mpd, resolver)
+        result = engine.sync_all_playlists()
+
+        assert result.success is True
+        assert result.tracks_added == 4
+        resolver.resolve_batch.assert_called_once_with(["vid1", "vid2", "vid3"])
+
+    def test_sync_all_playlists_skips_unchanged_playlists(self):
+        """Test a playlist identical to its last sync isn't rewritten."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=1),
+        ]
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+        ]
+        mpd = Mock()
+        mpd.list_playlists_fs.return_value = ["YT: Favorites"]
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+        track_store = TrackStore(":memory:")
+
+        engine = SyncEngine(
+            ytmusic, mpd, resolver, track_store=track_store, sync_liked_songs=False
+        )
+        first = engine.sync_all_playlists()
+        second = engine.sync_all_playlists()
+
+        assert first.tracks_added == second.tracks_added == 1
+        assert mpd.create_or_replace_playlist.call_count == 1
+
+        # Changed metadata is written again
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1 (Remastered)", artist="Artist 1"),
+        ]
+        engine.sync_all_playlists()
+        assert mpd.create_or_replace_playlist.call_count == 2
+
+        # So is a playlist deleted outside ytmpd
+        mpd.list_playlists_fs.return_value = []
+        engine.sync_all_playlists()
+        assert mpd.create_or_replace_playlist.call_count == 3
+        track_store.close()
+
+    def test_repeated_syncs_keep_store_connections_bounded(self, tmp_path):
+        """Test worker threads' database connections are closed after each sync."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id=f"PL{i}", name=f"List {i}", track_count=1) for i in range(4)
+        ]
+        ytmusic.get_playlist_tracks.side_effect = lambda playlist_id: [
+            Track(video_id=f"vid_{playlist_id}", title="Song", artist="Artist")
+        ]
+        mpd = Mock()
+        mpd.list_playlists_fs.return_value = []
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+        track_store = TrackStore(str(tmp_path / "tracks.db"))
+
+        engine = SyncEngine(
+            ytmusic, mpd, resolver, track_store=track_store, sync_liked_songs=False, sync_workers=4
+        )
+        for _ in range(5):
+            assert engine.sync_all_playlists().success is True
+
+        # Only the main thread's connection outlives the sync workers
+        assert len(track_store._connections) == 1
+        track_store.close()
+
+    def test_sync_keeps_persisted_song_info(self, tmp_path):
+        """Test the post-sync cache invalidation only drops playlist listings."""
+        auth_file = tmp_path / "browser.json"
+        auth_file.write_text("{}")
+        api = Mock()
+        api.get_library_playlists.return_value = [
+            {"playlistId": "PL1", "title": "Favorites", "count": 1}
+        ]
+        api.get_playlist.return_value = {
+            "tracks": [{"videoId": "vid1", "title": "Song", "artists": [{"name": "Artist"}]}]
+        }
+        api.get_song.return_value = {"videoDetails": {"title": "Song", "author": "Artist"}}
+        with patch("ytmpd.ytmusic.YTMusic", return_value=api):
+            ytmusic = YTMusicClient(auth_file=auth_file, cache_db=tmp_path / "cache.db")
+        ytmusic._client = api
+        ytmusic._min_request_interval = 0.0
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+
+        ytmusic.get_song_info("vid1")
+        engine = SyncEngine(ytmusic, Mock(), resolver, sync_liked_songs=False)
+        assert engine.sync_all_playlists().success is True
+        engine.sync_all_playlists()
+
+        # Playlist tracks are refetched after each sync, song details are not
+        assert api.get_playlist.call_count == 2
+        ytmusic.clear_cache()
+        ytmusic.get_song_info("vid1")
+        api.get_song.assert_called_once_with("vid1")
+        ytmusic.close()
+
+    def test_sync_all_playlists_prefetches_tracks(self):
+        """Test tracks are fetched once per playlist up front, liked songs included."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=1),
+        ]
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+        ]
+        ytmusic.get_liked_songs.return_value = [
+            Track(video_id="vid2", title="Song 2", artist="Artist 2"),
+        ]
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+
+        engine = SyncEngine(ytmusic, mpd, resolver)
+        result = engine.sync_all_playlists()
+
+        assert result.playlists_synced == 2
+        ytmusic.get_playlist_tracks.assert_called_once_with("PL1")
+        # Liked songs fetched for discovery are reused for the sync itself
+        ytmusic.get_liked_songs.assert_called_once()
+
+    def test_failed_prefetch_fails_only_its_playlist(self):
+        """Test a track fetch error is kept for its playlist and the rest still sync."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=1),
+            Playlist(id="PL2", name="Broken", track_count=1),
+        ]
+
+        def get_playlist_tracks(playlist_id):
+            if playlist_id == "PL2":
+                raise YTMusicAPIError("fetch failed")
+            return [Track(video_id="vid1", title="Song 1", artist="Artist 1")]
+
+        ytmusic.get_playlist_tracks.side_effect = get_playlist_tracks
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+
+        engine = SyncEngine(ytmusic, mpd, resolver, sync_liked_songs=False)
+        prefetched = engine._prefetch_all_tracks(ytmusic.get_user_playlists())
+        assert isinstance(prefetched["PL2"], YTMusicAPIError)
+        assert [track.video_id for track in prefetched["PL1"]] == ["vid1"]
+
+        result = engine.sync_all_playlists()
+
+        assert result.playlists_synced == 1
+        assert result.playlists_failed == 1
+
+    def test_sync_all_playlists_stop_cancels_queued(self):
+        """Test a stop request drops playlists that have not started yet."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id=f"PL{i}", name=f"List {i}", track_count=1) for i in range(5)
+        ]
+        ytmusic.get_playlist_tracks.side_effect = lambda playlist_id: [
+            Track(video_id=f"vid_{playlist_id}", title="Song", artist="Artist")
+        ]
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.side_effect = lambda video_ids: {v: "http://x" for v in video_ids}
+
+        stop = threading.Event()
+        mpd.create_or_replace_playlist.side_effect = lambda *args, **kwargs: stop.set()
+
+        engine = SyncEngine(
+            ytmusic,
+            mpd,
+            resolver,
+            sync_liked_songs=False,
+            should_stop_callback=stop.is_set,
+            sync_workers=1,
+        )
+        result = engine.sync_all_playlists()
+
+        assert result.playlists_synced < 5
+        assert mpd.create_or_replace_playlist.call_count == result.playlists_synced
+
     def test_sync_all_playlists_empty(self):
         """Test sync when no playlists exist."""
         ytmusic = Mock()
@@ -271,13 +498,15 @@ class TestSyncAllPlaylists:
         ]
 
         # First playlist will fail when fetching tracks
-        ytmusic.get_playlist_tracks.side_effect = [
-            YTMusicAPIError("Failed to fetch tracks"),
-            [
+        def get_playlist_tracks(playlist_id):
+            if playlist_id == "PL1":
+                raise YTMusicAPIError("Failed to fetch tracks")
+            return [
                 Track(video_id="vid3", title="Song 3", artist="Artist 3"),
                 Track(video_id="vid4", title="Song 4", artist="Artist 4"),
-            ],
-        ]
+            ]
+
+        ytmusic.get_playlist_tracks.side_effect = get_playlist_tracks
 
         mpd = Mock()
         resolver = Mock()
@@ -519,6 +748,29 @@ class TestSyncSinglePlaylist:
         assert result.tracks_added == 2
         assert result.tracks_failed == 1
 
+    def test_sync_single_playlist_counts_repeated_tracks(self):
+        """Test a video appearing twice in a playlist is counted per track."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=3),
+        ]
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+            Track(video_id="vid2", title="Song 2", artist="Artist 2"),
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+        ]
+        mpd = Mock()
+        resolver = Mock()
+        resolver.resolve_batch.return_value = {"vid1": "http://example.com/1.m4a"}
+
+        engine = SyncEngine(ytmusic, mpd, resolver, sync_liked_songs=False)
+        result = engine.sync_single_playlist("Favorites")
+
+        assert result.tracks_added == 2
+        assert result.tracks_failed == 1
+        written = mpd.create_or_replace_playlist.call_args[0][1]
+        assert [t.video_id for t in written] == ["vid1", "vid1"]
+
 
 class TestGetSyncPreview:
     """Tests for get_sync_preview method."""
@@ -620,6 +872,66 @@ class TestGetSyncPreview:
         assert "YT: OldPrefix" not in preview.existing_mpd_playlists
 
 
+class TestPlaylistListingCache:
+    """Tests for the short-lived playlist/liked-songs listing cache."""
+
+    def test_preview_then_sync_reuses_listing(self):
+        """Test a sync right after a preview doesn't refetch the playlist list."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Favorites", track_count=1),
+        ]
+        ytmusic.get_playlist_tracks.return_value = [
+            Track(video_id="vid1", title="Song 1", artist="Artist 1"),
+        ]
+        mpd = Mock()
+        mpd.list_playlists.return_value = []
+        resolver = Mock()
+        resolver.resolve_batch.return_value = {"vid1": "http://example.com/1.m4a"}
+
+        engine = SyncEngine(ytmusic, mpd, resolver, sync_liked_songs=False)
+        engine.get_sync_preview()
+        result = engine.sync_all_playlists()
+
+        assert result.success is True
+        ytmusic.get_user_playlists.assert_called_once()
+
+        # A successful sync invalidates the cache
+        engine.get_sync_preview()
+        assert ytmusic.get_user_playlists.call_count == 2
+
+    def test_lookup_by_name_uses_cached_listing(self):
+        """Test name lookups share one listing and pick the first duplicate."""
+        ytmusic = Mock()
+        ytmusic.get_user_playlists.return_value = [
+            Playlist(id="PL1", name="Mix", track_count=1),
+            Playlist(id="PL2", name="Mix", track_count=1),
+            Playlist(id="PL3", name="Chill", track_count=1),
+        ]
+        engine = SyncEngine(ytmusic, Mock(), Mock())
+
+        assert engine._get_playlist_by_name("Mix").id == "PL1"
+        assert engine._get_playlist_by_name("Chill").id == "PL3"
+        assert engine._get_playlist_by_name("Missing") is None
+        ytmusic.get_user_playlists.assert_called_once()
+
+    def test_cache_expires(self, monkeypatch):
+        """Test listings are refetched once the TTL has passed."""
+        ytmusic = Mock()
+        ytmusic.get_liked_songs.return_value = []
+        engine = SyncEngine(ytmusic, Mock(), Mock())
+
+        now = [1000.0]
+        monkeypatch.setattr("ytmpd.sync_engine.time.monotonic", lambda: now[0])
+        engine._get_liked_songs_cached()
+        engine._get_liked_songs_cached()
+        assert ytmusic.get_liked_songs.call_count == 1
+
+        now[0] += 61
+        engine._get_liked_songs_cached()
+        assert ytmusic.get_liked_songs.call_count == 2
+
+
 class TestSyncDataStructures:
     """Tests for SyncResult and SyncPreview dataclasses."""
 
@@ -747,14 +1059,14 @@ class TestSyncEngineIntegration:
             ),  # This should already be filtered by get_user_playlists
             Playlist(id="PL2", name="Workout", track_count=2),
         ]
-        # First call returns empty list (edge case if filtering failed)
-        ytmusic.get_playlist_tracks.side_effect = [
-            [],
-            [
+        # First playlist returns empty list (edge case if filtering failed)
+        ytmusic.get_playlist_tracks.side_effect = {
+            "PL1": [],
+            "PL2": [
                 Track(video_id="vid1", title="Song 1", artist="Artist 1"),
                 Track(video_id="vid2", title="Song 2", artist="Artist 2"),
             ],
-        ]
+        }.__getitem__
 
         mpd = Mock()
         resolver = Mock()
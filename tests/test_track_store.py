@@ -1,7 +1,10 @@
 """Unit tests for TrackStore."""
 
+import sqlite3
+import threading
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -172,6 +175,61 @@ def test_update_stream_url_nonexistent(memory_store: TrackStore) -> None:
     assert track is None
 
 
+def test_update_stream_urls_batch(memory_store: TrackStore) -> None:
+    """Test updating several stream URLs in one call."""
+    memory_store.add_track("batch1", None, "Track 1", "Artist")
+    memory_store.add_track("batch2", "https://old-url.com/2", "Track 2", "Artist")
+
+    memory_store.update_stream_urls([
+        ("batch1", "https://new-url.com/1"),
+        ("batch2", "https://new-url.com/2"),
+        ("missing", "https://new-url.com/3"),
+    ])
+
+    assert memory_store.get_track("batch1")["stream_url"] == "https://new-url.com/1"
+    assert memory_store.get_track("batch2")["stream_url"] == "https://new-url.com/2"
+    assert memory_store.get_track("missing") is None
+
+    # Empty batch is a no-op
+    memory_store.update_stream_urls([])
+
+
+def test_add_tracks_batch(memory_store: TrackStore) -> None:
+    """Test upserting several tracks in one call."""
+    memory_store.add_track("keep_url", "https://old-url.com/1", "Old Title", "Artist")
+
+    memory_store.add_tracks([
+        ("keep_url", None, "New Title", "Artist"),
+        ("fresh", "https://url.com/2", "Track 2", None),
+    ])
+
+    kept = memory_store.get_track("keep_url")
+    # NULL stream_url keeps the stored URL but updates metadata, as add_track does
+    assert kept["stream_url"] == "https://old-url.com/1"
+    assert kept["title"] == "New Title"
+    fresh = memory_store.get_track("fresh")
+    assert fresh["stream_url"] == "https://url.com/2"
+    assert fresh["artist"] is None
+
+    # Empty batch is a no-op
+    memory_store.add_tracks([])
+
+
+def test_file_database_uses_wal(tmp_path: Path) -> None:
+    """Test on-disk stores run in WAL journal mode."""
+    with TrackStore(str(tmp_path / "wal.db")) as store:
+        mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_connection_tuning_pragmas(tmp_path: Path) -> None:
+    """Test tuning PRAGMAs are applied when the store is opened."""
+    with TrackStore(str(tmp_path / "tuned.db")) as store:
+        assert store.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert store.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert store.conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+
+
 def test_database_persistence(tmp_path: Path) -> None:
     """Test that data persists after closing and reopening the database."""
     db_path = tmp_path / "persistent.db"
@@ -250,3 +308,79 @@ def test_track_updated_at_timestamp(memory_store: TrackStore) -> None:
     track = memory_store.get_track("time123")
     assert track is not None
     assert before <= track["updated_at"] <= after
+
+
+def test_get_track_min(memory_store: TrackStore) -> None:
+    """Test the narrow lookup returns only stream_url and updated_at."""
+    memory_store.add_track("min123", "https://stream-url.com", "Title", "Artist")
+
+    row = memory_store.get_track_min("min123")
+    assert row is not None
+    stream_url, updated_at = row
+    assert stream_url == "https://stream-url.com"
+    assert updated_at == memory_store.get_track("min123")["updated_at"]
+
+    assert memory_store.get_track_min("nonexistent") is None
+
+
+def test_file_database_uses_connection_per_thread(tmp_path: Path) -> None:
+    """Test each thread gets its own connection and sees other threads' writes."""
+    store = TrackStore(str(tmp_path / "threads.db"))
+    store.add_track("vid1", "https://example.com/1", "Song 1", "Artist 1")
+
+    seen: dict[str, Any] = {}
+
+    def reader() -> None:
+        seen["conn"] = store.conn
+        seen["track"] = store.get_track("vid1")
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    thread.join()
+
+    assert seen["conn"] is not store.conn
+    assert seen["track"]["stream_url"] == "https://example.com/1"
+
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen["conn"].execute("SELECT 1")
+
+
+def test_get_track_served_from_cache_until_written(memory_store: TrackStore) -> None:
+    """Test repeat lookups skip SQLite and writes invalidate the cached row."""
+    memory_store.add_track("vid1", "https://example.com/old", "Song", "Artist")
+    assert memory_store.get_track("vid1")["stream_url"] == "https://example.com/old"
+
+    # Bypass the store: a cached row is still served
+    memory_store.conn.execute("UPDATE tracks SET title = 'Changed' WHERE video_id = 'vid1'")
+    assert memory_store.get_track("vid1")["title"] == "Song"
+    assert memory_store.get_track_min("vid1")[0] == "https://example.com/old"
+
+    # Writes through the store drop the cached row
+    memory_store.update_stream_url("vid1", "https://example.com/new")
+    track = memory_store.get_track("vid1")
+    assert track["stream_url"] == "https://example.com/new"
+    assert track["title"] == "Changed"
+
+
+def test_get_track_cache_expires(memory_store: TrackStore, monkeypatch) -> None:
+    """Test cached rows are re-read once the TTL passes."""
+    memory_store.add_track("vid1", "https://example.com/1", "Song", "Artist")
+    now = [1000.0]
+    monkeypatch.setattr("ytmpd.track_store.time.monotonic", lambda: now[0])
+    memory_store.get_track("vid1")
+
+    memory_store.conn.execute("UPDATE tracks SET title = 'Changed' WHERE video_id = 'vid1'")
+    now[0] += 31
+    assert memory_store.get_track("vid1")["title"] == "Changed"
+
+
+def test_playlist_hash_roundtrip(memory_store: TrackStore) -> None:
+    """Test playlist content hashes are stored and replaced per playlist."""
+    assert memory_store.get_playlist_hash("PL1") is None
+
+    memory_store.set_playlist_hash("PL1", "Favorites", "abc")
+    memory_store.set_playlist_hash("PL1", "Favorites", "def")
+
+    assert memory_store.get_playlist_hash("PL1") == "def"
+    assert memory_store.get_playlist_hash("PL2") is None
@@ -1,14 +1,16 @@
 """Unit tests for ytmpd.ytmusic module."""
 
 import json
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from ytmusicapi.exceptions import YTMusicServerError
 
 from ytmpd.exceptions import YTMusicAPIError, YTMusicAuthError, YTMusicNotFoundError
-from ytmpd.ytmusic import Playlist, Track, YTMusicClient
+from ytmpd.ytmusic import Playlist, Track, YTMusicClient, _truncate_error
 
 
 class TestYTMusicClient:
@@ -44,12 +46,49 @@ class TestYTMusicClient:
     def test_init_creates_client_with_valid_oauth_file(
         self, mock_oauth_file: Path, mock_ytmusic: Mock
     ) -> None:
-        """Test that client initializes successfully with valid OAuth file."""
+        """Test that the YTMusic client is built once, on first use."""
         with patch("ytmpd.ytmusic.YTMusic", return_value=mock_ytmusic) as mock_ytmusic_cls:
             client = YTMusicClient(auth_file=mock_oauth_file)
+            mock_ytmusic_cls.assert_not_called()
 
-            assert client._client is not None
-            mock_ytmusic_cls.assert_called_once_with(str(mock_oauth_file))
+            assert client._client is mock_ytmusic
+            assert client._client is mock_ytmusic
+            mock_ytmusic_cls.assert_called_once_with(
+                str(mock_oauth_file), requests_session=client._session
+            )
+
+    def test_lazy_init_failure_reported_by_is_authenticated(
+        self, mock_oauth_file: Path
+    ) -> None:
+        """Test that a failed deferred initialization is reported, then not retried."""
+        with patch("ytmpd.ytmusic.YTMusic", side_effect=Exception("bad headers")) as mock_cls:
+            client = YTMusicClient(auth_file=mock_oauth_file)
+
+            valid, error = client.is_authenticated()
+            assert valid is False
+            assert "bad headers" in error
+
+            with pytest.raises(YTMusicAuthError, match="not initialized"):
+                client.search("test query")
+        assert mock_cls.call_count == 1
+
+    def test_session_reused_across_auth_refresh(
+        self, mock_oauth_file: Path, mock_ytmusic: Mock
+    ) -> None:
+        """Test the pooled HTTP session survives refresh_auth and close() releases it."""
+        with patch("ytmpd.ytmusic.YTMusic", return_value=mock_ytmusic) as mock_ytmusic_cls:
+            client = YTMusicClient(auth_file=mock_oauth_file)
+            session = client._session
+            assert client.refresh_auth() is True
+
+        sessions = {c.kwargs["requests_session"] for c in mock_ytmusic_cls.call_args_list}
+        assert sessions == {session}
+        adapter = session.get_adapter("https://music.youtube.com")
+        assert adapter._pool_maxsize == 32
+
+        with patch.object(session, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
 
     def test_init_raises_error_if_oauth_file_missing(self, tmp_path: Path) -> None:
         """Test that client raises error if OAuth file doesn't exist."""
@@ -115,6 +154,46 @@ class TestYTMusicClient:
             "duration": 260,  # 4:20 = 260 seconds
         }
 
+    def test_search_results_are_cached(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test repeated searches are served from cache until cleared."""
+        mock_ytmusic.search.return_value = [
+            {"videoId": "abc123", "title": "Test Song", "artists": [], "duration": "3:45"},
+        ]
+        client._client = mock_ytmusic
+
+        first = client.search("test query")
+        first[0]["title"] = "Mutated"
+        second = client.search("test query")
+
+        assert second[0]["title"] == "Test Song"
+        assert mock_ytmusic.search.call_count == 1
+        assert client.get_cache_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+        assert client.clear_cache_for_query("test query") == 1
+        client.search("test query")
+        assert mock_ytmusic.search.call_count == 2
+
+    def test_song_info_does_not_evict_other_cached_results(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test caching many song details leaves cached searches in place."""
+        from ytmpd.ytmusic import RESULT_CACHE_SIZE
+
+        mock_ytmusic.search.return_value = [
+            {"videoId": "abc123", "title": "Test Song", "artists": [], "duration": "3:45"},
+        ]
+        client._client = mock_ytmusic
+        client.search("test query")
+
+        for i in range(RESULT_CACHE_SIZE * 2):
+            client._cache_put(("song_info", f"video{i:06d}"), {"title": str(i)}, 60.0)
+
+        assert client._cache_get(("song_info", "video000000")) == {"title": "0"}
+        client.search("test query")
+        assert mock_ytmusic.search.call_count == 1
+
     def test_search_raises_not_found_for_empty_results(
         self, client: YTMusicClient, mock_ytmusic: Mock
     ) -> None:
@@ -145,6 +224,21 @@ class TestYTMusicClient:
 
         assert results[0]["artist"] == "Unknown Artist"
 
+    def test_search_skips_malformed_results(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test that malformed search results are dropped and the rest returned."""
+        mock_ytmusic.search.return_value = [
+            {"videoId": "bad", "title": "Broken", "artists": [{}], "duration": "3:45"},
+            None,
+            {"videoId": "abc123", "title": "Test Song", "artists": [], "duration": "1:00"},
+        ]
+        client._client = mock_ytmusic
+
+        results = client.search("test query")
+
+        assert [song["video_id"] for song in results] == ["abc123"]
+
     def test_search_retries_on_transient_failure(
         self, client: YTMusicClient, mock_ytmusic: Mock
     ) -> None:
@@ -185,6 +279,22 @@ class TestYTMusicClient:
         assert "API call failed" in str(exc_info.value)
         assert mock_ytmusic.search.call_count == 3  # Default max_retries
 
+    def test_retry_classifies_auth_errors_by_http_status(self, client: YTMusicClient) -> None:
+        """Test that a 401 stops retrying while other statuses retry even if they mention auth."""
+        unauthorized = Mock(side_effect=YTMusicServerError("Server returned HTTP 401: Unauthorized."))
+        with pytest.raises(YTMusicAuthError):
+            client._retry_on_failure(unauthorized)
+        assert unauthorized.call_count == 1
+
+        unavailable = Mock(
+            side_effect=YTMusicServerError(
+                "Server returned HTTP 503: Service Unavailable.\nauthority unavailable"
+            )
+        )
+        with patch("time.sleep"), pytest.raises(YTMusicAPIError):
+            client._retry_on_failure(unavailable)
+        assert unavailable.call_count == 3
+
     def test_get_song_info_returns_formatted_info(
         self, client: YTMusicClient, mock_ytmusic: Mock
     ) -> None:
@@ -249,6 +359,36 @@ class TestYTMusicClient:
 
         assert song_info["thumbnail_url"] == ""
 
+    def test_get_song_info_persists_across_clients(
+        self, tmp_path: Path, mock_oauth_file: Path, mock_ytmusic: Mock
+    ) -> None:
+        """Test that song info cached on disk is reused by a new client without the API."""
+        cache_db = tmp_path / "ytmusic_cache.db"
+        mock_ytmusic.get_song.return_value = {
+            "videoDetails": {"title": "Test Song", "author": "Test Artist", "lengthSeconds": "225"}
+        }
+
+        with patch("ytmpd.ytmusic.YTMusic", return_value=mock_ytmusic):
+            first = YTMusicClient(auth_file=mock_oauth_file, cache_db=cache_db)
+            second = YTMusicClient(auth_file=mock_oauth_file, cache_db=cache_db)
+        first._client = second._client = mock_ytmusic
+        first.get_song_info("abc123")
+        first.close()
+
+        assert second.get_song_info("abc123")["title"] == "Test Song"
+        mock_ytmusic.get_song.assert_called_once_with("abc123")
+
+        # Clearing the in-memory cache keeps the persisted details
+        second.clear_cache()
+        second.get_song_info("abc123")
+        assert mock_ytmusic.get_song.call_count == 1
+
+        second.clear_cache()
+        second.clear_disk_cache()
+        second.get_song_info("abc123")
+        assert mock_ytmusic.get_song.call_count == 2
+        second.close()
+
     def test_parse_duration_handles_minutes_seconds(self) -> None:
         """Test duration parsing for M:SS format."""
         assert YTMusicClient._parse_duration("3:45") == 225
@@ -290,6 +430,55 @@ class TestYTMusicClient:
         # Should take at least 50ms due to rate limiting
         assert elapsed >= 0.05
 
+    def test_retries_are_rate_limited(self, client: YTMusicClient) -> None:
+        """Test that every retry attempt goes through the rate limiter."""
+        func = Mock(side_effect=[Exception("Temporary error"), "ok"])
+
+        with patch("time.sleep"), patch.object(client, "_rate_limit") as mock_rl:
+            assert client._retry_on_failure(func) == "ok"
+
+        assert mock_rl.call_count == 2
+
+    def test_rate_limiting_spaces_concurrent_requests(self, client: YTMusicClient) -> None:
+        """Test concurrent callers each get their own start slot."""
+        client._min_request_interval = 0.05
+        starts: list[float] = []
+
+        def call() -> None:
+            client._rate_limit()
+            starts.append(time.time())
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        assert starts[2] - starts[0] >= 0.09
+
+    def test_get_song_infos_fetches_concurrently_in_order(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test bulk song info runs calls in parallel and skips failures."""
+        client._min_request_interval = 0
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_song(video_id: str) -> dict:
+            if video_id == "missing":
+                return {}
+            barrier.wait()
+            return {"videoDetails": {"title": f"Song {video_id}", "author": "Artist"}}
+
+        mock_ytmusic.get_song.side_effect = get_song
+        client._client = mock_ytmusic
+
+        infos = client.get_song_infos(["vid2", "missing", "vid1", "vid2"])
+
+        assert list(infos) == ["vid2", "vid1"]
+        assert infos["vid1"]["title"] == "Song vid1"
+        assert mock_ytmusic.get_song.call_count == 3
+
     def test_setup_browser_creates_credentials_file(self, tmp_path: Path) -> None:
         """Test that setup_browser calls ytmusicapi's setup function."""
         browser_file = tmp_path / "browser.json"
@@ -329,6 +518,23 @@ class TestYTMusicClient:
         assert mock_ytmusic.search.call_count == 1
 
 
+def test_truncate_error_matches_str_formatting() -> None:
+    """Test that _truncate_error formats like str() and truncates long messages."""
+    assert _truncate_error(Exception("boom")) == "boom"
+    assert _truncate_error(KeyError("key")) == "'key'"
+    assert _truncate_error(Exception("a", 1)) == "('a', 1)"
+    assert _truncate_error(Exception("x" * 300), max_length=10) == "xxxxxxxxxx... (truncated)"
+
+
+def test_ytmusicapi_responses_decoded_with_orjson() -> None:
+    """Test that ytmusicapi parses responses via orjson and keeps other json functions."""
+    pytest.importorskip("orjson")
+    import ytmusicapi.ytmusic
+
+    assert ytmusicapi.ytmusic.json.loads('{"contents": [1, "a"]}') == {"contents": [1, "a"]}
+    assert ytmusicapi.ytmusic.json.dumps({"a": 1}) == '{"a": 1}'
+
+
 class TestParseDuration:
     """Tests for _parse_duration static method."""
 
@@ -348,6 +554,13 @@ class TestParseDuration:
         assert YTMusicClient._parse_duration("invalid") == 0
         assert YTMusicClient._parse_duration("1:2:3:4") == 0
 
+    def test_track_duration(self) -> None:
+        """Test track durations from numeric and string fields."""
+        assert YTMusicClient._track_duration({"duration_seconds": 225}) == 225.0
+        assert YTMusicClient._track_duration({"duration": "1:02:03"}) == 3723
+        assert YTMusicClient._track_duration({"duration": "bad"}) is None
+        assert YTMusicClient._track_duration({}) is None
+
 
 class TestPlaylistFetching:
     """Tests for playlist fetching functionality."""
@@ -514,6 +727,25 @@ class TestPlaylistFetching:
         assert tracks[0] == Track(video_id="abc123", title="Song 1", artist="Artist 1")
         assert tracks[1] == Track(video_id="def456", title="Song 2", artist="Artist 2")
 
+    def test_get_playlist_tracks_cached_until_expiry(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test playlist tracks are reused within the TTL and refetched after."""
+        mock_ytmusic.get_playlist.return_value = {
+            "tracks": [{"videoId": "abc123", "title": "Song 1", "artists": []}]
+        }
+        client._client = mock_ytmusic
+        now = [1000.0]
+
+        with patch("ytmpd.ytmusic.time.monotonic", lambda: now[0]):
+            client.get_playlist_tracks("PL123")
+            client.get_playlist_tracks("PL123")
+            assert mock_ytmusic.get_playlist.call_count == 1
+
+            now[0] += 301
+            client.get_playlist_tracks("PL123")
+            assert mock_ytmusic.get_playlist.call_count == 2
+
     def test_get_playlist_tracks_handles_empty_playlist(
         self, client: YTMusicClient, mock_ytmusic: Mock
     ) -> None:
@@ -605,6 +837,23 @@ class TestPlaylistFetching:
         assert tracks[1].title == "Unknown Title"
         assert tracks[1].artist == "Unknown Artist"
 
+    def test_get_playlist_tracks_skips_unparseable_entries(
+        self, client: YTMusicClient, mock_ytmusic: Mock
+    ) -> None:
+        """Test that entries which can't be parsed are dropped, not fatal."""
+        mock_ytmusic.get_playlist.return_value = {
+            "tracks": [
+                {"videoId": "abc123", "title": "Song 1", "artists": [None]},
+                {"videoId": "def456", "title": "Song 2", "duration_seconds": None},
+                {"videoId": "ghi789", "title": "Song 3", "artists": [{"name": "Artist 3"}]},
+            ]
+        }
+
+        client._client = mock_ytmusic
+        tracks = client.get_playlist_tracks("PL123")
+
+        assert [t.video_id for t in tracks] == ["ghi789"]
+
     def test_get_playlist_tracks_raises_not_found_for_invalid_id(
         self, client: YTMusicClient, mock_ytmusic: Mock
     ) -> None:
@@ -22,7 +22,10 @@ class TestGetSong:
         auth_file = tmp_path / "browser.json"
         auth_file.write_text(json.dumps({"access_token": "t"}))
         with patch("ytmpd.ytmusic.YTMusic", return_value=mock_ytmusic):
-            return YTMusicClient(auth_file=auth_file)
+            client = YTMusicClient(auth_file=auth_file)
+            # YTMusic is constructed lazily; build it while the patch is active
+            assert client._client is mock_ytmusic
+        return client
 
     def test_returns_song_dict(self, client: YTMusicClient, mock_ytmusic: Mock) -> None:
         song_data = {"videoDetails": {"videoId": "abc12345678", "title": "Test"}}
@@ -87,7 +90,10 @@ class TestReportHistory:
         auth_file = tmp_path / "browser.json"
         auth_file.write_text(json.dumps({"access_token": "t"}))
         with patch("ytmpd.ytmusic.YTMusic", return_value=mock_ytmusic):
-            return YTMusicClient(auth_file=auth_file)
+            client = YTMusicClient(auth_file=auth_file)
+            # YTMusic is constructed lazily; build it while the patch is active
+            assert client._client is mock_ytmusic
+        return client
 
     def test_returns_true_on_success(self, client: YTMusicClient, mock_ytmusic: Mock) -> None:
         mock_ytmusic.add_history_item.return_value = "ok"
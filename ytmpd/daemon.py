@@ -69,7 +69,9 @@ class YTMPDaemon:
 
         # Initialize components
         try:
-            self.ytmusic_client = YTMusicClient(auth_file=auth_file)
+            self.ytmusic_client = YTMusicClient(
+                auth_file=auth_file, cache_db=get_config_dir() / "ytmusic_cache.db"
+            )
             self.mpd_client = MPDClient(
                 socket_path=self.config["mpd_socket_path"],
                 playlist_directory=self.config.get("mpd_playlist_directory"),
@@ -341,6 +343,18 @@ class YTMPDaemon:
             if self._socket_thread.is_alive():
                 logger.warning("Socket thread did not stop within timeout")
 
+        # Flush pending stream cache writes
+        try:
+            self.stream_resolver.close()
+        except Exception as e:
+            logger.warning(f"Error closing stream resolver: {e}")
+
+        # Release pooled YouTube Music connections
+        try:
+            self.ytmusic_client.close()
+        except Exception as e:
+            logger.warning(f"Error closing YouTube Music client: {e}")
+
         # Final check - log any threads still alive
         threads_alive = []
         if self._sync_thread and self._sync_thread.is_alive():
@@ -435,6 +449,21 @@ class YTMPDaemon:
                 self._proxy_loop.close()
             logger.info("Proxy server thread stopped")
 
+    def _forget_proxy_negative_cache(self, video_ids: list[str] | None = None) -> None:
+        """Clear the proxy's cached 404s for tracks that were just added.
+
+        Args:
+            video_ids: Video IDs added to the TrackStore, or None for all entries.
+        """
+        if not self.proxy_server or not self._proxy_loop:
+            return
+
+        try:
+            self._proxy_loop.call_soon_threadsafe(self.proxy_server.forget_negative, video_ids)
+        except RuntimeError:
+            # Proxy loop already closed during shutdown
+            pass
+
     def _auto_auth_loop(self) -> None:
         """Background thread for periodic auto-auth refresh."""
         logger.info("Starting auto-auth refresh loop")
@@ -543,6 +572,7 @@ class YTMPDaemon:
             try:
                 # Perform sync
                 result = self.sync_engine.sync_all_playlists()
+                self._forget_proxy_negative_cache()
 
                 # Update state
                 self.state["last_sync"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
@@ -592,6 +622,7 @@ class YTMPDaemon:
                             logger.info("Reactive refresh succeeded, retrying sync")
                             try:
                                 result = self.sync_engine.sync_all_playlists()
+                                self._forget_proxy_negative_cache()
                                 self.state["last_sync"] = (
                                     datetime.now(UTC).isoformat().replace("+00:00", "Z")
                                 )
@@ -983,6 +1014,9 @@ class YTMPDaemon:
             if not track_objects:
                 return {"success": False, "error": "No valid tracks to add to playlist"}
 
+            if lazy_resolution:
+                self._forget_proxy_negative_cache(video_ids)
+
             # Build liked video ID set for like indicator
             like_indicator = self.config.get(
                 "like_indicator", {"enabled": False, "tag": "+1", "alignment": "right"}
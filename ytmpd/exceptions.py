@@ -71,6 +71,18 @@ class YouTubeStreamError(ProxyError):
     pass
 
 
+class RateLimitedError(YouTubeStreamError):
+    """Raised when YouTube rejects stream extraction with HTTP 429.
+
+    Attributes:
+        retry_after: Seconds YouTube asked to wait, or None if it didn't say.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class TrackNotFoundError(ProxyError):
     """Raised when track not found in store."""
 
@@ -22,12 +22,15 @@ import asyncio
 import logging
 import re
 import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
 from aiohttp import web
 
-from ytmpd.exceptions import URLRefreshError
+from ytmpd.exceptions import RateLimitedError, URLRefreshError
 from ytmpd.track_store import TrackStore
 
 logger = logging.getLogger(__name__)
@@ -35,13 +38,77 @@ logger = logging.getLogger(__name__)
 # URL expiry time in hours (YouTube URLs expire after ~6 hours)
 URL_EXPIRY_HOURS = 5
 
+# Precomputed expiry threshold in seconds for the per-request expiry check
+_EXPIRY_SECONDS = URL_EXPIRY_HOURS * 3600
+
 # Maximum number of concurrent resolution requests
 MAX_CONCURRENT_STREAMS = 10
 
+# Lower bound for the adaptive concurrency limit
+MIN_CONCURRENT_STREAMS = 1
+
+# AIMD concurrency control driven by resolver latency: the effective limit grows
+# by AIMD_INCREASE_STEP while the rolling average latency stays within target,
+# and is multiplied by AIMD_DECREASE_FACTOR on slow or failed resolutions
+AIMD_INCREASE_STEP = 0.5
+AIMD_DECREASE_FACTOR = 0.5
+AIMD_TARGET_LATENCY_SECONDS = 2.0
+AIMD_LATENCY_WINDOW = 20
+
+# The adaptive limit resets to max_concurrent_streams after this long without
+# a resolver failure, so a burst of errors doesn't throttle refreshes for good
+AIMD_IDLE_RESET_SECONDS = 60.0
+
+# How long "not found"/"invalid format" outcomes are cached per video_id
+NEGATIVE_CACHE_SECONDS = 30.0
+
+# Negative cache is cleared once it grows past this many entries
+NEGATIVE_CACHE_MAX_ENTRIES = 1024
+
+# How long the write-behind task collects stream URL updates before committing
+WRITE_BEHIND_INTERVAL_SECONDS = 0.05
+
+# Default refresh cooldown after the resolver reports upstream rate limiting,
+# used when the error carries no explicit retry-after value
+RATE_LIMIT_COOLDOWN_SECONDS = 30.0
+
+# Static 503 response used when the connection limit is reached
+_BUSY_TEXT = "Too many concurrent streams"
+_BUSY_HEADERS = {"Retry-After": "1"}
+
+# Preset reason phrase for redirects (skips the per-response status lookup)
+_REDIRECT_REASON = "Temporary Redirect"
+
+# Pre-serialized /health body; it never changes, so it carries a fixed ETag
+_HEALTH_BODY = b'{"status":"ok","service":"icy-proxy"}'
+_HEALTH_ETAG = '"ok"'
+
 # Valid video_id pattern (YouTube video IDs are 11 characters: alphanumeric, -, _)
 VIDEO_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{11}$")
 
 
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """Extract an upstream rate-limit cooldown from a resolver error.
+
+    Args:
+        error: Exception raised by the stream resolver
+
+    Returns:
+        Seconds to suspend refreshes for, or None if the error isn't a rate limit
+    """
+    if isinstance(error, RateLimitedError) and error.retry_after is None:
+        return RATE_LIMIT_COOLDOWN_SECONDS
+
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            return RATE_LIMIT_COOLDOWN_SECONDS
+
+    return None
+
+
 class ICYProxyServer:
     """HTTP redirect proxy for lazy YouTube URL resolution.
 
@@ -94,9 +161,36 @@ class ICYProxyServer:
         self.runner: web.AppRunner | None = None
         self.site: web.TCPSite | None = None
 
-        # Connection tracking (tracks concurrent resolution requests)
+        # Dedicated resolver thread pool, created in start() and sized to the
+        # admission limit so resolutions don't compete for the loop's default pool
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Write-behind queue for resolved URLs, drained in batches while running
+        self._update_queue: asyncio.Queue[tuple[str, str] | None] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
+        # Connection tracking (tracks concurrent resolution requests). The handler
+        # runs on a single event loop and never awaits between the limit check and
+        # the increment, so the counter needs no lock.
         self._active_connections = 0
-        self._connection_lock = asyncio.Lock()
+
+        # Short-lived cache of 400/404 outcomes: video_id -> (expires_at, error, text)
+        self._negative_cache: dict[str, tuple[float, type[web.HTTPException], str]] = {}
+
+        # Adaptive limit on concurrent resolver calls, bounded by
+        # max_concurrent_streams (AIMD). Only refreshes wait on it; cached
+        # redirects are admitted against max_concurrent_streams alone.
+        self._effective_max: float = float(max_concurrent_streams)
+        self._resolver_latencies: deque[float] = deque(maxlen=AIMD_LATENCY_WINDOW)
+        self._last_resolver_failure = 0.0
+        self._active_resolutions = 0
+        self._resolution_slots = asyncio.Condition()
+
+        # In-flight URL refreshes keyed by video_id (single-flight coalescing)
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+
+        # Monotonic deadline before which refreshes are suspended (upstream rate limit)
+        self._refresh_block_until = 0.0
 
         # Setup routes
         self.app.router.add_get("/proxy/{video_id}", self._handle_proxy_request)
@@ -108,22 +202,45 @@ class ICYProxyServer:
         Raises:
             OSError: If the port is already in use or binding fails
         """
-        self.runner = web.AppRunner(self.app)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_streams, thread_name_prefix="ytmpd-resolve"
+        )
+
+        self._update_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(
+            self._drain_stream_url_updates(self._update_queue)
+        )
+
+        # The proxy logs each request itself; skip aiohttp's per-request access log.
+        # Each redirect is a one-shot response, so don't hold connections open
+        # waiting for further requests.
+        self.runner = web.AppRunner(
+            self.app,
+            access_log=None,
+            handle_signals=False,
+            keepalive_timeout=0,
+            tcp_keepalive=False,
+        )
         await self.runner.setup()
 
-        self.site = web.TCPSite(self.runner, self.host, self.port)
+        self.site = web.TCPSite(
+            self.runner, self.host, self.port, backlog=128, reuse_address=True
+        )
         await self.site.start()
 
         logger.info(
-            f"[PROXY] Starting redirect proxy on {self.host}:{self.port} "
-            f"(max concurrent requests: {self.max_concurrent_streams}, "
-            f"URL refresh: {'enabled' if self.stream_resolver else 'disabled'})"
+            "[PROXY] Starting redirect proxy on %s:%s "
+            "(max concurrent requests: %d, URL refresh: %s)",
+            self.host,
+            self.port,
+            self.max_concurrent_streams,
+            "enabled" if self.stream_resolver else "disabled",
         )
 
     async def stop(self) -> None:
         """Stop the aiohttp server gracefully.
 
-        Cleans up server resources.
+        Cleans up server resources and the resolver thread pool.
         """
         if self.site:
             await self.site.stop()
@@ -133,6 +250,17 @@ class ICYProxyServer:
             await self.runner.cleanup()
             logger.info("[PROXY] Server runner cleaned up")
 
+        if self._writer_task and self._update_queue:
+            # Sentinel makes the writer flush pending updates and exit
+            self._update_queue.put_nowait(None)
+            await self._writer_task
+            self._writer_task = None
+            self._update_queue = None
+
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def _is_url_expired(self, updated_at: float, expiry_hours: int = URL_EXPIRY_HOURS) -> bool:
         """Check if a stream URL has expired based on its updated timestamp.
 
@@ -143,12 +271,16 @@ class ICYProxyServer:
         Returns:
             True if URL is expired, False otherwise
         """
+        if expiry_hours == URL_EXPIRY_HOURS:
+            expiry_seconds = _EXPIRY_SECONDS
+        else:
+            expiry_seconds = expiry_hours * 3600
+
         age_seconds = time.time() - updated_at
-        age_hours = age_seconds / 3600
-        is_expired = age_hours > expiry_hours
+        is_expired = age_seconds > expiry_seconds
 
-        if is_expired:
-            logger.debug(f"URL expired (age: {age_hours:.1f}h > {expiry_hours}h)")
+        if is_expired and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("URL expired (age: %.1fh > %sh)", age_seconds / 3600, expiry_hours)
 
         return is_expired
 
@@ -167,37 +299,295 @@ class ICYProxyServer:
         if not self.stream_resolver:
             raise URLRefreshError("StreamResolver not configured - cannot refresh URLs")
 
-        logger.info(f"[PROXY] Refreshing expired URL for {video_id}")
+        if time.monotonic() < self._refresh_block_until:
+            raise URLRefreshError(f"Upstream rate limited, not refreshing {video_id} yet")
+
+        # Coalesce concurrent refreshes: later callers await the first resolver call
+        pending = self._inflight.get(video_id)
+        if pending is not None:
+            logger.debug("[PROXY] Joining in-flight URL refresh for %s", video_id)
+            new_url = await asyncio.shield(pending)
+            if new_url is not None:
+                return new_url
+            # The refresh we joined was cancelled with its client; run our own
+            return await self._refresh_stream_url(video_id)
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[video_id] = pending
+
+        try:
+            new_url = await self._resolve_stream_url(video_id)
+        except URLRefreshError as e:
+            pending.set_exception(e)
+            # Mark as retrieved so a refresh without waiters doesn't log a warning
+            pending.exception()
+            raise
+        except BaseException:
+            # Don't cancel the waiters along with this caller (e.g. a client
+            # disconnect); None tells them to resolve the URL themselves
+            pending.set_result(None)
+            raise
+        else:
+            pending.set_result(new_url)
+            return new_url
+        finally:
+            self._inflight.pop(video_id, None)
+
+    async def _resolve_stream_url(self, video_id: str) -> str:
+        """Resolve a fresh stream URL for a video ID in the thread pool.
+
+        Args:
+            video_id: YouTube video ID to resolve
+
+        Returns:
+            New stream URL
+
+        Raises:
+            URLRefreshError: If resolution fails
+        """
+        logger.info("[PROXY] Refreshing expired URL for %s", video_id)
+
+        async with self._resolution_slots:
+            await self._resolution_slots.wait_for(
+                lambda: self._active_resolutions < self._resolution_limit()
+            )
+            self._active_resolutions += 1
 
         try:
             # StreamResolver.resolve_video_id is synchronous, run in thread pool
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
+            started = time.monotonic()
             new_url = await loop.run_in_executor(
-                None,
+                self._executor,
                 self.stream_resolver.resolve_video_id,
                 video_id
             )
+        except Exception as e:
+            self._decrease_concurrency()
 
-            if not new_url:
-                raise URLRefreshError(f"Failed to resolve new URL for {video_id}")
-
-            logger.info(f"[PROXY] Successfully refreshed URL for {video_id}")
-            return new_url
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                self._refresh_block_until = time.monotonic() + retry_after
+                logger.warning(
+                    "[PROXY] Upstream rate limited, suspending URL refreshes for %.0fs",
+                    retry_after,
+                )
 
-        except Exception as e:
-            logger.error(f"[PROXY] Failed to refresh URL for {video_id}: {e}")
+            logger.error("[PROXY] Failed to refresh URL for %s: %s", video_id, e)
             raise URLRefreshError(f"URL refresh failed for {video_id}: {e}") from e
+        finally:
+            async with self._resolution_slots:
+                self._active_resolutions -= 1
+                self._resolution_slots.notify_all()
+
+        if not new_url:
+            self._decrease_concurrency()
+            raise URLRefreshError(f"Failed to resolve new URL for {video_id}")
+
+        self._record_resolver_latency(time.monotonic() - started)
+        logger.info("[PROXY] Successfully refreshed URL for %s", video_id)
+        return new_url
+
+    def _record_resolver_latency(self, latency: float) -> None:
+        """Adjust the effective concurrency limit from a successful resolution.
+
+        Additively increases the limit while the rolling average resolver latency
+        stays within AIMD_TARGET_LATENCY_SECONDS, and decreases it multiplicatively
+        otherwise.
+
+        Args:
+            latency: Wall-clock seconds the resolution took
+        """
+        self._resolver_latencies.append(latency)
+        avg_latency = sum(self._resolver_latencies) / len(self._resolver_latencies)
+
+        if avg_latency <= AIMD_TARGET_LATENCY_SECONDS:
+            self._effective_max = min(
+                float(self.max_concurrent_streams), self._effective_max + AIMD_INCREASE_STEP
+            )
+        else:
+            self._decrease_concurrency()
+
+    def _resolution_limit(self) -> int:
+        """Return the current adaptive limit on concurrent resolver calls.
+
+        Restores the full limit once AIMD_IDLE_RESET_SECONDS have passed since
+        the last resolver failure.
+
+        Returns:
+            Number of resolutions allowed to run at once
+        """
+        if (
+            self._effective_max < self.max_concurrent_streams
+            and time.monotonic() - self._last_resolver_failure >= AIMD_IDLE_RESET_SECONDS
+        ):
+            self._effective_max = float(self.max_concurrent_streams)
+            self._resolver_latencies.clear()
+            logger.debug(
+                "[PROXY] No resolver failures for %.0fs, concurrency limit reset to %d",
+                AIMD_IDLE_RESET_SECONDS,
+                self.max_concurrent_streams,
+            )
+        return int(self._effective_max)
+
+    def _decrease_concurrency(self) -> None:
+        """Multiplicatively decrease the effective concurrency limit."""
+        self._last_resolver_failure = time.monotonic()
+        self._effective_max = max(
+            float(MIN_CONCURRENT_STREAMS), self._effective_max * AIMD_DECREASE_FACTOR
+        )
+        logger.debug("[PROXY] Effective concurrency limit now %.1f", self._effective_max)
+
+    async def _resolve_or_refresh(
+        self, video_id: str, stream_url: str | None, updated_at: float
+    ) -> str | None:
+        """Return a usable stream URL for a track, resolving or refreshing it if needed.
+
+        Unresolved tracks (lazy resolution) must resolve successfully; expired URLs
+        are refreshed best-effort, falling back to the old URL on failure. New URLs
+        are saved to the TrackStore.
+
+        Args:
+            video_id: YouTube video ID
+            stream_url: Stored stream URL, or None if not resolved yet
+            updated_at: Unix timestamp when the stored URL was last updated
+
+        Returns:
+            Stream URL to redirect to (may be the stored URL unchanged)
+
+        Raises:
+            HTTPBadGateway: If an unresolved track cannot be resolved
+        """
+        strict = stream_url is None
+
+        if strict:
+            logger.info(
+                "[PROXY] Stream URL not resolved yet for %s, resolving on-demand", video_id
+            )
+        elif self._is_url_expired(updated_at):
+            logger.info("[PROXY] URL expired for %s, attempting refresh", video_id)
+        else:
+            return stream_url
+
+        try:
+            new_url = await self._refresh_stream_url(video_id)
+        except URLRefreshError as e:
+            logger.error("[PROXY] URL resolution failed for %s: %s", video_id, e)
+            if strict:
+                raise web.HTTPBadGateway(
+                    text=f"Failed to resolve stream URL for video_id: {video_id}"
+                )
+            # Continue with old URL - it might still work
+            logger.warning("[PROXY] Attempting to use potentially expired URL for %s", video_id)
+            return stream_url
+
+        if self._update_queue is not None:
+            self._update_queue.put_nowait((video_id, new_url))
+        else:
+            self.track_store.update_stream_url(video_id, new_url)
+        logger.info("[PROXY] URL resolution successful for %s", video_id)
+        return new_url
+
+    async def _drain_stream_url_updates(
+        self, queue: "asyncio.Queue[tuple[str, str] | None]"
+    ) -> None:
+        """Persist queued stream URL updates to the TrackStore in batches.
+
+        Waits for an update, collects any further updates arriving within
+        WRITE_BEHIND_INTERVAL_SECONDS, then commits them in one transaction.
+        Exits after flushing once the None sentinel is received.
+
+        Args:
+            queue: Queue of (video_id, stream_url) updates
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                break
+
+            batch = {item[0]: item[1]}
+            deadline = loop.time() + WRITE_BEHIND_INTERVAL_SECONDS
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch[item[0]] = item[1]
+
+            try:
+                await loop.run_in_executor(
+                    None, self.track_store.update_stream_urls, list(batch.items())
+                )
+                logger.debug("[PROXY] Saved %d refreshed stream URLs", len(batch))
+            except Exception as e:
+                logger.error("[PROXY] Failed to save %d stream URLs: %s", len(batch), e)
+
+    def _cache_negative(
+        self, video_id: str, error_class: type[web.HTTPException], text: str
+    ) -> None:
+        """Remember an error outcome for a video_id for NEGATIVE_CACHE_SECONDS.
+
+        Args:
+            video_id: Requested video ID
+            error_class: HTTP exception class to raise on repeat requests
+            text: Response body text
+        """
+        if len(self._negative_cache) >= NEGATIVE_CACHE_MAX_ENTRIES:
+            self._negative_cache.clear()
+        self._negative_cache[video_id] = (
+            time.monotonic() + NEGATIVE_CACHE_SECONDS,
+            error_class,
+            text,
+        )
+
+    def forget_negative(self, video_ids: Iterable[str] | None = None) -> int:
+        """Drop cached error outcomes so the next requests look the IDs up again.
+
+        Call after tracks are added to the TrackStore; otherwise a video_id
+        requested just before being added keeps failing with 404 until its
+        negative cache entry expires. Must run on the proxy's event loop thread.
+
+        Args:
+            video_ids: Video IDs to forget, or None to clear the whole cache
+
+        Returns:
+            Number of entries removed
+        """
+        if video_ids is None:
+            removed = len(self._negative_cache)
+            self._negative_cache.clear()
+            return removed
+
+        removed = 0
+        for video_id in video_ids:
+            if self._negative_cache.pop(video_id, None) is not None:
+                removed += 1
+        return removed
 
     async def _handle_health_check(self, request: web.Request) -> web.Response:
         """Handle health check requests.
 
+        Probes that send back the ETag via If-None-Match get an empty 304.
+
         Args:
             request: aiohttp request object
 
         Returns:
-            JSON response with server status
+            JSON response with server status, or 304 Not Modified
         """
-        return web.json_response({"status": "ok", "service": "icy-proxy"})
+        if request.headers.get("If-None-Match") == _HEALTH_ETAG:
+            return web.Response(status=304, headers={"ETag": _HEALTH_ETAG})
+        return web.Response(
+            body=_HEALTH_BODY,
+            content_type="application/json",
+            headers={"ETag": _HEALTH_ETAG, "Cache-Control": "max-age=1"},
+        )
 
     async def _handle_proxy_request(self, request: web.Request) -> web.Response:
         """Handle proxy requests for video streams with URL refresh and connection limiting.
@@ -205,8 +595,8 @@ class ICYProxyServer:
         URL format: /proxy/{video_id}
 
         Process:
-            1. Check concurrent connection limit
-            2. Extract and validate video_id from path
+            1. Extract video_id and check concurrent connection limit
+            2. Validate video_id format
             3. Lookup track metadata in TrackStore
             4. Check if URL is expired and refresh if needed
             5. Return HTTP 307 redirect to direct YouTube URL
@@ -229,111 +619,114 @@ class ICYProxyServer:
         video_id = request.match_info["video_id"]
         client_ip = request.remote or "unknown"
 
-        # Validate video_id format
-        if not VIDEO_ID_PATTERN.match(video_id):
-            logger.warning(f"[PROXY] Invalid video_id format from {client_ip}: {video_id}")
-            raise web.HTTPBadRequest(
-                text=f"Invalid video_id format: {video_id}"
+        # Repeat requests for unknown/invalid IDs skip the regex and database
+        cached_error = self._negative_cache.get(video_id)
+        if cached_error is not None:
+            expires_at, error_class, text = cached_error
+            if time.monotonic() < expires_at:
+                raise error_class(text=text)
+            del self._negative_cache[video_id]
+
+        # Check connection limit first so rejections cost no further work
+        if self._active_connections >= self.max_concurrent_streams:
+            logger.warning(
+                "[PROXY] Connection limit reached (%d/%d), rejecting request for %s from %s",
+                self._active_connections,
+                self.max_concurrent_streams,
+                video_id,
+                client_ip,
             )
+            raise web.HTTPServiceUnavailable(text=_BUSY_TEXT, headers=_BUSY_HEADERS)
 
-        # Check connection limit
-        async with self._connection_lock:
-            if self._active_connections >= self.max_concurrent_streams:
-                logger.warning(
-                    f"[PROXY] Connection limit reached ({self._active_connections}/{self.max_concurrent_streams}), "
-                    f"rejecting request for {video_id} from {client_ip}"
-                )
-                raise web.HTTPServiceUnavailable(
-                    text=f"Too many concurrent streams ({self._active_connections}/{self.max_concurrent_streams})"
-                )
-
-            self._active_connections += 1
-            logger.debug(
-                f"[PROXY] Connection accepted for {video_id} "
-                f"({self._active_connections}/{self.max_concurrent_streams} active)"
-            )
+        # Validate video_id format
+        if not VIDEO_ID_PATTERN.match(video_id):
+            logger.warning("[PROXY] Invalid video_id format from %s: %s", client_ip, video_id)
+            text = f"Invalid video_id format: {video_id}"
+            self._cache_negative(video_id, web.HTTPBadRequest, text)
+            raise web.HTTPBadRequest(text=text)
+
+        self._active_connections += 1
+        logger.debug(
+            "[PROXY] Connection accepted for %s (%d active, resolve limit %d)",
+            video_id,
+            self._active_connections,
+            int(self._effective_max),
+        )
 
         try:
             # Lookup track in store
-            track = self.track_store.get_track(video_id)
-            if not track:
-                logger.warning(f"[PROXY] Track not found: {video_id}")
-                raise web.HTTPNotFound(
-                    text=f"Track not found: {video_id}"
+            # Only the INFO log line needs artist/title; otherwise fetch just the
+            # URL and its timestamp
+            track = None
+            if logger.isEnabledFor(logging.INFO):
+                track = self.track_store.get_track(video_id)
+                row = (track["stream_url"], track["updated_at"]) if track else None
+            else:
+                row = self.track_store.get_track_min(video_id)
+
+            if row is None:
+                logger.warning("[PROXY] Track not found: %s", video_id)
+                text = f"Track not found: {video_id}"
+                self._cache_negative(video_id, web.HTTPNotFound, text)
+                raise web.HTTPNotFound(text=text)
+
+            stream_url = await self._resolve_or_refresh(video_id, *row)
+
+            if track is not None:
+                logger.info(
+                    "[PROXY] Stream request: video_id=%s, client=%s, track=%s - %s",
+                    video_id,
+                    client_ip,
+                    track["artist"] or "Unknown Artist",
+                    track["title"],
                 )
 
-            stream_url = track["stream_url"]
-            updated_at = track["updated_at"]
-            artist = track["artist"] or "Unknown Artist"
-            title = track["title"]
-            icy_name = f"{artist} - {title}"
-
-            # Lazy resolution: If stream_url is None, resolve it on-demand
-            if stream_url is None:
-                logger.info(f"[PROXY] Stream URL not resolved yet for {video_id}, resolving on-demand")
-                try:
-                    stream_url = await self._refresh_stream_url(video_id)
-                    # Save resolved URL to TrackStore
-                    self.track_store.update_stream_url(video_id, stream_url)
-                    logger.info(f"[PROXY] On-demand resolution successful for {video_id}")
-                except URLRefreshError as e:
-                    logger.error(f"[PROXY] On-demand resolution failed for {video_id}: {e}")
-                    raise web.HTTPBadGateway(
-                        text=f"Failed to resolve stream URL for video_id: {video_id}"
-                    )
-
-            # Check if URL needs refresh
-            elif self._is_url_expired(updated_at):
-                logger.info(f"[PROXY] URL expired for {video_id}, attempting refresh")
-                try:
-                    stream_url = await self._refresh_stream_url(video_id)
-                    # Update TrackStore with new URL
-                    self.track_store.update_stream_url(video_id, stream_url)
-                    logger.info(f"[PROXY] URL refresh successful for {video_id}")
-                except URLRefreshError as e:
-                    logger.error(f"[PROXY] URL refresh failed for {video_id}: {e}")
-                    # Continue with old URL - it might still work
-                    logger.warning(f"[PROXY] Attempting to use potentially expired URL for {video_id}")
-
-            logger.info(
-                f"[PROXY] Stream request: video_id={video_id}, client={client_ip}, "
-                f"track={icy_name}"
-            )
-
             # Validate stream URL before redirecting
             if not stream_url:
-                logger.error(f"[PROXY] stream_url is None for {video_id}")
+                logger.error("[PROXY] stream_url is None for %s", video_id)
                 raise web.HTTPBadGateway(
                     text=f"Stream URL is missing for video_id: {video_id}"
                 )
 
             if not isinstance(stream_url, str) or not stream_url.startswith(('http://', 'https://')):
-                logger.error(f"[PROXY] Invalid stream_url format for {video_id}: {stream_url[:100] if stream_url else 'None'}")
+                logger.error(
+                    "[PROXY] Invalid stream_url format for %s: %s",
+                    video_id,
+                    stream_url[:100] if stream_url else "None",
+                )
                 raise web.HTTPBadGateway(
                     text=f"Invalid stream URL format for video_id: {video_id}"
                 )
 
             # Return HTTP 307 redirect to direct YouTube URL
             # This allows MPD to stream directly from YouTube while we handle URL resolution/refresh
-            logger.debug(f"[PROXY] Redirecting to YouTube URL for {video_id}")
-            raise web.HTTPTemporaryRedirect(stream_url)
+            logger.debug("[PROXY] Redirecting to YouTube URL for %s", video_id)
+            # Returned rather than raised so the success path doesn't unwind an
+            # exception; the explicit reason and empty body skip aiohttp's
+            # default "307: ..." text
+            return web.Response(
+                status=307, reason=_REDIRECT_REASON, headers={"Location": stream_url}
+            )
 
         except web.HTTPException:
             # Re-raise HTTP exceptions (they're already properly formatted)
             raise
         except Exception as e:
-            logger.exception(f"[PROXY] Unexpected error handling proxy request for {video_id}: {e}")
+            logger.exception(
+                "[PROXY] Unexpected error handling proxy request for %s: %s", video_id, e
+            )
             raise web.HTTPInternalServerError(
                 text=f"Unexpected error handling proxy request"
             )
         finally:
             # Decrement connection counter
-            async with self._connection_lock:
-                self._active_connections -= 1
-                logger.debug(
-                    f"[PROXY] Connection closed for {video_id} "
-                    f"({self._active_connections}/{self.max_concurrent_streams} active)"
-                )
+            self._active_connections -= 1
+            logger.debug(
+                "[PROXY] Connection closed for %s (%d active, resolve limit %d)",
+                video_id,
+                self._active_connections,
+                int(self._effective_max),
+            )
 
 
     async def __aenter__(self) -> "ICYProxyServer":
@@ -4,22 +4,139 @@ This module provides a high-level wrapper around python-mpd2 for MPD
 communication, with a focus on playlist management operations.
 """
 
+import functools
 import logging
+import os
+import re
+import socket
 import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from mpd import CommandError, ConnectionError
 from mpd import MPDClient as MPDClientBase
 
 from ytmpd.exceptions import MPDConnectionError, MPDPlaylistError
-from ytmpd.xspf_generator import XSPFTrack, generate_xspf
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime so M3U-only use never loads the XSPF module
+    from ytmpd.xspf_generator import XSPFTrack
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of playlistadd commands sent in one MPD command list
+PLAYLIST_ADD_BATCH_SIZE = 1000
+
+# How long a listplaylists result is reused before asking MPD again
+PLAYLIST_CACHE_TTL_SECONDS = 5.0
+
+# Skip the liveness ping if an MPD command succeeded within this window
+CONNECTION_CHECK_INTERVAL_SECONDS = 30.0
+
+# Reconnect attempts after a lost connection, with exponential backoff
+# between failures starting from RECONNECT_BACKOFF_SECONDS
+RECONNECT_ATTEMPTS = 3
+RECONNECT_BACKOFF_SECONDS = 0.05
+
+# Reopen the MPD connection once it has been open this long
+CONNECTION_MAX_AGE_SECONDS = 3600.0
+
+# Idle time before the kernel starts TCP keepalive probes on the MPD socket
+TCP_KEEPALIVE_IDLE_SECONDS = 60
+
+# Write buffer size for streaming playlist files to disk
+PLAYLIST_WRITE_BUFFER_SIZE = 1 << 16
+
+# Line prefix for M3U track entries (duration -1 means unknown)
+_EXTINF_PREFIX = "#EXTINF:-1,"
+
+# "host:port" form of socket_path that selects a TCP connection
+_HOST_PORT_RE = re.compile(r"^([^:/]+):(\d+)$")
+
+# Playlist names that could escape the playlist directory
+_INVALID_NAME_RE = re.compile(r"[/\\]|\.\.")
+
+
+def _validate_playlist_name(name: str) -> None:
+    """Reject playlist names containing path separators or "..".
 
-@dataclass
+    Args:
+        name: Playlist name to check.
+
+    Raises:
+        ValueError: If the name could be used for path traversal.
+    """
+    if _INVALID_NAME_RE.search(name):
+        raise ValueError(f"Invalid playlist name (contains path separators): {name}")
+
+
+@contextmanager
+def _open_for_replace(path: Path) -> Iterator[TextIO]:
+    """Open a temporary sibling of path for writing and move it into place on success.
+
+    The content is streamed to ``<path>.tmp``, fsynced, and renamed over
+    ``path`` with os.replace() once the block completes, so MPD never reads a
+    half-written playlist, even after a crash. The temporary file is removed
+    if writing fails.
+
+    Args:
+        path: Final playlist file path.
+
+    Yields:
+        Text file handle for the temporary file.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=PLAYLIST_WRITE_BUFFER_SIZE) as f:
+            yield f
+            # Make the data durable before the rename publishes it
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _tracks_health(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Record the outcome of an MPD command on the client.
+
+    A successful call refreshes the client's last-success timestamp so
+    _ensure_connected() can skip its ping; a connection failure clears it
+    so the next call verifies the connection first.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "MPDClient", *args: Any, **kwargs: Any) -> Any:
+        try:
+            result = method(self, *args, **kwargs)
+        except (ConnectionError, MPDConnectionError):
+            self._last_ok = 0.0
+            raise
+        self._last_ok = time.monotonic()
+        return result
+
+    return wrapper
+
+
+def _proxy_url_prefix(proxy_config: dict[str, Any] | None) -> str | None:
+    """Build the proxy URL prefix that video IDs are appended to.
+
+    Args:
+        proxy_config: Optional proxy configuration dict with 'enabled', 'host', and 'port' keys.
+
+    Returns:
+        "http://host:port/proxy/" if the proxy is enabled, otherwise None.
+    """
+    if proxy_config and proxy_config.get("enabled", False):
+        return f"http://{proxy_config['host']}:{proxy_config['port']}/proxy/"
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class TrackWithMetadata:
     """Track with URL and metadata for M3U/XSPF playlist generation."""
 
@@ -50,11 +167,27 @@ class MPDClient:
             playlist_directory: Path to MPD's playlist directory. If not specified,
                               defaults to ~/.config/mpd/playlists.
         """
-        self.socket_path = (
-            str(Path(socket_path).expanduser()) if ":" not in socket_path else socket_path
-        )
+        # "host:port" means TCP; anything else is a Unix socket path
+        tcp_match = _HOST_PORT_RE.match(socket_path)
+        if tcp_match:
+            self.socket_path = socket_path
+            self.connection_type = "tcp"
+            self.host = tcp_match.group(1)
+            self.port = int(tcp_match.group(2))
+        else:
+            self.socket_path = str(Path(socket_path).expanduser())
+            self.connection_type = "unix"
+            self.host = None
+            self.port = None
+
         self._client: MPDClientBase | None = None
         self._connected = False
+        # Monotonic time of the last MPD command known to have succeeded
+        self._last_ok = 0.0
+        # Monotonic time the current connection was opened
+        self._connected_at = 0.0
+        # (fetched_at, names, name_set) from the last listplaylists call
+        self._playlists_cache: tuple[float, list[str], frozenset[str]] | None = None
 
         # Set playlist directory
         if playlist_directory:
@@ -62,17 +195,6 @@ class MPDClient:
         else:
             self.playlist_directory = Path.home() / ".config" / "mpd" / "playlists"
 
-        # Detect connection type
-        if ":" in socket_path:
-            parts = socket_path.split(":", 1)
-            self.connection_type = "tcp"
-            self.host = parts[0]
-            self.port = int(parts[1])
-        else:
-            self.connection_type = "unix"
-            self.host = None
-            self.port = None
-
     def connect(self) -> None:
         """Connect to MPD via Unix socket or TCP.
 
@@ -97,14 +219,33 @@ class MPDClient:
                 # TCP connection
                 logger.info(f"Connecting to MPD at {self.host}:{self.port}")
                 self._client.connect(self.host, self.port)
+                self._enable_tcp_keepalive()
 
             self._connected = True
+            self._connected_at = self._last_ok = time.monotonic()
             logger.info("Successfully connected to MPD")
         except ConnectionError as e:
             raise MPDConnectionError(f"Failed to connect to MPD: {e}") from e
         except Exception as e:
             raise MPDConnectionError(f"Unexpected error connecting to MPD: {e}") from e
 
+    def _enable_tcp_keepalive(self) -> None:
+        """Turn on TCP keepalive for the MPD socket so idle connections stay usable.
+
+        Failures are logged and ignored; keepalive is only an optimization.
+        """
+        sock = getattr(self._client, "_sock", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE_SECONDS
+                )
+        except OSError as e:
+            logger.debug(f"Could not enable TCP keepalive on MPD socket: {e}")
+
     def disconnect(self) -> None:
         """Cleanly disconnect from MPD."""
         if self._client and self._connected:
@@ -117,6 +258,7 @@ class MPDClient:
             finally:
                 self._connected = False
                 self._client = None
+                self._playlists_cache = None
 
     def is_connected(self) -> bool:
         """Check if currently connected to MPD.
@@ -130,6 +272,7 @@ class MPDClient:
         # Test connection by sending a ping
         try:
             self._client.ping()
+            self._last_ok = time.monotonic()
             return True
         except Exception:
             self._connected = False
@@ -161,9 +304,81 @@ class MPDClient:
     def list_playlists(self) -> list[str]:
         """Return list of all playlist names in MPD.
 
+        Results are cached for PLAYLIST_CACHE_TTL_SECONDS and invalidated
+        whenever this client creates or deletes a playlist.
+
         Returns:
             List of playlist names as strings.
 
+        Raises:
+            MPDConnectionError: If not connected to MPD.
+            MPDPlaylistError: If listing playlists fails.
+        """
+        return list(self._fetch_playlists()[1])
+
+    def list_playlists_fs(
+        self, playlist_format: str = "m3u", mpd_music_directory: str | None = None
+    ) -> list[str]:
+        """Return names of playlist files written by ytmpd, without asking MPD.
+
+        Scans the playlist directory (M3U) or the _youtube folder in MPD's music
+        directory (XSPF) with a single os.scandir() pass. Only files on disk are
+        seen, not playlists MPD stores elsewhere, so use list_playlists() when
+        MPD's own view matters.
+
+        Args:
+            playlist_format: Playlist format - "m3u" or "xspf" (default: "m3u").
+            mpd_music_directory: Path to MPD's music directory (required for XSPF format).
+
+        Returns:
+            List of playlist names (file names without extension).
+
+        Raises:
+            ValueError: If XSPF format requested but mpd_music_directory not provided.
+        """
+        playlist_format = playlist_format.lower()
+        if playlist_format == "xspf":
+            if not mpd_music_directory:
+                raise ValueError("mpd_music_directory is required for XSPF format.")
+            directory = Path(mpd_music_directory).expanduser() / "_youtube"
+        else:
+            directory = self.playlist_directory
+        suffix = f".{playlist_format}"
+
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    entry.name[: -len(suffix)]
+                    for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _fetch_playlists(self) -> tuple[float, list[str], frozenset[str]]:
+        """Return the cached listplaylists result, refreshing it if stale.
+
+        Cache hits don't talk to MPD, so they leave the health timestamp alone.
+
+        Returns:
+            Tuple of (fetched_at, names, name_set).
+
+        Raises:
+            MPDConnectionError: If not connected to MPD.
+            MPDPlaylistError: If listing playlists fails.
+        """
+        cached = self._playlists_cache
+        if cached is not None and time.monotonic() - cached[0] < PLAYLIST_CACHE_TTL_SECONDS:
+            return cached
+        return self._refresh_playlists()
+
+    @_tracks_health
+    def _refresh_playlists(self) -> tuple[float, list[str], frozenset[str]]:
+        """Fetch the playlist listing from MPD and cache it.
+
+        Returns:
+            Tuple of (fetched_at, names, name_set).
+
         Raises:
             MPDConnectionError: If not connected to MPD.
             MPDPlaylistError: If listing playlists fails.
@@ -175,7 +390,8 @@ class MPDClient:
             playlists = self._client.listplaylists()
             names = [p["playlist"] for p in playlists]
             logger.debug(f"Found {len(names)} playlists")
-            return names
+            self._playlists_cache = (time.monotonic(), names, frozenset(names))
+            return self._playlists_cache
         except ConnectionError as e:
             raise MPDConnectionError(f"Lost connection to MPD: {e}") from e
         except Exception as e:
@@ -191,11 +407,26 @@ class MPDClient:
             True if playlist exists, False otherwise.
         """
         try:
-            playlists = self.list_playlists()
-            return name in playlists
+            return name in self._fetch_playlists()[2]
         except Exception:
             return False
 
+    def playlists_exist(self, names: Iterable[str]) -> dict[str, bool]:
+        """Check several playlist names against a single playlist listing.
+
+        Args:
+            names: Playlist names to check.
+
+        Returns:
+            Dict mapping each name to True if the playlist exists.
+
+        Raises:
+            MPDConnectionError: If not connected to MPD.
+            MPDPlaylistError: If listing playlists fails.
+        """
+        existing = self._fetch_playlists()[2]
+        return {name: name in existing for name in names}
+
     def _apply_like_indicator(
         self,
         title: str,
@@ -266,6 +497,8 @@ class MPDClient:
             logger.warning(f"No tracks provided for playlist '{name}', skipping")
             return
 
+        self._playlists_cache = None
+
         playlist_format = playlist_format.lower()
 
         if playlist_format == "xspf":
@@ -304,8 +537,7 @@ class MPDClient:
         """Create M3U playlist (original implementation)."""
         try:
             # Validate playlist name to prevent path traversal attacks
-            if "/" in name or "\\" in name or ".." in name:
-                raise ValueError(f"Invalid playlist name (contains path separators): {name}")
+            _validate_playlist_name(name)
 
             # Get MPD's playlist directory
             playlist_dir = self.get_playlist_directory()
@@ -313,31 +545,31 @@ class MPDClient:
 
             logger.debug(f"Creating M3U playlist '{name}' with {len(tracks)} tracks")
 
-            # Write M3U file with EXTINF metadata
-            m3u_content = "#EXTM3U\n"
-            for track in tracks:
-                # EXTINF format: #EXTINF:duration,Artist - Title
-                # Duration -1 means unknown
-                artist_title = f"{track.artist} - {track.title}"
-                artist_title = self._apply_like_indicator(
-                    artist_title,
-                    track.video_id,
-                    liked_video_ids,
-                    like_indicator,
-                    is_liked_playlist,
-                )
-                m3u_content += f"#EXTINF:-1,{artist_title}\n"
-
-                # Use proxy URL if proxy is enabled, otherwise use direct URL
-                if proxy_config and proxy_config.get("enabled", False):
-                    track_url = f"http://{proxy_config['host']}:{proxy_config['port']}/proxy/{track.video_id}"
-                else:
-                    track_url = track.url
+            # Resolve the proxy URL prefix once rather than per track
+            proxy_prefix = _proxy_url_prefix(proxy_config)
+
+            # Stream M3U file with EXTINF metadata
+            with _open_for_replace(playlist_file) as f:
+                f.write("#EXTM3U\n")
+                for track in tracks:
+                    # EXTINF format: #EXTINF:duration,Artist - Title
+                    artist_title = f"{track.artist} - {track.title}"
+                    artist_title = self._apply_like_indicator(
+                        artist_title,
+                        track.video_id,
+                        liked_video_ids,
+                        like_indicator,
+                        is_liked_playlist,
+                    )
 
-                m3u_content += f"{track_url}\n"
+                    # Use proxy URL if proxy is enabled, otherwise use direct URL
+                    if proxy_prefix is not None:
+                        track_url = proxy_prefix + track.video_id
+                    else:
+                        track_url = track.url
 
-            # Write the file
-            playlist_file.write_text(m3u_content, encoding="utf-8")
+                    # One buffered call per track instead of formatting each line
+                    f.writelines((_EXTINF_PREFIX, artist_title, "\n", track_url, "\n"))
 
             logger.info(
                 f"Created M3U playlist '{name}' with {len(tracks)} tracks at {playlist_file}"
@@ -369,8 +601,7 @@ class MPDClient:
 
         try:
             # Validate playlist name to prevent path traversal attacks
-            if "/" in name or "\\" in name or ".." in name:
-                raise ValueError(f"Invalid playlist name (contains path separators): {name}")
+            _validate_playlist_name(name)
 
             # Create _youtube subdirectory in music directory
             music_dir = Path(mpd_music_directory).expanduser()
@@ -381,43 +612,19 @@ class MPDClient:
 
             logger.debug(f"Creating XSPF playlist '{name}' with {len(tracks)} tracks")
 
-            # Convert tracks to XSPF format
-            xspf_tracks = []
-            for track in tracks:
-                # Use proxy URL if proxy is enabled, otherwise use direct URL
-                if proxy_config and proxy_config.get("enabled", False):
-                    track_url = f"http://{proxy_config['host']}:{proxy_config['port']}/proxy/{track.video_id}"
-                else:
-                    track_url = track.url
-
-                # Convert duration to milliseconds if available
-                duration_ms = None
-                if track.duration_seconds is not None:
-                    duration_ms = int(track.duration_seconds * 1000)
-
-                # Apply like indicator to title only (keep artist/creator clean)
-                display_title = self._apply_like_indicator(
-                    track.title,
-                    track.video_id,
-                    liked_video_ids,
-                    like_indicator,
-                    is_liked_playlist,
-                )
+            # Resolve the proxy URL prefix once rather than per track
+            proxy_prefix = _proxy_url_prefix(proxy_config)
 
-                xspf_tracks.append(
-                    XSPFTrack(
-                        location=track_url,
-                        creator=track.artist,
-                        title=display_title,
-                        duration=duration_ms,
-                    )
-                )
+            from ytmpd.xspf_generator import iter_xspf
 
-            # Generate XSPF content
-            xspf_content = generate_xspf(xspf_tracks)
+            # Convert tracks lazily so conversion and XML output share one pass
+            xspf_tracks = self._iter_xspf_tracks(
+                tracks, proxy_prefix, liked_video_ids, like_indicator, is_liked_playlist
+            )
 
-            # Write the file
-            playlist_file.write_text(xspf_content, encoding="utf-8")
+            # Stream XSPF content to the file
+            with _open_for_replace(playlist_file) as f:
+                f.writelines(iter_xspf(xspf_tracks))
 
             logger.info(
                 f"Created XSPF playlist '{name}' with {len(tracks)} tracks at {playlist_file}"
@@ -426,6 +633,55 @@ class MPDClient:
         except Exception as e:
             raise MPDPlaylistError(f"Error creating XSPF playlist '{name}': {e}") from e
 
+    def _iter_xspf_tracks(
+        self,
+        tracks: list[TrackWithMetadata],
+        proxy_prefix: str | None,
+        liked_video_ids: set[str] | None,
+        like_indicator: dict | None,
+        is_liked_playlist: bool,
+    ) -> Iterator["XSPFTrack"]:
+        """Yield XSPFTrack entries for tracks, one at a time.
+
+        Args:
+            tracks: Tracks with URLs and metadata.
+            proxy_prefix: Proxy URL prefix to prepend to video IDs, or None for direct URLs.
+            liked_video_ids: Optional set of liked video IDs for like indicator.
+            like_indicator: Optional like indicator config dict.
+            is_liked_playlist: Whether this is the liked songs playlist (skip indicator).
+
+        Yields:
+            XSPFTrack for each input track, in order.
+        """
+        from ytmpd.xspf_generator import XSPFTrack, durations_to_milliseconds
+
+        # Convert durations in one batched pass alongside the tracks
+        durations_ms = durations_to_milliseconds(track.duration_seconds for track in tracks)
+
+        for track, duration_ms in zip(tracks, durations_ms):
+            # Use proxy URL if proxy is enabled, otherwise use direct URL
+            if proxy_prefix is not None:
+                track_url = proxy_prefix + track.video_id
+            else:
+                track_url = track.url
+
+            # Apply like indicator to title only (keep artist/creator clean)
+            display_title = self._apply_like_indicator(
+                track.title,
+                track.video_id,
+                liked_video_ids,
+                like_indicator,
+                is_liked_playlist,
+            )
+
+            yield XSPFTrack(
+                location=track_url,
+                creator=track.artist,
+                title=display_title,
+                duration=duration_ms,
+            )
+
+    @_tracks_health
     def clear_playlist(self, name: str) -> None:
         """Delete a playlist by name.
 
@@ -437,6 +693,7 @@ class MPDClient:
             MPDPlaylistError: If deletion fails.
         """
         self._ensure_connected()
+        self._playlists_cache = None
 
         try:
             logger.debug(f"Deleting playlist: {name}")
@@ -452,6 +709,7 @@ class MPDClient:
         except Exception as e:
             raise MPDPlaylistError(f"Unexpected error deleting playlist '{name}': {e}") from e
 
+    @_tracks_health
     def add_to_playlist(self, name: str, url: str) -> None:
         """Add a single URL to an existing playlist.
 
@@ -479,6 +737,84 @@ class MPDClient:
         except Exception as e:
             raise MPDPlaylistError(f"Unexpected error adding to playlist '{name}': {e}") from e
 
+    @_tracks_health
+    def add_urls_to_playlist(self, name: str, urls: list[str]) -> None:
+        """Add multiple URLs to an existing playlist using MPD command lists.
+
+        The playlistadd commands are pipelined in batches of
+        PLAYLIST_ADD_BATCH_SIZE, so adding N URLs costs one round-trip per
+        batch instead of one per URL.
+
+        Args:
+            name: Playlist name.
+            urls: Stream URLs to add, in order.
+
+        Raises:
+            MPDConnectionError: If not connected to MPD.
+            MPDPlaylistError: If operation fails.
+        """
+        if not urls:
+            return
+
+        self._ensure_connected()
+
+        try:
+            logger.debug(f"Adding {len(urls)} URLs to playlist '{name}'")
+            for start in range(0, len(urls), PLAYLIST_ADD_BATCH_SIZE):
+                self._client.command_list_ok_begin()
+                for url in urls[start : start + PLAYLIST_ADD_BATCH_SIZE]:
+                    self._client.playlistadd(name, url)
+                self._client.command_list_end()
+            logger.debug(f"Added {len(urls)} URLs to playlist '{name}'")
+        except ConnectionError as e:
+            raise MPDConnectionError(f"Lost connection to MPD: {e}") from e
+        except CommandError as e:
+            if "No such playlist" in str(e):
+                raise MPDPlaylistError(f"Playlist '{name}' does not exist") from e
+            else:
+                raise MPDPlaylistError(f"Failed to add URLs to playlist '{name}': {e}") from e
+        except Exception as e:
+            raise MPDPlaylistError(f"Unexpected error adding to playlist '{name}': {e}") from e
+
+    @_tracks_health
+    def replace_playlist_via_mpd(self, name: str, urls: list[str]) -> None:
+        """Replace a stored MPD playlist with the given URLs using MPD commands only.
+
+        Unlike create_or_replace_playlist(), this writes no M3U/XSPF file and
+        stores the bare URLs without metadata, so it only works for URLs MPD
+        can resolve directly. The old playlist is removed with one rm and the
+        URLs are added in pipelined command lists, giving 1 + N/batch
+        round-trips instead of N + 1. The rm is sent on its own because MPD
+        aborts a command list at the first failing command, and removing a
+        playlist that doesn't exist would drop every add after it.
+
+        Args:
+            name: Playlist name.
+            urls: Stream URLs for the new playlist contents, in order.
+
+        Raises:
+            MPDConnectionError: If not connected to MPD.
+            MPDPlaylistError: If operation fails.
+        """
+        self._ensure_connected()
+        self._playlists_cache = None
+
+        try:
+            logger.debug(f"Replacing playlist '{name}' with {len(urls)} URLs via MPD")
+            self._client.rm(name)
+        except ConnectionError as e:
+            raise MPDConnectionError(f"Lost connection to MPD: {e}") from e
+        except CommandError as e:
+            if "No such playlist" not in str(e):
+                raise MPDPlaylistError(f"Failed to replace playlist '{name}': {e}") from e
+        except Exception as e:
+            raise MPDPlaylistError(f"Unexpected error replacing playlist '{name}': {e}") from e
+
+        # playlistadd creates the playlist on first use
+        self.add_urls_to_playlist(name, urls)
+        logger.info(f"Replaced playlist '{name}' with {len(urls)} URLs via MPD")
+
+    @_tracks_health
     def currentsong(self) -> dict[str, str]:
         """Get the currently playing song from MPD.
 
@@ -495,20 +831,47 @@ class MPDClient:
     def _ensure_connected(self) -> None:
         """Ensure we're connected to MPD, reconnect if needed.
 
+        The ping is skipped while a command has succeeded within
+        CONNECTION_CHECK_INTERVAL_SECONDS, since that already proves the
+        connection is alive.
+
+        Connections older than CONNECTION_MAX_AGE_SECONDS are reopened
+        transparently so a long-running daemon doesn't keep one socket forever.
+
         Raises:
             MPDConnectionError: If not connected and can't reconnect.
         """
+        if (
+            self._connected
+            and time.monotonic() - self._connected_at >= CONNECTION_MAX_AGE_SECONDS
+        ):
+            logger.debug("Recycling MPD connection after max age")
+            self.disconnect()
+            self.connect()
+            return
+
+        if (
+            self._connected
+            and self._client
+            and time.monotonic() - self._last_ok < CONNECTION_CHECK_INTERVAL_SECONDS
+        ):
+            return
+
         if not self.is_connected():
             # Connection lost or never established - try to (re)connect
             logger.warning("Lost connection to MPD, attempting to reconnect")
             self.disconnect()  # Clean up any stale connection
-            time.sleep(0.5)  # Brief delay before reconnecting
-            try:
-                self.connect()
-                logger.info("Successfully reconnected to MPD")
-            except MPDConnectionError as e:
-                logger.error(f"Failed to reconnect to MPD: {e}")
-                raise
+            # Retry immediately, backing off only after a failed attempt
+            for attempt in range(RECONNECT_ATTEMPTS):
+                try:
+                    self.connect()
+                    logger.info("Successfully reconnected to MPD")
+                    return
+                except MPDConnectionError as e:
+                    if attempt == RECONNECT_ATTEMPTS - 1:
+                        logger.error(f"Failed to reconnect to MPD: {e}")
+                        raise
+                    time.sleep(RECONNECT_BACKOFF_SECONDS * (2**attempt))
 
     def __enter__(self):
         """Context manager entry: connect to MPD.
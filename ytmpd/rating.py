@@ -25,24 +25,36 @@ State Machine:
 """
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
-class RatingState(Enum):
+# YouTube Music API LikeStatus strings, indexed by RatingState value
+_STATE_API_VALUES = ("INDIFFERENT", "LIKE", "DISLIKE")
+
+
+class RatingState(IntEnum):
     """Represents the current rating state of a track.
 
+    Integer-valued so comparisons and hashing stay cheap; use api_value for
+    the string the YouTube Music API expects.
+
     Attributes:
         NEUTRAL: No rating or indifferent (also includes DISLIKED due to API ambiguity)
         LIKED: Track is liked (thumbs up)
         DISLIKED: Track is disliked (thumbs down, but appears as INDIFFERENT in queries)
     """
 
-    NEUTRAL = "INDIFFERENT"
-    LIKED = "LIKE"
-    DISLIKED = "DISLIKE"
+    NEUTRAL = 0
+    LIKED = 1
+    DISLIKED = 2
 
+    @property
+    def api_value(self) -> str:
+        """LikeStatus string for this state ("INDIFFERENT", "LIKE" or "DISLIKE")."""
+        return _STATE_API_VALUES[self]
 
-class RatingAction(Enum):
+
+class RatingAction(IntEnum):
     """Represents the user action to perform.
 
     Attributes:
@@ -50,11 +62,17 @@ class RatingAction(Enum):
         DISLIKE: User wants to toggle dislike status
     """
 
-    LIKE = "like"
-    DISLIKE = "dislike"
+    LIKE = 0
+    DISLIKE = 1
+
+
+# API rating strings mapped to states. INDIFFERENT may also mean DISLIKED
+# (see module docstring) but is treated as NEUTRAL for toggle purposes; some
+# API responses return DISLIKE directly.
+_API_RATING_MAP = {state.api_value: state for state in RatingState}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RatingTransition:
     """Result of applying a rating action to a current state.
 
@@ -111,6 +129,13 @@ class RatingManager:
         ),
     }
 
+    # Fully built results for every (current_state, action) pair, so
+    # apply_action() is a single lookup with no per-call construction
+    _TABLE = {
+        key: RatingTransition(key[0], key[1], new_state, api_value, user_message)
+        for key, (new_state, api_value, user_message) in _TRANSITIONS.items()
+    }
+
     def apply_action(self, current_state: RatingState, action: RatingAction) -> RatingTransition:
         """Apply toggle logic to determine new state.
 
@@ -127,20 +152,10 @@ class RatingManager:
         Raises:
             ValueError: If the state/action combination is invalid
         """
-        key = (current_state, action)
-
-        if key not in self._TRANSITIONS:
-            raise ValueError(f"Invalid state transition: {current_state} + {action}")
-
-        new_state, api_value, user_message = self._TRANSITIONS[key]
-
-        return RatingTransition(
-            current_state=current_state,
-            action=action,
-            new_state=new_state,
-            api_value=api_value,
-            user_message=user_message,
-        )
+        try:
+            return self._TABLE[(current_state, action)]
+        except KeyError:
+            raise ValueError(f"Invalid state transition: {current_state} + {action}") from None
 
     def parse_api_rating(self, api_rating: str) -> RatingState:
         """Convert API rating string to RatingState enum.
@@ -160,21 +175,13 @@ class RatingManager:
         Raises:
             ValueError: If api_rating is not a recognized value
         """
-        # Normalize the input
-        api_rating_upper = api_rating.upper().strip()
-
-        # Map API strings to RatingState
-        if api_rating_upper == "LIKE":
-            return RatingState.LIKED
-        elif api_rating_upper == "INDIFFERENT":
-            # Due to API limitation, INDIFFERENT could mean NEUTRAL or DISLIKED
-            # We treat it as NEUTRAL for toggle logic purposes
-            return RatingState.NEUTRAL
-        elif api_rating_upper == "DISLIKE":
-            # Some API responses may return DISLIKE directly
-            return RatingState.DISLIKED
-        else:
+        # The API normally returns canonical casing, so try the raw string first
+        state = _API_RATING_MAP.get(api_rating)
+        if state is None:
+            state = _API_RATING_MAP.get(api_rating.strip().upper())
+        if state is None:
             raise ValueError(
                 f"Unknown API rating value: '{api_rating}'. "
                 f"Expected 'LIKE', 'DISLIKE', or 'INDIFFERENT'."
             )
+        return state
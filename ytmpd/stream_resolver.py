@@ -6,33 +6,123 @@ using yt-dlp, with in-memory caching to avoid repeated extractions. Stream URLs
 after approximately 6 hours, so caching is limited to 5 hours by default.
 """
 
+import atexit
 import concurrent.futures
 import json
 import logging
+import os
+import queue
+import random
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import yt_dlp
 
+from ytmpd.exceptions import RateLimitedError
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# How often a running batch checks should_stop() for daemon shutdown
+STOP_POLL_INTERVAL_SECONDS = 0.5
+
+# Backoff before each retry of a network error (plus up to 50% jitter)
+RETRY_DELAYS_SECONDS = (1, 2, 4)
+RETRY_MAX_DELAY_SECONDS = 8.0
+
+# Default batch worker pool: extraction is dominated by network I/O, so two
+# workers per CPU is the floor, capped to avoid YouTube rate limiting (429s)
+DEFAULT_MAX_WORKERS = min(16, max(4, 2 * (os.cpu_count() or 2)))
+
+# IDs per worker-pool round in iter_resolve_batch()
+BATCH_CHUNK_SIZE = 64
+
+# Smallest batch worth the startup cost of a process pool (use_processes=True)
+PROCESS_POOL_MIN_BATCH = 32
+
+# Default bound on in-memory cached URLs (a long-running daemon would
+# otherwise keep every URL it ever resolved)
+DEFAULT_MAX_CACHE_ENTRIES = 10000
+
+# yt-dlp options shared by every extraction
+_YDL_OPTS = {
+    # Prefer direct HTTPS URLs over HLS/DASH for proxy compatibility
+    # Format priority: opus in webm (251) > m4a audio (140) > any audio
+    # Explicitly exclude HLS/DASH manifests (m3u8_native, dash protocols)
+    'format': 'bestaudio[protocol^=https][protocol!=m3u8_native][protocol!=http_dash_segments][ext=webm]/bestaudio[protocol^=https][protocol!=m3u8_native][protocol!=http_dash_segments]/bestaudio[protocol!=m3u8_native]/bestaudio/best',
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'nocheckcertificate': True,
+    # Don't download, just extract info
+    'skip_download': True,
+    # Prefer non-HLS formats for direct streaming
+    'prefer_free_formats': True,
+    # Use Android client to get direct URLs instead of HLS manifests;
+    # auto-translated subtitle tracks are never used, so skip fetching them
+    'extractor_args': {'youtube': {'player_client': ['android'], 'skip': ['translated_subs']}},
+    # Only the stream URL is needed: no sidecar files or comments
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    'writeinfojson': False,
+    'writethumbnail': False,
+    'getcomments': False,
+    # Don't probe each candidate format with an extra request
+    'check_formats': False,
+}
+
+
+# Queue marker telling the cache writer thread to exit
+_WRITER_STOP = object()
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes) -> object:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _close_ydl_instances(instances: "weakref.WeakSet") -> None:
+    """Close cached YoutubeDL instances (runs when a resolver is collected or at exit)."""
+    for ydl in list(instances):
+        try:
+            ydl.close()
+        except Exception as e:
+            logger.debug(f"Error closing YoutubeDL instance: {e}")
+
 
-@dataclass
+@dataclass(slots=True)
 class CachedURL:
     """Cached stream URL with expiration tracking.
 
     Attributes:
         url: The direct audio stream URL
-        cached_at: When this URL was cached
+        cached_at: When this URL was cached (epoch seconds, used for persistence)
         video_id: The YouTube video ID this URL corresponds to
+        expires_at: time.monotonic() deadline after which the URL is stale
     """
     url: str
-    cached_at: datetime
+    cached_at: float
     video_id: str
+    expires_at: float
 
 
 class StreamResolver:
@@ -42,6 +132,7 @@ class StreamResolver:
     - In-memory caching with configurable expiration
     - Graceful error handling for unavailable videos
     - Batch resolution with parallel processing
+    - Background prefetch of upcoming tracks
     - Automatic retry on network errors
 
     Example:
@@ -51,22 +142,81 @@ class StreamResolver:
             print(f"Stream URL: {url}")
     """
 
-    def __init__(self, cache_hours: int = 5, should_stop_callback: Optional[callable] = None, cache_file: Optional[str] = None):
+    def __init__(
+        self,
+        cache_hours: int = 5,
+        should_stop_callback: Optional[callable] = None,
+        cache_file: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_cache_entries: int = DEFAULT_MAX_CACHE_ENTRIES,
+        use_processes: bool = False,
+    ):
         """Initialize resolver with cache duration.
 
         Args:
             cache_hours: How long to cache URLs before re-extraction (default: 5 hours)
             should_stop_callback: Optional callback that returns True when resolution should be cancelled.
             cache_file: Optional path to JSON file for persistent cache storage.
+            max_workers: Maximum parallel extractions in resolve_batch. Defaults to
+                2x CPU count, clamped to 4-16: yt-dlp extraction is mostly network
+                I/O, and more than 16 concurrent requests invites YouTube 429s.
+            max_cache_entries: Upper bound on cached URLs; the oldest entries are
+                evicted first once it is reached.
+            use_processes: Run extractions for large batches (at least
+                PROCESS_POOL_MIN_BATCH cache misses) in a process pool, so
+                yt-dlp's CPU-bound parsing isn't serialized by the GIL.
         """
+        # Insertion-ordered, and every entry has the same TTL, so the first key
+        # is always the one closest to expiry
         self._cache: dict[str, CachedURL] = {}
+        self._cache_lock = threading.Lock()
+        self._max_cache_entries = max_cache_entries
         self._cache_hours = cache_hours
-        self._cache_file = Path(cache_file).expanduser() if cache_file else None
+        self._ttl_seconds = cache_hours * 3600
+        # The cache is persisted as an append-only JSONL journal next to the
+        # configured path; a legacy JSON snapshot there is migrated on load
+        self._legacy_cache_file = Path(cache_file).expanduser() if cache_file else None
+        self._cache_file = (
+            self._legacy_cache_file.with_suffix('.jsonl') if self._legacy_cache_file else None
+        )
+        self._journal_lock = threading.Lock()
+        self._journal_lines = 0
         self.should_stop = should_stop_callback or (lambda: False)
+        # Private RNG for retry jitter so workers don't share the global one
+        self._random = random.Random()
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._use_processes = use_processes
+        # Events for resolutions in progress, keyed by video ID
+        self._inflight: dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        # Long-lived pool for prefetch(); threads are only started on first use
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="ytmpd-prefetch"
+        )
+        # One YoutubeDL per worker thread; live instances are closed at exit
+        self._tls = threading.local()
+        self._ydl_instances: weakref.WeakSet = weakref.WeakSet()
+        weakref.finalize(self, _close_ydl_instances, self._ydl_instances)
+
+        # New entries not yet handed to the writer. While a batch is running
+        # they are held back and flushed together when it finishes.
+        self._dirty: list[CachedURL] = []
+        self._dirty_lock = threading.Lock()
+        self._active_batches = 0
+
+        # Journal writes happen on a background thread, off the resolve path
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
 
         # Load persistent cache if enabled
         if self._cache_file:
             self._load_cache()
+            self._write_queue = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="ytmpd-cache-writer", daemon=True
+            )
+            self._writer_thread.start()
+            atexit.register(self.close)
 
         logger.info(f"StreamResolver initialized with {cache_hours}h cache" +
                    (f", persistent cache at {self._cache_file}" if self._cache_file else ""))
@@ -76,112 +226,372 @@ class StreamResolver:
 
         This method first checks the cache for a valid (non-expired) URL. If not found
         or expired, it uses yt-dlp to extract the stream URL from YouTube.
+        Concurrent calls for the same uncached video share a single extraction.
 
         Args:
             video_id: YouTube video ID (e.g., "dQw4w9WgXcQ")
 
         Returns:
             Stream URL string if successful, None if video unavailable or extraction fails
+
+        Raises:
+            RateLimitedError: If YouTube rate limited the extraction (HTTP 429)
         """
-        # Check cache first
-        if self._is_cache_valid(video_id):
-            cached = self._cache[video_id]
-            logger.debug(f"Cache hit for {video_id}")
-            return cached.url
+        # Check cache first (one lookup on the hit path)
+        cached = self._cache.get(video_id)
+        if cached is not None:
+            if cached.expires_at > time.monotonic():
+                logger.debug(f"Cache hit for {video_id}")
+                return cached.url
+            logger.debug(f"Cache expired for {video_id}")
+            self._drop_expired(video_id, cached)
+
+        # Coalesce concurrent misses for the same video into one extraction
+        with self._inflight_lock:
+            event = self._inflight.get(video_id)
+            if event is None:
+                self._inflight[video_id] = threading.Event()
+
+        if event is not None:
+            logger.debug(f"Waiting for in-flight resolution of {video_id}")
+            event.wait()
+            cached = self._cache.get(video_id)
+            return cached.url if cached is not None else None
 
         logger.debug(f"Cache miss for {video_id}, extracting URL")
 
+        try:
+            return self._extract_and_cache(video_id)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(video_id).set()
+
+    def _drop_expired(self, video_id: str, cached: CachedURL) -> None:
+        """Remove an expired entry unless another thread has replaced it.
+
+        Args:
+            video_id: YouTube video ID
+            cached: The expired entry that was read from the cache
+        """
+        with self._cache_lock:
+            if self._cache.get(video_id) is cached:
+                del self._cache[video_id]
+
+    def _store(self, cached: CachedURL) -> None:
+        """Insert a cache entry, evicting the oldest entries beyond the size bound.
+
+        Args:
+            cached: Entry to insert
+        """
+        with self._cache_lock:
+            # Re-inserting moves the key to the end of the eviction order
+            self._cache.pop(cached.video_id, None)
+            self._cache[cached.video_id] = cached
+            while len(self._cache) > self._max_cache_entries:
+                self._cache.pop(next(iter(self._cache)))
+
+    def _extract_and_cache(self, video_id: str) -> Optional[str]:
+        """Extract a stream URL and cache it on success.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Stream URL if successful, None if extraction fails
+        """
         # Extract URL with yt-dlp
         url = self._extract_url(video_id)
 
         if url:
-            # Cache the result
-            self._cache[video_id] = CachedURL(
-                url=url,
-                cached_at=datetime.now(),
-                video_id=video_id
-            )
-            logger.debug(f"Cached URL for {video_id}")
-
-            # Persist cache if enabled
-            if self._cache_file:
-                self._save_cache()
+            self._cache_url(video_id, url)
 
         return url
 
-    def resolve_batch(self, video_ids: list[str]) -> dict[str, str]:
+    def _cache_url(self, video_id: str, url: str) -> None:
+        """Cache a freshly extracted URL and queue it for persistence.
+
+        Args:
+            video_id: YouTube video ID
+            url: Extracted stream URL
+        """
+        cached = CachedURL(
+            url=url,
+            cached_at=time.time(),
+            video_id=video_id,
+            expires_at=time.monotonic() + self._ttl_seconds,
+        )
+        self._store(cached)
+        logger.debug(f"Cached URL for {video_id}")
+
+        # Persist cache if enabled
+        self._mark_dirty(cached)
+
+    def resolve_batch(self, video_ids: Iterable[str]) -> dict[str, str]:
         """Resolve multiple video IDs efficiently with parallel processing.
 
         This method processes video IDs in parallel with limited concurrency to avoid
         rate limiting. It returns only successful resolutions, logging failures.
 
         Args:
-            video_ids: List of YouTube video IDs to resolve
+            video_ids: YouTube video IDs to resolve (any iterable; consumed once)
 
         Returns:
             Dict mapping video_id -> stream URL for successful resolutions only
         """
+        # Drop duplicates up front (order preserved) so they cost nothing
+        video_ids = list(dict.fromkeys(video_ids))
         if not video_ids:
             return {}
 
         logger.info(f"Resolving batch of {len(video_ids)} video IDs")
         results: dict[str, str] = {}
+        completed = 0
 
-        # Use ThreadPoolExecutor for parallel processing (max 10 concurrent)
-        max_workers = min(10, len(video_ids))
+        # One chunk: a single worker pool for the whole batch
+        for video_id, url in self.iter_resolve_batch(video_ids, chunk_size=len(video_ids)):
+            completed += 1
+            if url:
+                results[video_id] = url
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_video_id = {
-                executor.submit(self.resolve_video_id, video_id): video_id
-                for video_id in video_ids
-            }
+            # Log progress every 10 videos
+            if completed % 10 == 0:
+                logger.info(f"Progress: {completed}/{len(video_ids)} videos processed")
 
-            # Collect results as they complete
-            completed = 0
-            pending_futures = list(future_to_video_id.keys())
+        success_rate = len(results) / len(video_ids) * 100 if video_ids else 0
+        logger.info(
+            f"Batch complete: {len(results)}/{len(video_ids)} successful ({success_rate:.1f}%)"
+        )
+
+        return results
+
+    def iter_resolve_batch(
+        self, video_ids: Iterable[str], chunk_size: int = BATCH_CHUNK_SIZE
+    ) -> Iterator[tuple[str, Optional[str]]]:
+        """Resolve video IDs in chunks, yielding each result as soon as it is ready.
+
+        Only one chunk is in flight at a time, which bounds outstanding work for
+        very large inputs and lets callers start using early results while the
+        rest are still resolving. Results arrive in completion order.
+
+        Args:
+            video_ids: YouTube video IDs to resolve (any iterable; duplicates are skipped)
+            chunk_size: Number of IDs submitted to the worker pool at a time
+
+        Yields:
+            (video_id, stream URL or None if resolution failed) tuples
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got: {chunk_size}")
+
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return
+
+        # Each sync resolves one batch, which makes this the periodic sweep point
+        self.purge_expired()
 
-            while pending_futures:
-                # Check if we should stop (e.g., daemon shutting down)
+        with self._dirty_lock:
+            self._active_batches += 1
+        try:
+            for start in range(0, len(video_ids), chunk_size):
                 if self.should_stop():
-                    logger.info(f"Stream resolution cancelled after {completed}/{len(video_ids)} videos")
-                    # Cancel all remaining futures
-                    for f in pending_futures:
-                        f.cancel()
-                    break
+                    logger.info(
+                        f"Stream resolution cancelled after {start}/{len(video_ids)} videos"
+                    )
+                    return
+                yield from self._iter_resolved(video_ids[start:start + chunk_size])
+        finally:
+            with self._dirty_lock:
+                self._active_batches -= 1
+            self._flush_if_dirty()
+            # New entries are journaled; compact if it has grown
+            self._compact_cache()
+
+    def _iter_resolved(self, video_ids: list[str]) -> Iterator[tuple[str, Optional[str]]]:
+        """Resolve unique video IDs on a worker pool, yielding in completion order.
+
+        Args:
+            video_ids: Unique YouTube video IDs to resolve
+
+        Yields:
+            (video_id, stream URL or None) tuples
+        """
+        pending = video_ids
+
+        use_processes = self._use_processes and len(video_ids) >= PROCESS_POOL_MIN_BATCH
+        if use_processes:
+            # Answer cache hits here; only misses cross the process boundary,
+            # and their results are cached back in this process
+            now = time.monotonic()
+            pending = []
+            for video_id in video_ids:
+                cached = self._cache.get(video_id)
+                if cached is not None and not self._is_expired(cached, now):
+                    yield video_id, cached.url
+                else:
+                    pending.append(video_id)
+            use_processes = len(pending) >= PROCESS_POOL_MIN_BATCH
+            task = _extract_url_in_process
+
+        if not pending:
+            return
 
-                # Use timeout so we can check should_stop() regularly
-                done, pending_futures = concurrent.futures.wait(
-                    pending_futures, timeout=0.5, return_when=concurrent.futures.FIRST_COMPLETED
-                )
+        # Parallel processing bounded by max_workers
+        max_workers = min(self._max_workers, len(pending))
+        executor: Executor
+        if use_processes:
+            logger.info(f"Extracting {len(pending)} URLs in a process pool")
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_process_worker)
+        else:
+            task = self.resolve_video_id
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        stop_watch_done = threading.Event()
+
+        with executor:
+            # Submit all tasks; each future reports itself on completion.
+            # A done-callback queue is used rather than as_completed() because
+            # futures dropped by shutdown(cancel_futures=True) never wake
+            # as_completed() waiters, but do run their callbacks.
+            done_queue: queue.SimpleQueue[concurrent.futures.Future] = queue.SimpleQueue()
+            future_to_video_id = {}
+            for video_id in pending:
+                future = executor.submit(task, video_id)
+                future_to_video_id[future] = video_id
+                future.add_done_callback(done_queue.put)
+
+            # Watch for shutdown on a side thread so the loop below can block
+            # until each result is ready instead of waking up on a timer
+            watcher = threading.Thread(
+                target=self._cancel_on_stop,
+                args=(executor, stop_watch_done),
+                name="ytmpd-resolve-stop",
+                daemon=True,
+            )
+            watcher.start()
+
+            # Collect results as they complete
+            completed = len(video_ids) - len(pending)
+            try:
+                for _ in range(len(future_to_video_id)):
+                    future = done_queue.get()
+                    if future.cancelled():
+                        # Daemon shutting down; queued resolutions were dropped
+                        logger.info(
+                            f"Stream resolution cancelled after {completed}/{len(video_ids)} videos"
+                        )
+                        break
 
-                for future in done:
                     video_id = future_to_video_id[future]
                     completed += 1
 
                     try:
                         url = future.result()
-                        if url:
-                            results[video_id] = url
-                        else:
-                            logger.warning(f"Failed to resolve {video_id}")
                     except Exception as e:
                         logger.error(f"Exception resolving {video_id}: {e}")
+                        url = None
+
+                    if url:
+                        if use_processes:
+                            self._cache_url(video_id, url)
+                    else:
+                        logger.warning(f"Failed to resolve {video_id}")
+                    yield video_id, url
+            except GeneratorExit:
+                # Consumer stopped iterating; don't resolve the rest of the chunk
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                stop_watch_done.set()
+
+    def _mark_dirty(self, cached: CachedURL) -> None:
+        """Record a new cache entry for persistence.
+
+        Outside of a batch the entry is handed to the writer right away; during
+        a batch it waits for the single flush at the end.
 
-                    # Log progress every 10 videos
-                    if completed % 10 == 0:
-                        logger.info(f"Progress: {completed}/{len(video_ids)} videos processed")
+        Args:
+            cached: Newly cached entry
+        """
+        if self._write_queue is None:
+            return
 
-        success_rate = len(results) / len(video_ids) * 100 if video_ids else 0
-        logger.info(
-            f"Batch complete: {len(results)}/{len(video_ids)} successful ({success_rate:.1f}%)"
-        )
+        with self._dirty_lock:
+            self._dirty.append(cached)
+            in_batch = self._active_batches > 0
+        if not in_batch:
+            self._flush_if_dirty()
 
-        # Persist cache after batch resolution
-        if self._cache_file and results:
-            self._save_cache()
+    def _flush_if_dirty(self) -> None:
+        """Hand all unpersisted cache entries to the writer thread."""
+        with self._dirty_lock:
+            entries, self._dirty = self._dirty, []
+        if entries and self._write_queue is not None:
+            self._write_queue.put(entries)
 
-        return results
+    def prefetch(self, video_ids: list[str]) -> int:
+        """Start resolving video IDs in the background without waiting.
+
+        Call this as soon as upcoming tracks are known so that a later
+        resolve_video_id() finds the URL cached, or joins the in-flight
+        extraction instead of starting another one.
+
+        Args:
+            video_ids: YouTube video IDs likely to be requested soon
+
+        Returns:
+            Number of resolutions scheduled (cached and in-flight IDs are skipped)
+        """
+        now = time.monotonic()
+        scheduled = 0
+        for video_id in dict.fromkeys(video_ids):
+            cached = self._cache.get(video_id)
+            if cached is not None and not self._is_expired(cached, now):
+                continue
+            if video_id in self._inflight:
+                continue
+            try:
+                self._prefetch_executor.submit(self.resolve_video_id, video_id)
+            except RuntimeError:
+                # Executor already shut down by close()
+                break
+            scheduled += 1
+
+        if scheduled:
+            logger.debug(f"Prefetching {scheduled} stream URLs")
+        return scheduled
+
+    def close(self) -> None:
+        """Stop prefetching, flush pending cache writes and stop the background writer.
+
+        Safe to call more than once. Also registered to run at interpreter exit.
+        """
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._flush_if_dirty()
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._write_queue.put(_WRITER_STOP)
+            self._writer_thread.join()
+        self._compact_cache()
+
+    def _cancel_on_stop(self, executor: Executor, done: threading.Event) -> None:
+        """Cancel queued resolutions once should_stop() reports shutdown.
+
+        Runs on a helper thread for the duration of a batch. Resolutions that
+        are already running finish normally; queued ones are dropped.
+
+        Args:
+            executor: Executor running the batch
+            done: Event set by resolve_batch() when the batch is finished
+        """
+        while True:
+            if self.should_stop():
+                executor.shutdown(wait=False, cancel_futures=True)
+                return
+            if done.wait(STOP_POLL_INTERVAL_SECONDS):
+                return
 
     def _extract_url(self, video_id: str) -> Optional[str]:
         """Extract stream URL using yt-dlp.
@@ -195,45 +605,85 @@ class StreamResolver:
         Returns:
             Stream URL if successful, None if extraction fails
         """
-        ydl_opts = {
-            # Prefer direct HTTPS URLs over HLS/DASH for proxy compatibility
-            # Format priority: opus in webm (251) > m4a audio (140) > any audio
-            # Explicitly exclude HLS/DASH manifests (m3u8_native, dash protocols)
-            'format': 'bestaudio[protocol^=https][protocol!=m3u8_native][protocol!=http_dash_segments][ext=webm]/bestaudio[protocol^=https][protocol!=m3u8_native][protocol!=http_dash_segments]/bestaudio[protocol!=m3u8_native]/bestaudio/best',
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'nocheckcertificate': True,
-            # Don't download, just extract info
-            'skip_download': True,
-            # Prefer non-HLS formats for direct streaming
-            'prefer_free_formats': True,
-            # Use Android client to get direct URLs instead of HLS manifests
-            'extractor_args': {'youtube': {'player_client': ['android']}},
-        }
-
         video_url = f'https://youtube.com/watch?v={video_id}'
 
+        # Retry network errors with geometric backoff; jitter keeps parallel
+        # batch workers from retrying in lockstep
+        for attempt in range(len(RETRY_DELAYS_SECONDS) + 1):
+            url, retryable = self._extract_once(video_id, video_url)
+            if not retryable:
+                return url
+            if attempt == len(RETRY_DELAYS_SECONDS):
+                break
+
+            delay = RETRY_DELAYS_SECONDS[attempt]
+            delay = min(delay + self._random.uniform(0, delay / 2), RETRY_MAX_DELAY_SECONDS)
+            logger.debug(f"Network error for {video_id}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+        logger.warning(
+            f"Retry failed for {video_id} after {len(RETRY_DELAYS_SECONDS) + 1} attempts"
+        )
+        return None
+
+    def _get_ydl(self) -> "yt_dlp.YoutubeDL":
+        """Get this thread's YoutubeDL instance, creating it on first use.
+
+        Building a YoutubeDL re-parses options and re-initializes extractors, so
+        each worker thread keeps one for every video it resolves. It is dropped
+        along with the thread-local storage when the thread exits.
+
+        Returns:
+            YoutubeDL instance owned by the calling thread
+        """
+        ydl = getattr(self._tls, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(_YDL_OPTS))
+            self._tls.ydl = ydl
+            self._ydl_instances.add(ydl)
+        return ydl
+
+    def _extract_once(self, video_id: str, video_url: str) -> tuple[Optional[str], bool]:
+        """Run a single yt-dlp extraction attempt.
+
+        Args:
+            video_id: YouTube video ID
+            video_url: Watch URL for the video
+
+        Returns:
+            Tuple of (stream URL or None, whether the failure is worth retrying)
+
+        Raises:
+            RateLimitedError: If YouTube answered with HTTP 429; retrying
+                immediately would only prolong the block
+        """
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
+            # Every ID is a YouTube video, so name the extractor instead of
+            # letting yt-dlp test the URL against its whole extractor registry
+            info = self._get_ydl().extract_info(video_url, download=False, ie_key='Youtube')
 
-                if not info:
-                    logger.info(f"No info extracted for {video_id}")
-                    return None
+            if not info:
+                logger.info(f"No info extracted for {video_id}")
+                return None, False
 
-                # Get the direct URL
-                url = info.get('url')
-                if not url:
-                    logger.warning(f"No URL in extracted info for {video_id}")
-                    return None
+            # Get the direct URL
+            url = info.get('url')
+            if not url:
+                logger.warning(f"No URL in extracted info for {video_id}")
+                return None, False
 
-                logger.debug(f"Extracted URL for {video_id}")
-                return url
+            logger.debug(f"Extracted URL for {video_id}")
+            return url, False
 
         except yt_dlp.utils.DownloadError as e:
             error_msg = str(e).lower()
 
+            if '429' in error_msg or 'too many requests' in error_msg:
+                logger.warning(f"Rate limited by YouTube while extracting {video_id}")
+                raise RateLimitedError(
+                    f"Rate limited extracting {video_id}: {e}", _retry_after(e)
+                ) from e
+
             # Handle specific error cases with appropriate log levels
             if 'private video' in error_msg or 'this video is private' in error_msg:
                 logger.info(f"Video {video_id} is private")
@@ -247,73 +697,70 @@ class StreamResolver:
                 # Unknown download error
                 logger.warning(f"Download error for {video_id}: {e}")
 
-            return None
+            return None, False
 
         except yt_dlp.utils.ExtractorError as e:
             logger.warning(f"Extractor error for {video_id}: {e}")
-            return None
+            return None, False
 
         except Exception as e:
-            # Network errors or unexpected issues
-            # Retry once for network errors
-            if 'network' in str(e).lower() or 'timeout' in str(e).lower():
-                logger.debug(f"Network error for {video_id}, retrying once")
-                time.sleep(1)
-
-                try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(video_url, download=False)
-                        if info and info.get('url'):
-                            logger.debug(f"Retry successful for {video_id}")
-                            return info['url']
-                except Exception as retry_error:
-                    logger.warning(f"Retry failed for {video_id}: {retry_error}")
-                    return None
+            # Network errors are retried by the caller
+            error_msg = str(e).lower()
+            if 'network' in error_msg or 'timeout' in error_msg:
+                logger.debug(f"Network error for {video_id}: {e}")
+                return None, True
 
             logger.error(f"Unexpected error extracting {video_id}: {e}")
-            return None
+            return None, False
 
-    def _is_cache_valid(self, video_id: str) -> bool:
-        """Check if cached URL is still valid (not expired).
+    @staticmethod
+    def _is_expired(cached: CachedURL, now: float) -> bool:
+        """Check whether a cache entry has expired at monotonic time now."""
+        return cached.expires_at <= now
 
-        Args:
-            video_id: YouTube video ID to check
+    def purge_expired(self) -> int:
+        """Remove all expired entries from the in-memory cache.
 
         Returns:
-            True if cache hit and not expired, False otherwise
+            Number of entries removed
         """
-        if video_id not in self._cache:
-            return False
-
-        cached = self._cache[video_id]
-        age = datetime.now() - cached.cached_at
-        max_age = timedelta(hours=self._cache_hours)
-
-        if age > max_age:
-            logger.debug(f"Cache expired for {video_id} (age: {age.total_seconds()/3600:.1f}h)")
-            # Remove expired entry
-            del self._cache[video_id]
-            return False
-
-        return True
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [
+                video_id for video_id, cached in self._cache.items()
+                if self._is_expired(cached, now)
+            ]
+            for video_id in expired:
+                del self._cache[video_id]
+
+        if expired:
+            logger.debug(f"Purged {len(expired)} expired cache entries")
+        return len(expired)
 
     def clear_cache(self) -> None:
         """Clear all cached URLs.
 
         This can be useful for testing or to force re-extraction of all URLs.
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._cache_lock:
+            count = len(self._cache)
+            self._cache.clear()
         logger.info(f"Cleared cache ({count} entries)")
 
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics.
 
+        Does not modify the cache; use purge_expired() to drop expired entries.
+
         Returns:
-            Dict with cache_size and expired_count
+            Dict with cache_size, expired_count and valid_count
         """
-        total = len(self._cache)
-        expired = sum(1 for video_id in list(self._cache.keys()) if not self._is_cache_valid(video_id))
+        now = time.monotonic()
+        with self._cache_lock:
+            total = len(self._cache)
+            expired = sum(
+                1 for cached in self._cache.values() if self._is_expired(cached, now)
+            )
 
         return {
             'cache_size': total,
@@ -322,71 +769,219 @@ class StreamResolver:
         }
 
     def _load_cache(self) -> None:
-        """Load cache from JSON file.
+        """Load cache from the JSONL journal.
 
-        Loads previously cached URLs from disk. Expired entries are discarded.
+        Replays the journal line by line, keeping the last entry seen for each
+        video ID. Expired and malformed lines are discarded. If no journal exists
+        yet, a legacy JSON snapshot is migrated instead.
         """
-        if not self._cache_file or not self._cache_file.exists():
-            logger.debug("No cache file to load")
+        if not self._cache_file.exists():
+            if self._legacy_cache_file.exists() and self._legacy_cache_file != self._cache_file:
+                self._load_legacy_cache()
+            else:
+                logger.debug("No cache file to load")
             return
 
         try:
-            with open(self._cache_file, 'r') as f:
-                cache_data = json.load(f)
-
-            loaded = 0
-            expired = 0
-            for video_id, entry in cache_data.items():
-                # Parse datetime from ISO format
-                cached_at = datetime.fromisoformat(entry['cached_at'])
-
-                # Check if expired
-                age = datetime.now() - cached_at
-                if age > timedelta(hours=self._cache_hours):
-                    expired += 1
-                    continue
-
-                self._cache[video_id] = CachedURL(
-                    url=entry['url'],
-                    cached_at=cached_at,
-                    video_id=video_id
-                )
-                loaded += 1
-
+            entries: dict[str, dict] = {}
+            lines = 0
+            with open(self._cache_file, 'rb') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = _loads(line)
+                        entries[entry['video_id']] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # Torn write from a crash; later compaction drops it
+                        continue
+
+            self._journal_lines = lines
+            loaded, expired = self._restore_entries(entries)
             logger.info(f"Loaded {loaded} cached URLs from {self._cache_file} ({expired} expired entries discarded)")
 
         except Exception as e:
             logger.warning(f"Failed to load cache from {self._cache_file}: {e}")
 
-    def _save_cache(self) -> None:
-        """Save cache to JSON file.
+    def _load_legacy_cache(self) -> None:
+        """Migrate a legacy JSON snapshot (video_id -> entry) into the journal."""
+        try:
+            cache_data = _loads(self._legacy_cache_file.read_bytes())
 
-        Saves current cache state to disk for persistence across restarts.
-        Only saves valid (non-expired) entries.
-        """
-        if not self._cache_file:
+            loaded, expired = self._restore_entries(cache_data)
+            logger.info(f"Loaded {loaded} cached URLs from {self._legacy_cache_file} ({expired} expired entries discarded)")
+
+        except Exception as e:
+            logger.warning(f"Failed to load cache from {self._legacy_cache_file}: {e}")
             return
 
+        self._compact_cache(force=True)
+
+    def _restore_entries(self, entries: dict[str, dict]) -> tuple[int, int]:
+        """Populate the in-memory cache from serialized entries.
+
+        Args:
+            entries: Mapping of video_id -> serialized cache entry
+
+        Returns:
+            Tuple of (loaded count, expired count)
+        """
+        loaded = 0
+        expired = 0
+        wall_now = time.time()
+        mono_now = time.monotonic()
+        for video_id, entry in entries.items():
+            try:
+                cached_at = int(entry['cached_at'])
+            except (TypeError, ValueError):
+                # Legacy ISO-format timestamp
+                cached_at = int(datetime.fromisoformat(entry['cached_at']).timestamp())
+
+            # Translate the remaining wall-clock lifetime onto the monotonic clock
+            remaining = cached_at + self._ttl_seconds - wall_now
+            if remaining <= 0:
+                expired += 1
+                continue
+
+            self._store(CachedURL(
+                url=entry['url'],
+                cached_at=cached_at,
+                video_id=video_id,
+                expires_at=mono_now + remaining,
+            ))
+            loaded += 1
+
+        return loaded, expired
+
+    @staticmethod
+    def _serialize_entry(cached_url: CachedURL) -> bytes:
+        """Serialize a cache entry as one journal line (including newline)."""
+        return _dumps({
+            'video_id': cached_url.video_id,
+            'url': cached_url.url,
+            # Whole epoch seconds: loads back with no datetime parsing
+            'cached_at': int(cached_url.cached_at),
+        }) + b'\n'
+
+    def _writer_loop(self) -> None:
+        """Append queued cache entries to the journal until close() is called.
+
+        Entries that queue up while a write is in progress are drained and
+        written together, so a burst of resolutions costs one write and fsync.
+        """
+        while True:
+            items = [self._write_queue.get()]
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _WRITER_STOP for item in items)
+            entries = [
+                entry for item in items if item is not _WRITER_STOP for entry in item
+            ]
+            if entries:
+                self._append_batch(entries)
+            if stop:
+                return
+
+    def _append_batch(self, entries: list[CachedURL]) -> None:
+        """Append cache entries to the journal with a single write.
+
+        Writes O(1) bytes per resolution instead of rewriting the whole cache.
+
+        Args:
+            entries: Entries to persist
+        """
         try:
-            # Ensure directory exists
-            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert cache to JSON-serializable format
-            cache_data = {}
-            for video_id, cached_url in self._cache.items():
-                # Only save non-expired entries
-                if self._is_cache_valid(video_id):
-                    cache_data[video_id] = {
-                        'url': cached_url.url,
-                        'cached_at': cached_url.cached_at.isoformat(),
-                        'video_id': cached_url.video_id
-                    }
-
-            # Write to file
-            with open(self._cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-
-            logger.debug(f"Saved {len(cache_data)} cached URLs to {self._cache_file}")
+            data = b''.join(self._serialize_entry(entry) for entry in entries)
+            with self._journal_lock:
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._cache_file, 'ab') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_lines += len(entries)
 
         except Exception as e:
-            logger.warning(f"Failed to save cache to {self._cache_file}: {e}")
+            logger.warning(f"Failed to append to cache file {self._cache_file}: {e}")
+
+    def _compact_cache(self, force: bool = False) -> None:
+        """Rewrite the journal with one line per valid entry.
+
+        Only runs once the journal holds more than twice as many lines as there
+        are cached entries (superseded and expired lines), unless forced.
+
+        Args:
+            force: Rewrite even if the journal is below the compaction threshold
+        """
+        if not self._cache_file:
+            return
+
+        with self._journal_lock:
+            if not force and self._journal_lines <= 2 * len(self._cache):
+                return
+
+            try:
+                # Ensure directory exists
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # Only keep non-expired entries
+                now = time.monotonic()
+                lines = [
+                    self._serialize_entry(cached_url)
+                    for cached_url in list(self._cache.values())
+                    if not self._is_expired(cached_url, now)
+                ]
+
+                # Write a sibling temp file and swap it in, so a crash mid-write
+                # leaves the previous journal intact
+                tmp_file = self._cache_file.with_suffix(self._cache_file.suffix + '.tmp')
+                try:
+                    with open(tmp_file, 'wb') as f:
+                        f.writelines(lines)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_file, self._cache_file)
+                except BaseException:
+                    tmp_file.unlink(missing_ok=True)
+                    raise
+                self._journal_lines = len(lines)
+
+                logger.debug(f"Compacted cache journal to {len(lines)} entries at {self._cache_file}")
+
+            except Exception as e:
+                logger.warning(f"Failed to save cache to {self._cache_file}: {e}")
+
+
+def _retry_after(error: "yt_dlp.utils.DownloadError") -> Optional[float]:
+    """Read the Retry-After header from the HTTP error behind a DownloadError.
+
+    Args:
+        error: yt-dlp error wrapping the failed request
+
+    Returns:
+        Seconds to wait, or None if the response didn't carry a usable header
+    """
+    cause = error.exc_info[1] if error.exc_info else None
+    headers = getattr(getattr(cause, 'response', None), 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Resolver owned by each process-pool worker (see use_processes)
+_process_resolver: Optional[StreamResolver] = None
+
+
+def _init_process_worker() -> None:
+    """Process pool initializer: build the worker's resolver once."""
+    global _process_resolver
+    _process_resolver = StreamResolver(max_workers=1)
+
+
+def _extract_url_in_process(video_id: str) -> Optional[str]:
+    """Extract a stream URL inside a process-pool worker."""
+    return _process_resolver._extract_url(video_id)
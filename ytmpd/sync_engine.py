@@ -5,19 +5,34 @@ This module orchestrates the synchronization of YouTube Music playlists to MPD,
 handling playlist fetching, stream URL resolution, and MPD playlist management.
 """
 
+import hashlib
 import logging
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Optional
 
 from ytmpd.exceptions import MPDConnectionError, MPDPlaylistError, YTMusicAPIError
 from ytmpd.mpd_client import MPDClient, TrackWithMetadata
 from ytmpd.stream_resolver import StreamResolver
-from ytmpd.ytmusic import Playlist, YTMusicClient
+from ytmpd.ytmusic import Playlist, Track, YTMusicClient
 
 logger = logging.getLogger(__name__)
 
+# Playlists synced concurrently; each sync is dominated by network I/O
+DEFAULT_SYNC_WORKERS = 4
+
+# Concurrent playlist track fetches during the prefetch phase (API rate limit)
+TRACK_FETCH_CONCURRENCY = 8
+
+# How long playlist and liked-song listings are reused between calls
+PLAYLIST_CACHE_TTL_SECONDS = 60.0
+
+# Pseudo playlist ID under which liked songs are synced
+LIKED_SONGS_ID = "__LIKED_SONGS__"
+
 
 def _truncate_error(error: Exception, max_length: int = 120) -> str:
     """Truncate error message for logging to prevent massive log lines.
@@ -35,7 +50,7 @@ def _truncate_error(error: Exception, max_length: int = 120) -> str:
     return error_str[:max_length] + "... (truncated)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncResult:
     """Result of a sync operation.
 
@@ -58,7 +73,7 @@ class SyncResult:
     errors: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncPreview:
     """Preview of what would be synced without making changes.
 
@@ -107,6 +122,7 @@ class SyncEngine:
         sync_liked_songs: bool = True,
         liked_songs_playlist_name: str = "Liked Songs",
         like_indicator: dict | None = None,
+        sync_workers: int = DEFAULT_SYNC_WORKERS,
     ):
         """Initialize sync engine with dependencies.
 
@@ -123,6 +139,7 @@ class SyncEngine:
             sync_liked_songs: Whether to sync liked songs as a playlist (default: True).
             liked_songs_playlist_name: Name for the liked songs playlist (default: "Liked Songs").
             like_indicator: Optional like indicator config dict with 'enabled', 'tag', 'alignment'.
+            sync_workers: Maximum number of playlists synced in parallel (default: 4).
         """
         self.ytmusic = ytmusic_client
         self.mpd = mpd_client
@@ -140,9 +157,19 @@ class SyncEngine:
             "tag": "+1",
             "alignment": "right",
         }
+        self.sync_workers = max(1, sync_workers)
+        # MPD speaks one command stream per connection; playlist writes from
+        # parallel syncs must not interleave
+        self._mpd_lock = threading.Lock()
+        # (fetched_at, playlists, playlists by name), replaced as one tuple;
+        # fetched_at is time.monotonic(), see PLAYLIST_CACHE_TTL_SECONDS
+        self._playlists_cache: tuple[float, list[Playlist], dict[str, Playlist]] | None = None
+        self._liked_cache: tuple[float, list[Track]] | None = None
         logger.info(
-            f"SyncEngine initialized with prefix '{self.prefix}', format '{self.playlist_format}', "
-            f"sync_liked_songs={self.sync_liked_songs}"
+            "SyncEngine initialized with prefix '%s', format '%s', sync_liked_songs=%s",
+            self.prefix,
+            self.playlist_format,
+            self.sync_liked_songs,
         )
 
     def sync_all_playlists(self) -> SyncResult:
@@ -170,26 +197,27 @@ class SyncEngine:
 
         try:
             # Fetch all YouTube Music playlists
-            playlists = self.ytmusic.get_user_playlists()
-            logger.info(f"Found {len(playlists)} playlists to sync")
+            playlists = self._get_user_playlists_cached()
+            logger.info("Found %s playlists to sync", len(playlists))
 
             # Create a list to sync (playlists + liked songs if enabled)
             playlists_to_sync = list(playlists)
 
             # Add liked songs as a special "playlist" if enabled
             liked_video_ids: set[str] = set()
+            liked_tracks: list[Track] = []
             if self.sync_liked_songs:
                 try:
-                    liked_tracks = self.ytmusic.get_liked_songs()
+                    liked_tracks = self._get_liked_songs_cached()
                     if liked_tracks:
                         # Create a fake Playlist object for liked songs
                         liked_playlist = Playlist(
-                            id="__LIKED_SONGS__",
+                            id=LIKED_SONGS_ID,
                             name=self.liked_songs_playlist_name,
                             track_count=len(liked_tracks),
                         )
                         playlists_to_sync.append(liked_playlist)
-                        logger.info(f"Found {len(liked_tracks)} liked songs to sync")
+                        logger.info("Found %s liked songs to sync", len(liked_tracks))
                         # Build liked video ID set for like indicator
                         if self.like_indicator.get("enabled", False):
                             liked_video_ids = {t.video_id for t in liked_tracks}
@@ -202,14 +230,15 @@ class SyncEngine:
             elif self.like_indicator.get("enabled", False):
                 # Like indicator enabled but sync_liked_songs is off -- fetch just for the set
                 try:
-                    indicator_liked = self.ytmusic.get_liked_songs()
+                    indicator_liked = self._get_liked_songs_cached()
                     if indicator_liked:
                         liked_video_ids = {t.video_id for t in indicator_liked}
                         logger.info(
-                            f"Fetched {len(liked_video_ids)} liked song IDs for like indicator"
+                            "Fetched %s liked song IDs for like indicator",
+                            len(liked_video_ids),
                         )
                 except Exception as e:
-                    logger.warning(f"Failed to fetch liked songs for like indicator: {e}")
+                    logger.warning("Failed to fetch liked songs for like indicator: %s", e)
 
             if not playlists_to_sync:
                 logger.info("No playlists to sync")
@@ -224,37 +253,83 @@ class SyncEngine:
                     errors=[],
                 )
 
-            # Sync each playlist
-            for idx, playlist in enumerate(playlists_to_sync, 1):
-                # Check if we should stop (e.g., daemon shutting down)
-                if self.should_stop():
+            # Fetch every playlist's tracks up front, overlapping API latency
+            prefetched = self._prefetch_all_tracks(playlists)
+            if liked_tracks:
+                prefetched[LIKED_SONGS_ID] = liked_tracks
+
+            # Resolve every distinct video once; playlists often overlap
+            # (liked songs especially), so per-playlist batches repeat work
+            pre_resolved: dict[str, str] | None = None
+            if not self._proxy_enabled():
+                all_video_ids = list(
+                    dict.fromkeys(
+                        track.video_id
+                        for tracks in prefetched.values()
+                        if not isinstance(tracks, BaseException)
+                        for track in tracks
+                    )
+                )
+                logger.info("Resolving %s distinct video IDs for sync", len(all_video_ids))
+                pre_resolved = self.resolver.resolve_batch(all_video_ids)
+
+            # Sync playlists in parallel; results are tallied on this thread
+            max_workers = min(self.sync_workers, len(playlists_to_sync))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="ytmpd-sync"
+            ) as executor:
+                future_to_playlist = {}
+                for idx, playlist in enumerate(playlists_to_sync, 1):
+                    if self.should_stop():
+                        logger.info("Sync cancelled before all playlists started (requested by daemon)")
+                        break
                     logger.info(
-                        f"Sync cancelled after {playlists_synced} playlists (requested by daemon)"
+                        "Syncing playlist: %s (%s/%s)",
+                        playlist.name,
+                        idx,
+                        len(playlists_to_sync),
+                    )
+                    future = executor.submit(
+                        self._sync_single_playlist_internal,
+                        playlist,
+                        liked_video_ids=liked_video_ids,
+                        tracks=prefetched.get(playlist.id),
+                        pre_resolved=pre_resolved,
                     )
-                    break
+                    future_to_playlist[future] = playlist
 
-                logger.info(f"Syncing playlist: {playlist.name} ({idx}/{len(playlists)})")
+                for future in as_completed(future_to_playlist):
+                    playlist = future_to_playlist[future]
+                    try:
+                        result = future.result()
+                        playlists_synced += 1
+                        tracks_added += result["tracks_added"]
+                        tracks_failed += result["tracks_failed"]
+
+                        if result["tracks_failed"] > 0:
+                            logger.warning(
+                                "Playlist '%s': %s tracks added, %s tracks failed",
+                                playlist.name,
+                                result["tracks_added"],
+                                result["tracks_failed"],
+                            )
 
-                try:
-                    result = self._sync_single_playlist_internal(
-                        playlist, liked_video_ids=liked_video_ids
-                    )
-                    playlists_synced += 1
-                    tracks_added += result["tracks_added"]
-                    tracks_failed += result["tracks_failed"]
-
-                    if result["tracks_failed"] > 0:
-                        logger.warning(
-                            f"Playlist '{playlist.name}': {result['tracks_added']} tracks added, "
-                            f"{result['tracks_failed']} tracks failed"
+                    except Exception as e:
+                        playlists_failed += 1
+                        error_msg = f"Failed to sync playlist '{playlist.name}': {_truncate_error(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        # Continue with other playlists - don't let one failure stop sync
+
+                    # Check if we should stop (e.g., daemon shutting down)
+                    if self.should_stop():
+                        # Drop queued playlists; running ones finish on exit
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        logger.info(
+                            "Sync cancelled after %s playlists (requested by daemon)",
+                            playlists_synced,
                         )
-
-                except Exception as e:
-                    playlists_failed += 1
-                    error_msg = f"Failed to sync playlist '{playlist.name}': {_truncate_error(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    # Continue with next playlist - don't let one failure stop sync
+                        break
 
         except YTMusicAPIError as e:
             error_msg = f"Failed to fetch playlists from YouTube Music: {e}"
@@ -290,10 +365,18 @@ class SyncEngine:
         duration = time.time() - start_time
         success = playlists_failed == 0 and len(errors) == 0
 
+        # A completed sync is the natural point to pick up library changes
+        if success:
+            self.invalidate_cache()
+
         logger.info(
-            f"Sync complete: {playlists_synced} playlists synced, "
-            f"{playlists_failed} failed, {tracks_added} tracks added, "
-            f"{tracks_failed} tracks failed ({duration:.1f}s)"
+            "Sync complete: %s playlists synced, %s failed, %s tracks added, "
+            "%s tracks failed (%.1fs)",
+            playlists_synced,
+            playlists_failed,
+            tracks_added,
+            tracks_failed,
+            duration,
         )
 
         return SyncResult(
@@ -319,17 +402,11 @@ class SyncEngine:
             YTMusicAPIError: If playlist cannot be found or fetched.
         """
         start_time = time.time()
-        logger.info(f"Syncing single playlist: {playlist_name}")
+        logger.info("Syncing single playlist: %s", playlist_name)
 
         try:
             # Find the playlist by name
-            playlists = self.ytmusic.get_user_playlists()
-            matching_playlist: Playlist | None = None
-
-            for playlist in playlists:
-                if playlist.name == playlist_name:
-                    matching_playlist = playlist
-                    break
+            matching_playlist = self._get_playlist_by_name(playlist_name)
 
             if not matching_playlist:
                 error_msg = f"Playlist '{playlist_name}' not found in YouTube Music"
@@ -350,8 +427,11 @@ class SyncEngine:
             duration = time.time() - start_time
 
             logger.info(
-                f"Playlist '{playlist_name}' synced: {result['tracks_added']} tracks added, "
-                f"{result['tracks_failed']} tracks failed ({duration:.1f}s)"
+                "Playlist '%s' synced: %s tracks added, %s tracks failed (%.1fs)",
+                playlist_name,
+                result["tracks_added"],
+                result["tracks_failed"],
+                duration,
             )
 
             return SyncResult(
@@ -394,23 +474,27 @@ class SyncEngine:
         logger.info("Generating sync preview")
 
         # Fetch YouTube Music playlists
-        playlists = self.ytmusic.get_user_playlists()
-        youtube_playlist_names = [p.name for p in playlists]
-
-        # Calculate total tracks
-        total_tracks = sum(p.track_count for p in playlists)
+        playlists = self._get_user_playlists_cached()
+        # Collect names and total track count in a single pass
+        youtube_playlist_names: list[str] = []
+        total_tracks = 0
+        for p in playlists:
+            youtube_playlist_names.append(p.name)
+            total_tracks += p.track_count
 
         # Get existing MPD playlists with our prefix
         try:
             all_mpd_playlists = self.mpd.list_playlists()
             existing_mpd_playlists = [p for p in all_mpd_playlists if p.startswith(self.prefix)]
         except (MPDConnectionError, MPDPlaylistError) as e:
-            logger.warning(f"Could not list MPD playlists: {e}")
+            logger.warning("Could not list MPD playlists: %s", e)
             existing_mpd_playlists = []
 
         logger.info(
-            f"Preview: {len(playlists)} YouTube playlists, {total_tracks} total tracks, "
-            f"{len(existing_mpd_playlists)} existing MPD playlists with prefix"
+            "Preview: %s YouTube playlists, %s total tracks, %s existing MPD playlists with prefix",
+            len(playlists),
+            total_tracks,
+            len(existing_mpd_playlists),
         )
 
         return SyncPreview(
@@ -419,16 +503,138 @@ class SyncEngine:
             existing_mpd_playlists=existing_mpd_playlists,
         )
 
+    def _proxy_enabled(self) -> bool:
+        """Check whether the ICY proxy is enabled (URLs resolved lazily on play).
+
+        Returns:
+            True if proxy_config is set and enabled.
+        """
+        return bool(self.proxy_config and self.proxy_config.get("enabled", False))
+
+    def _get_user_playlists_cached(self) -> list[Playlist]:
+        """Get the user's playlists, reusing a result fetched in the last minute.
+
+        Returns:
+            List of the user's YouTube Music playlists.
+
+        Raises:
+            YTMusicAPIError: If fetching playlists fails.
+        """
+        return list(self._playlists_cache_entry()[1])
+
+    def _get_playlist_by_name(self, playlist_name: str) -> Playlist | None:
+        """Look up one of the user's playlists by name via the cached listing.
+
+        Args:
+            playlist_name: Name of the YouTube Music playlist.
+
+        Returns:
+            The first playlist with that name, or None if there is none.
+
+        Raises:
+            YTMusicAPIError: If fetching playlists fails.
+        """
+        return self._playlists_cache_entry()[2].get(playlist_name)
+
+    def _playlists_cache_entry(
+        self,
+    ) -> tuple[float, list[Playlist], dict[str, Playlist]]:
+        """Return the cached playlist listing, refetching it once the TTL expires.
+
+        Returns:
+            Tuple of (fetched_at, playlists, playlists by name).
+
+        Raises:
+            YTMusicAPIError: If fetching playlists fails.
+        """
+        cached = self._playlists_cache
+        if cached is not None and time.monotonic() - cached[0] < PLAYLIST_CACHE_TTL_SECONDS:
+            return cached
+
+        playlists = list(self.ytmusic.get_user_playlists())
+        by_name: dict[str, Playlist] = {}
+        for playlist in playlists:
+            # Keep the first playlist when several share a name
+            by_name.setdefault(playlist.name, playlist)
+        cached = (time.monotonic(), playlists, by_name)
+        self._playlists_cache = cached
+        return cached
+
+    def _get_liked_songs_cached(self) -> list[Track]:
+        """Get the user's liked songs, reusing a result fetched in the last minute.
+
+        Returns:
+            List of liked tracks.
+
+        Raises:
+            YTMusicAPIError: If fetching liked songs fails.
+        """
+        cached = self._liked_cache
+        if cached is not None and time.monotonic() - cached[0] < PLAYLIST_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
+        tracks = self.ytmusic.get_liked_songs()
+        self._liked_cache = (time.monotonic(), list(tracks))
+        return tracks
+
+    def invalidate_cache(self) -> None:
+        """Drop cached playlist and liked-song listings so the next call refetches.
+
+        Also drops the YouTube Music client's cached playlist track lists and
+        liked songs, so they are refetched too. Cached song details and search
+        results are kept.
+        """
+        self._playlists_cache = None
+        self._liked_cache = None
+        self.ytmusic.clear_playlist_cache()
+
+    def _prefetch_all_tracks(
+        self, playlists: list[Playlist]
+    ) -> dict[str, list[Track] | BaseException]:
+        """Fetch the tracks of all playlists concurrently.
+
+        Fetches run on a thread pool of at most TRACK_FETCH_CONCURRENCY
+        workers. A failed fetch is stored in place of the track list so only
+        that playlist fails to sync.
+
+        Args:
+            playlists: Playlists to fetch tracks for.
+
+        Returns:
+            Dict mapping playlist ID to its tracks or the exception raised.
+        """
+        if not playlists:
+            return {}
+
+        workers = min(TRACK_FETCH_CONCURRENCY, len(playlists))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ytmpd-fetch") as executor:
+            futures = {
+                playlist.id: executor.submit(self.ytmusic.get_playlist_tracks, playlist.id)
+                for playlist in playlists
+            }
+
+        prefetched: dict[str, list[Track] | BaseException] = {}
+        for playlist_id, future in futures.items():
+            error = future.exception()
+            prefetched[playlist_id] = error if error is not None else future.result()
+        return prefetched
+
     def _sync_single_playlist_internal(
         self,
         playlist: Playlist,
         liked_video_ids: set[str] | None = None,
+        tracks: list[Track] | BaseException | None = None,
+        pre_resolved: dict[str, str] | None = None,
     ) -> dict[str, int]:
         """Internal method to sync a single playlist.
 
         Args:
             playlist: Playlist object to sync.
             liked_video_ids: Set of video IDs that are liked, for like indicator.
+            tracks: Tracks already fetched for this playlist (or the exception
+                the fetch raised). Fetched here when None.
+            pre_resolved: Stream URLs already resolved for this sync run. When
+                given, URLs are looked up here instead of calling resolve_batch.
 
         Returns:
             Dict with keys 'tracks_added' and 'tracks_failed'.
@@ -439,127 +645,207 @@ class SyncEngine:
             MPDPlaylistError: If creating playlist in MPD fails.
         """
         # Get tracks for this playlist
+        if isinstance(tracks, BaseException):
+            raise tracks
+        if tracks is not None:
+            logger.info("Using %s prefetched tracks for playlist '%s'", len(tracks), playlist.name)
         # Special handling for liked songs
-        if playlist.id == "__LIKED_SONGS__":
-            tracks = self.ytmusic.get_liked_songs()
-            logger.info(f"Retrieved {len(tracks)} liked songs")
+        elif playlist.id == LIKED_SONGS_ID:
+            tracks = self._get_liked_songs_cached()
+            logger.info("Retrieved %s liked songs", len(tracks))
         else:
             tracks = self.ytmusic.get_playlist_tracks(playlist.id)
-            logger.info(f"Retrieved {len(tracks)} tracks for playlist '{playlist.name}'")
+            logger.info("Retrieved %s tracks for playlist '%s'", len(tracks), playlist.name)
 
         if not tracks:
-            logger.warning(f"Playlist '{playlist.name}' has no tracks, skipping")
+            logger.warning("Playlist '%s' has no tracks, skipping", playlist.name)
             return {"tracks_added": 0, "tracks_failed": 0}
 
-        # Extract video IDs
-        video_ids = [track.video_id for track in tracks]
-
         # When proxy is enabled, skip URL resolution - proxy will resolve on-demand
-        if self.proxy_config and self.proxy_config.get("enabled", False):
+        lazy_resolution = self._proxy_enabled()
+        # (track, video_id, url) in playlist order
+        if lazy_resolution:
             logger.info(
-                f"Proxy enabled - skipping URL resolution for {len(video_ids)} tracks "
-                f"(will resolve on-demand when played)"
+                "Proxy enabled - skipping URL resolution for %s tracks "
+                "(will resolve on-demand when played)",
+                len(tracks),
             )
-            # Use empty dict to signal lazy resolution
-            resolved_urls = {}
-            tracks_added = len(video_ids)
+            # Keep every track with no URL; proxy URLs are generated in
+            # create_or_replace_playlist and resolved on demand
+            kept = [(track, track.video_id, None) for track in tracks]
+            tracks_added = len(tracks)
             tracks_failed = 0
         else:
+            # Extract video IDs
+            video_ids = [track.video_id for track in tracks]
+
             # Resolve video IDs to stream URLs (batch processing for performance)
-            logger.debug(f"Resolving {len(video_ids)} video IDs to stream URLs")
-            resolved_urls = self.resolver.resolve_batch(video_ids)
+            if pre_resolved is not None:
+                url_for = pre_resolved
+            else:
+                logger.debug("Resolving %s video IDs to stream URLs", len(video_ids))
+                url_for = self.resolver.resolve_batch(video_ids)
+
+            # Look up each track's URL (reusing the video_ids column) and keep
+            # only resolved tracks, without a per-playlist copy of the mapping
+            urls = list(map(url_for.get, video_ids))
+            if logger.isEnabledFor(logging.DEBUG):
+                for track, stream_url in zip(tracks, urls):
+                    if stream_url is None:
+                        logger.debug(
+                            "Skipping unresolved track: %s by %s",
+                            track.title,
+                            track.artist,
+                        )
+            kept = [
+                (track, video_id, stream_url)
+                for track, video_id, stream_url in zip(tracks, video_ids, urls)
+                if stream_url is not None
+            ]
 
             # Count successes and failures
-            tracks_added = len(resolved_urls)
+            tracks_added = len(kept)
             tracks_failed = len(video_ids) - tracks_added
 
             if tracks_added == 0:
                 logger.error(
-                    f"No tracks could be resolved for playlist '{playlist.name}', skipping"
+                    "No tracks could be resolved for playlist '%s', skipping",
+                    playlist.name,
                 )
                 raise MPDPlaylistError(
                     f"Failed to resolve any tracks for playlist '{playlist.name}'"
                 )
 
-            logger.info(f"Resolved {tracks_added}/{len(video_ids)} tracks for '{playlist.name}'")
+            logger.info(
+                "Resolved %s/%s tracks for '%s'",
+                tracks_added,
+                len(video_ids),
+                playlist.name,
+            )
 
-        # Create list of tracks with metadata in the same order as tracks
-        tracks_with_metadata = []
-        lazy_resolution = self.proxy_config and self.proxy_config.get("enabled", False)
+        tracks_with_metadata = [
+            TrackWithMetadata(
+                url=stream_url or "",
+                title=track.title,
+                artist=track.artist,
+                video_id=video_id,
+                duration_seconds=track.duration_seconds,
+            )
+            for track, video_id, stream_url in kept
+        ]
+        # TrackStore rows (stream_url None for lazy resolution), written in one transaction
+        track_rows: list[tuple[str, str | None, str, str | None]] = [
+            (video_id, stream_url, track.title, track.artist)
+            for track, video_id, stream_url in kept
+        ]
 
-        for track in tracks:
-            # When proxy enabled, use placeholder URL (proxy will resolve on-demand)
-            if lazy_resolution:
-                # Placeholder URL - proxy URLs generated in create_or_replace_playlist
-                stream_url = None
+        # Create MPD playlist with prefix
+        mpd_playlist_name = f"{self.prefix}{playlist.name}"
+        is_liked_playlist = playlist.id == LIKED_SONGS_ID
+
+        # Skip the TrackStore and MPD writes when the playlist would come out
+        # exactly as it was last written
+        content_hash = None
+        if self.track_store:
+            content_hash = self._playlist_content_hash(
+                mpd_playlist_name, tracks_with_metadata, liked_video_ids, is_liked_playlist
+            )
+            if self._playlist_unchanged(playlist, mpd_playlist_name, content_hash):
+                logger.info("Playlist '%s' unchanged, skipping", playlist.name)
+                return {"tracks_added": tracks_added, "tracks_failed": tracks_failed}
+
+        if self.track_store and track_rows:
+            try:
+                self.track_store.add_tracks(track_rows)
+                logger.debug("Saved %s track mappings for '%s'", len(track_rows), playlist.name)
+            except Exception as e:
+                logger.warning("Failed to save track mappings for '%s': %s", playlist.name, e)
+
+        logger.debug("Creating MPD playlist: %s", mpd_playlist_name)
+        with self._mpd_lock:
+            self.mpd.create_or_replace_playlist(
+                mpd_playlist_name,
+                tracks_with_metadata,
+                proxy_config=self.proxy_config,
+                playlist_format=self.playlist_format,
+                mpd_music_directory=self.mpd_music_directory,
+                liked_video_ids=liked_video_ids,
+                like_indicator=self.like_indicator,
+                is_liked_playlist=is_liked_playlist,
+            )
 
-                # Save track mapping to TrackStore WITHOUT stream_url for lazy resolution
-                if self.track_store:
-                    try:
-                        self.track_store.add_track(
-                            video_id=track.video_id,
-                            stream_url=None,  # Will be resolved on-demand by proxy
-                            title=track.title,
-                            artist=track.artist,
-                        )
-                        logger.debug(f"Saved track metadata for lazy resolution: {track.video_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save track metadata for {track.video_id}: {e}")
-
-                tracks_with_metadata.append(
-                    TrackWithMetadata(
-                        url=stream_url or "",  # Empty URL, proxy URL will be used from M3U
-                        title=track.title,
-                        artist=track.artist,
-                        video_id=track.video_id,
-                        duration_seconds=track.duration_seconds,
-                    )
-                )
-            # When proxy disabled, only include successfully resolved tracks
-            elif track.video_id in resolved_urls:
-                stream_url = resolved_urls[track.video_id]
+        logger.info("Successfully created MPD playlist: %s", mpd_playlist_name)
 
-                # Save track mapping to TrackStore if enabled
-                if self.track_store:
-                    try:
-                        self.track_store.add_track(
-                            video_id=track.video_id,
-                            stream_url=stream_url,
-                            title=track.title,
-                            artist=track.artist,
-                        )
-                        logger.debug(f"Saved track mapping for {track.video_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save track mapping for {track.video_id}: {e}")
-
-                tracks_with_metadata.append(
-                    TrackWithMetadata(
-                        url=stream_url,
-                        title=track.title,
-                        artist=track.artist,
-                        video_id=track.video_id,
-                        duration_seconds=track.duration_seconds,
-                    )
-                )
-            else:
-                logger.debug(f"Skipping unresolved track: {track.title} by {track.artist}")
+        if content_hash is not None:
+            try:
+                self.track_store.set_playlist_hash(playlist.id, playlist.name, content_hash)
+            except Exception as e:
+                logger.warning("Failed to save content hash for '%s': %s", playlist.name, e)
 
-        # Create MPD playlist with prefix
-        mpd_playlist_name = f"{self.prefix}{playlist.name}"
-        logger.debug(f"Creating MPD playlist: {mpd_playlist_name}")
-
-        is_liked_playlist = playlist.id == "__LIKED_SONGS__"
-        self.mpd.create_or_replace_playlist(
-            mpd_playlist_name,
-            tracks_with_metadata,
-            proxy_config=self.proxy_config,
-            playlist_format=self.playlist_format,
-            mpd_music_directory=self.mpd_music_directory,
-            liked_video_ids=liked_video_ids,
-            like_indicator=self.like_indicator,
-            is_liked_playlist=is_liked_playlist,
+        return {"tracks_added": tracks_added, "tracks_failed": tracks_failed}
+
+    def _playlist_content_hash(
+        self,
+        mpd_playlist_name: str,
+        tracks: list[TrackWithMetadata],
+        liked_video_ids: set[str] | None,
+        is_liked_playlist: bool,
+    ) -> str:
+        """Hash everything that determines how a playlist is written to MPD.
+
+        Covers the track list (URLs included, so expiring direct URLs change
+        the hash when re-resolved) and the settings that affect the written
+        file: format, proxy, like indicator and liked state of each track.
+
+        Args:
+            mpd_playlist_name: Playlist name in MPD, prefix included.
+            tracks: Tracks as they would be passed to create_or_replace_playlist.
+            liked_video_ids: Set of liked video IDs, for the like indicator.
+            is_liked_playlist: Whether this is the liked songs playlist.
+
+        Returns:
+            Hex digest of the playlist content.
+        """
+        liked = liked_video_ids if self.like_indicator.get("enabled", False) else None
+        header = repr(
+            (
+                mpd_playlist_name,
+                self.playlist_format,
+                self.mpd_music_directory,
+                sorted((self.proxy_config or {}).items()),
+                sorted(self.like_indicator.items()),
+                is_liked_playlist,
+            )
         )
+        body = "\x1e".join(
+            f"{t.url}\x1f{t.title}\x1f{t.artist}\x1f{t.video_id}\x1f{t.duration_seconds}"
+            f"\x1f{bool(liked) and t.video_id in liked}"
+            for t in tracks
+        )
+        digest = hashlib.blake2b(header.encode(), digest_size=16)
+        digest.update(body.encode())
+        return digest.hexdigest()
 
-        logger.info(f"Successfully created MPD playlist: {mpd_playlist_name}")
+    def _playlist_unchanged(
+        self, playlist: Playlist, mpd_playlist_name: str, content_hash: str
+    ) -> bool:
+        """Check whether a playlist was last written with this content and still exists.
 
-        return {"tracks_added": tracks_added, "tracks_failed": tracks_failed}
+        Args:
+            playlist: Playlist being synced.
+            mpd_playlist_name: Playlist name in MPD, prefix included.
+            content_hash: Hash from _playlist_content_hash().
+
+        Returns:
+            True if the recorded hash matches and the playlist file is on disk.
+        """
+        try:
+            if self.track_store.get_playlist_hash(playlist.id) != content_hash:
+                return False
+            # The playlist may have been deleted outside ytmpd since the last sync
+            return mpd_playlist_name in self.mpd.list_playlists_fs(
+                self.playlist_format, self.mpd_music_directory
+            )
+        except Exception as e:
+            logger.debug("Could not check whether '%s' changed: %s", playlist.name, e)
+            return False
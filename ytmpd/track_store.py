@@ -5,12 +5,61 @@ including YouTube stream URLs, artist names, and track titles. The store is used
 by the ICY proxy server to lookup metadata when serving proxied streams to MPD.
 """
 
+import contextlib
 import sqlite3
 import threading
 import time
+import weakref
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+# Connection tuning applied at open. WAL lets proxy reads proceed during sync
+# writes, and NORMAL synchronous mode skips the per-commit fsync WAL doesn't
+# need; the rest keep temp tables and hot pages in memory. journal_mode and
+# mmap_size are ignored for in-memory databases.
+_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-20000",
+)
+
+# Size of the connection's prepared statement cache (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# Maximum number of get_track() results kept in the in-memory read cache
+TRACK_CACHE_SIZE = 512
+
+# Seconds a cached get_track() result is served before re-reading the database
+TRACK_CACHE_TTL_SECONDS = 30.0
+
+# Upsert shared by add_track() and add_tracks(). A NULL stream_url (lazy
+# resolution) keeps any URL already stored along with its timestamp.
+_UPSERT_TRACK_SQL = """
+    INSERT INTO tracks (video_id, stream_url, artist, title, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(video_id) DO UPDATE SET
+        stream_url = CASE WHEN excluded.stream_url IS NOT NULL
+                          THEN excluded.stream_url
+                          ELSE stream_url END,
+        artist = excluded.artist,
+        title = excluded.title,
+        updated_at = CASE WHEN excluded.stream_url IS NOT NULL
+                          THEN excluded.updated_at
+                          ELSE updated_at END
+"""
+
+
+class _ThreadConnection:
+    """Holds one thread's connection so its lifetime follows the thread."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
 
 class TrackStore:
     """Manages persistent storage of track metadata using SQLite.
@@ -54,23 +103,88 @@ class TrackStore:
         else:
             self.db_path = db_path
 
-        # Allow multi-threaded access (proxy server runs in async thread)
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Enable dict-like access
-
         # Thread lock to serialize database writes
         self._lock = threading.Lock()
 
+        # Each thread gets its own connection to the WAL-mode file so proxy
+        # reads don't queue behind sync writes. Every connection is registered
+        # so close() can release them all, and a thread's connection is closed
+        # when the thread exits so short-lived sync workers don't leak one per
+        # run. An in-memory database only exists
+        # inside one connection, so it keeps a single shared connection and
+        # reads are serialized with the write lock.
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._shared_conn: sqlite3.Connection | None = None
+        self._read_lock: contextlib.AbstractContextManager[Any]
+        if self.db_path == ":memory:":
+            self._shared_conn = self._connect()
+            self._read_lock = self._lock
+        else:
+            self._read_lock = contextlib.nullcontext()
+
+        # Recently read rows as video_id -> (expires_at, row), in LRU order.
+        # Writes through this store drop the affected entries and bump the
+        # generation so a read racing a write can't cache the old row.
+        self._track_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._track_cache_lock = threading.Lock()
+        self._track_cache_generation = 0
+
         self._create_schema()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's database connection, opened on first use."""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = self._local.holder = _ThreadConnection(self._connect())
+            # Thread-local storage is cleared when the thread exits, which
+            # frees the holder and releases its connection
+            weakref.finalize(holder, self._release, holder.conn)
+        return holder.conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Unregister and close a connection whose thread has exited.
+
+        Args:
+            conn: Connection opened by _connect().
+        """
+        with self._connections_lock:
+            with contextlib.suppress(ValueError):
+                self._connections.remove(conn)
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and register a tuned connection to the database.
+
+        Returns:
+            New connection with row access by column name.
+        """
+        # check_same_thread=False only so close() can close connections
+        # opened by other threads; each is otherwise used by its own thread
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        for pragma in _PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
     def _create_schema(self) -> None:
         """Create database schema if it doesn't exist.
 
         Note: stream_url is nullable to support lazy resolution where URLs
         are resolved on-demand by the proxy server rather than during sync.
+        The playlists table records the content hash of each synced playlist.
         """
-        with self.conn:
-            self.conn.execute("""
+        conn = self.conn
+        with conn:
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS tracks (
                     video_id TEXT PRIMARY KEY,
                     stream_url TEXT,
@@ -80,10 +194,20 @@ class TrackStore:
                 )
             """)
             # Create index on updated_at for potential cleanup queries
-            self.conn.execute("""
+            conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_tracks_updated_at
                 ON tracks(updated_at)
             """)
+            # Content hash of each playlist as last written to MPD, so syncs
+            # can skip rewriting playlists that haven't changed
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS playlists (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    last_synced REAL NOT NULL
+                )
+            """)
 
     def add_track(
         self,
@@ -111,24 +235,45 @@ class TrackStore:
             The proxy server will resolve the URL on-demand when the track is played.
             The updated_at timestamp is only changed when stream_url is actually updated.
         """
+        conn = self.conn
         with self._lock:
-            with self.conn:
-                self.conn.execute(
-                    """
-                    INSERT INTO tracks (video_id, stream_url, artist, title, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    ON CONFLICT(video_id) DO UPDATE SET
-                        stream_url = CASE WHEN excluded.stream_url IS NOT NULL
-                                          THEN excluded.stream_url
-                                          ELSE stream_url END,
-                        artist = excluded.artist,
-                        title = excluded.title,
-                        updated_at = CASE WHEN excluded.stream_url IS NOT NULL
-                                          THEN excluded.updated_at
-                                          ELSE updated_at END
-                    """,
+            with conn:
+                conn.execute(
+                    _UPSERT_TRACK_SQL,
                     (video_id, stream_url, artist, title, time.time())
                 )
+        self._invalidate_tracks((video_id,))
+
+    def add_tracks(
+        self, tracks: list[tuple[str, str | None, str, str | None]]
+    ) -> None:
+        """Add or update several tracks in a single transaction.
+
+        Batched counterpart of add_track(), used by playlist sync so a whole
+        playlist costs one commit instead of one per track.
+
+        Args:
+            tracks: List of (video_id, stream_url, title, artist) tuples, with
+                the same semantics as the add_track() arguments
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        if not tracks:
+            return
+
+        now = time.time()
+        conn = self.conn
+        with self._lock:
+            with conn:
+                conn.executemany(
+                    _UPSERT_TRACK_SQL,
+                    [
+                        (video_id, stream_url, artist, title, now)
+                        for video_id, stream_url, title, artist in tracks
+                    ]
+                )
+        self._invalidate_tracks(track[0] for track in tracks)
 
     def get_track(self, video_id: str) -> dict[str, Any] | None:
         """Retrieve track metadata by video_id.
@@ -150,14 +295,48 @@ class TrackStore:
             >>> if track:
             ...     print(f"{track['artist']} - {track['title']}")
         """
-        # Protect read operation with lock to prevent race conditions
-        with self._lock:
+        cached = self._get_cached_track(video_id)
+        if cached is not None:
+            return dict(cached)
+
+        generation = self._track_cache_generation
+        # Only the shared in-memory connection needs reads serialized
+        with self._read_lock:
             cursor = self.conn.execute(
                 "SELECT * FROM tracks WHERE video_id = ?",
                 (video_id,)
             )
             row = cursor.fetchone()
-            return dict(row) if row else None
+        if row is None:
+            return None
+
+        track = dict(row)
+        self._cache_track(video_id, track, generation)
+        return dict(track)
+
+    def get_track_min(self, video_id: str) -> tuple[str | None, float] | None:
+        """Retrieve only the stream URL and its timestamp for a video_id.
+
+        Narrow variant of get_track() for the proxy hot path, which only needs
+        to know whether the URL is resolved and fresh.
+
+        Args:
+            video_id: YouTube video ID to lookup
+
+        Returns:
+            Tuple of (stream_url, updated_at), or None if video_id not found.
+        """
+        cached = self._get_cached_track(video_id)
+        if cached is not None:
+            return (cached["stream_url"], cached["updated_at"])
+
+        with self._read_lock:
+            cursor = self.conn.execute(
+                "SELECT stream_url, updated_at FROM tracks WHERE video_id = ?",
+                (video_id,)
+            )
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
 
     def update_stream_url(self, video_id: str, stream_url: str) -> None:
         """Update the stream URL for an existing track.
@@ -177,9 +356,10 @@ class TrackStore:
             the database (no rows will be affected). Use get_track() first
             to check if a track exists.
         """
+        conn = self.conn
         with self._lock:
-            with self.conn:
-                self.conn.execute(
+            with conn:
+                conn.execute(
                     """
                     UPDATE tracks
                     SET stream_url = ?, updated_at = ?
@@ -187,14 +367,134 @@ class TrackStore:
                     """,
                     (stream_url, time.time(), video_id)
                 )
+        self._invalidate_tracks((video_id,))
+
+    def update_stream_urls(self, updates: list[tuple[str, str]]) -> None:
+        """Update stream URLs for several tracks in a single transaction.
+
+        Batched counterpart of update_stream_url(), used by the proxy's
+        write-behind queue so a burst of refreshes costs one commit.
+
+        Args:
+            updates: List of (video_id, stream_url) pairs
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        if not updates:
+            return
+
+        now = time.time()
+        conn = self.conn
+        with self._lock:
+            with conn:
+                conn.executemany(
+                    """
+                    UPDATE tracks
+                    SET stream_url = ?, updated_at = ?
+                    WHERE video_id = ?
+                    """,
+                    [(stream_url, now, video_id) for video_id, stream_url in updates]
+                )
+        self._invalidate_tracks(video_id for video_id, _ in updates)
+
+    def get_playlist_hash(self, playlist_id: str) -> str | None:
+        """Retrieve the content hash recorded for a playlist's last sync.
+
+        Args:
+            playlist_id: YouTube Music playlist ID
+
+        Returns:
+            The stored content hash, or None if the playlist was never recorded.
+        """
+        with self._read_lock:
+            cursor = self.conn.execute(
+                "SELECT content_hash FROM playlists WHERE id = ?",
+                (playlist_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def set_playlist_hash(self, playlist_id: str, name: str, content_hash: str) -> None:
+        """Record the content hash of a playlist that was just written to MPD.
+
+        Args:
+            playlist_id: YouTube Music playlist ID
+            name: Playlist name
+            content_hash: Hash of the playlist content as written
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        conn = self.conn
+        with self._lock:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO playlists (id, name, content_hash, last_synced)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        name = excluded.name,
+                        content_hash = excluded.content_hash,
+                        last_synced = excluded.last_synced
+                    """,
+                    (playlist_id, name, content_hash, time.time())
+                )
+
+    def _get_cached_track(self, video_id: str) -> dict[str, Any] | None:
+        """Return a fresh cached row for video_id, marking it recently used.
+
+        Args:
+            video_id: YouTube video ID to lookup
+
+        Returns:
+            The cached row (not a copy), or None on a miss or expired entry.
+        """
+        with self._track_cache_lock:
+            entry = self._track_cache.pop(video_id, None)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            # Re-insert to move the entry to the most recently used end
+            self._track_cache[video_id] = entry
+            return entry[1]
+
+    def _cache_track(self, video_id: str, track: dict[str, Any], generation: int) -> None:
+        """Cache a row read from the database, evicting the least recently used.
+
+        Args:
+            video_id: YouTube video ID of the row
+            track: Row as returned by get_track()
+            generation: Cache generation observed before the row was read; the
+                row is dropped if a write has happened since
+        """
+        with self._track_cache_lock:
+            if generation != self._track_cache_generation:
+                return
+            self._track_cache[video_id] = (time.monotonic() + TRACK_CACHE_TTL_SECONDS, track)
+            while len(self._track_cache) > TRACK_CACHE_SIZE:
+                del self._track_cache[next(iter(self._track_cache))]
+
+    def _invalidate_tracks(self, video_ids: Iterable[str]) -> None:
+        """Drop cached rows for video IDs that were just written.
+
+        Args:
+            video_ids: YouTube video IDs whose rows changed
+        """
+        with self._track_cache_lock:
+            self._track_cache_generation += 1
+            for video_id in video_ids:
+                self._track_cache.pop(video_id, None)
 
     def close(self) -> None:
-        """Close database connection.
+        """Close all database connections.
 
         Should be called when the TrackStore is no longer needed to ensure
         proper cleanup of database resources.
         """
-        self.conn.close()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
 
     def __enter__(self) -> "TrackStore":
         """Context manager entry."""
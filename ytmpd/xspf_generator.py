@@ -5,12 +5,33 @@ separate artist/title metadata tags in MPD, enabling proper display in ncmpcpp w
 color-coded fields and duration information.
 """
 
-import xml.sax.saxutils as saxutils
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import Optional
 
+# Tracks grouped into each chunk yielded by iter_xspf(); fewer, larger chunks
+# mean fewer write() calls when the output is streamed to a file
+XSPF_CHUNK_TRACKS = 256
 
-@dataclass
+
+def _escape(text: str) -> str:
+    """Escape &, < and > for XML element content (same output as saxutils.escape).
+
+    Most titles contain none of these characters, so they are returned as-is
+    after a cheap membership check instead of three replace() passes. This is
+    also much faster than str.translate() with a maketrans() table, which
+    rebuilds every string character by character even when nothing changes.
+    """
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+@dataclass(slots=True, frozen=True)
 class XSPFTrack:
     """Track data for XSPF playlist generation."""
     location: str  # URL (will be XML-escaped)
@@ -19,7 +40,56 @@ class XSPFTrack:
     duration: Optional[int] = None  # Duration in milliseconds
 
 
-def generate_xspf(tracks: list[XSPFTrack]) -> str:
+def iter_xspf(
+    tracks: Iterable[XSPFTrack], chunk_tracks: int = XSPF_CHUNK_TRACKS
+) -> Iterator[str]:
+    """Yield XSPF playlist content in chunks of up to chunk_tracks tracks.
+
+    Joining the chunks gives the same document as generate_xspf(), so large
+    playlists can be written straight to a file without building the whole
+    string in memory. ``tracks`` is consumed lazily in a single pass.
+
+    Args:
+        tracks: Iterable of XSPFTrack objects with metadata.
+        chunk_tracks: Maximum number of tracks per yielded chunk.
+
+    Yields:
+        Consecutive pieces of the XSPF XML document.
+    """
+    pending = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<playlist version="1" xmlns="http://xspf.org/ns/0/">\n'
+        '  <trackList>\n'
+    ]
+
+    for track in tracks:
+        # Escape URL and metadata for XML (& → &amp;, < → &lt;, etc.)
+        escaped_location = _escape(track.location)
+        escaped_creator = _escape(track.creator)
+        escaped_title = _escape(track.title)
+
+        # Add duration if available (in milliseconds)
+        duration = ''
+        if track.duration is not None:
+            duration = f'      <duration>{track.duration}</duration>\n'
+
+        pending.append(
+            '    <track>\n'
+            f'      <location>{escaped_location}</location>\n'
+            f'      <creator>{escaped_creator}</creator>\n'
+            f'      <title>{escaped_title}</title>\n'
+            f'{duration}'
+            '    </track>\n'
+        )
+        if len(pending) >= chunk_tracks:
+            yield ''.join(pending)
+            pending.clear()
+
+    pending.append('  </trackList>\n</playlist>')
+    yield ''.join(pending)
+
+
+def generate_xspf(tracks: Iterable[XSPFTrack]) -> str:
     """Generate XSPF playlist content from track list.
 
     Args:
@@ -39,37 +109,7 @@ def generate_xspf(tracks: list[XSPFTrack]) -> str:
         ... ]
         >>> xspf_content = generate_xspf(tracks)
     """
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<playlist version="1" xmlns="http://xspf.org/ns/0/">',
-        '  <trackList>',
-    ]
-
-    for track in tracks:
-        lines.append('    <track>')
-
-        # Escape URL for XML (& → &amp;, < → &lt;, etc.)
-        escaped_location = saxutils.escape(track.location)
-        lines.append(f'      <location>{escaped_location}</location>')
-
-        # Escape metadata for XML
-        escaped_creator = saxutils.escape(track.creator)
-        escaped_title = saxutils.escape(track.title)
-        lines.append(f'      <creator>{escaped_creator}</creator>')
-        lines.append(f'      <title>{escaped_title}</title>')
-
-        # Add duration if available (in milliseconds)
-        if track.duration is not None:
-            lines.append(f'      <duration>{track.duration}</duration>')
-
-        lines.append('    </track>')
-
-    lines.extend([
-        '  </trackList>',
-        '</playlist>',
-    ])
-
-    return '\n'.join(lines)
+    return ''.join(iter_xspf(tracks))
 
 
 def seconds_to_milliseconds(seconds: float) -> int:
@@ -86,3 +126,23 @@ def seconds_to_milliseconds(seconds: float) -> int:
         180500
     """
     return int(seconds * 1000)
+
+
+def durations_to_milliseconds(durations: Iterable[float | None]) -> Iterator[int | None]:
+    """Convert a batch of durations in seconds to milliseconds.
+
+    Batched counterpart of seconds_to_milliseconds() for converting a whole
+    playlist in one pass. Unknown durations (None) stay None. Values are
+    produced lazily so streamed XSPF output never holds them all at once.
+
+    Args:
+        durations: Durations in seconds, or None where unknown.
+
+    Returns:
+        Iterator of durations in milliseconds, in the same order.
+
+    Example:
+        >>> list(durations_to_milliseconds([180.5, None]))
+        [180500, None]
+    """
+    return (None if seconds is None else int(seconds * 1000) for seconds in durations)
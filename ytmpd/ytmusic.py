@@ -4,13 +4,28 @@ This module provides a wrapper around ytmusicapi that handles authentication
 and provides clean interfaces for search, playback, and song info retrieval.
 """
 
+import json
 import logging
+import re
+import sqlite3
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import requests
+import ytmusicapi.ytmusic
+from requests.adapters import HTTPAdapter
 from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicServerError
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
 
 from ytmpd.config import get_config_dir
 from ytmpd.exceptions import YTMusicAPIError, YTMusicAuthError, YTMusicNotFoundError
@@ -18,6 +33,136 @@ from ytmpd.rating import RatingManager, RatingState
 
 logger = logging.getLogger(__name__)
 
+# Track durations as "M:SS" or "H:MM:SS"
+_DURATION_RE = re.compile(r"(?:(\d+):)?(\d+):(\d+)")
+
+# HTTP statuses meaning the session cookies were rejected
+_AUTH_STATUS_CODES = frozenset({401, 403})
+
+# Status code in ytmusicapi's "Server returned HTTP <code>: ..." errors
+_SERVER_STATUS_RE = re.compile(r"Server returned HTTP (\d{3})")
+
+# Last-resort match for auth failures reported without a status code
+_AUTH_ERROR_RE = re.compile(r"auth|credential", re.IGNORECASE)
+
+# Placeholders for metadata missing from API responses
+_UNKNOWN_ARTIST = "Unknown Artist"
+_UNKNOWN_TITLE = "Unknown Title"
+_UNKNOWN_PLAYLIST = "Unknown Playlist"
+
+# Hosts kept in the HTTP session's connection pool (music.youtube.com plus a few)
+SESSION_POOL_CONNECTIONS = 4
+
+# Keep-alive connections per host, enough for concurrent playlist fetches
+SESSION_POOL_MAXSIZE = 32
+
+# Maximum number of API results of one kind (search, playlist tracks, ...)
+# kept in each client's result cache
+RESULT_CACHE_SIZE = 50
+
+# Song details are small and fetched a whole playlist at a time, so they get
+# their own, much larger bound instead of RESULT_CACHE_SIZE
+SONG_INFO_CACHE_SIZE = 5000
+
+# How long search results are reused
+SEARCH_CACHE_TTL_SECONDS = 300.0
+
+# How long song details are reused; they rarely change
+SONG_INFO_CACHE_TTL_SECONDS = 24 * 3600.0
+
+# How long song details persisted on disk are reused across restarts
+SONG_INFO_DISK_TTL_SECONDS = 7 * 24 * 3600.0
+
+# How long playlist track lists and liked songs are reused
+PLAYLIST_CACHE_TTL_SECONDS = 300.0
+
+# Concurrent get_song_info() calls made by get_song_infos()
+SONG_INFO_WORKERS = 6
+
+
+class _OrjsonDecoder:
+    """Stand-in for the json module that decodes API responses with orjson.
+
+    Installed as ytmusicapi.ytmusic.json, which ytmusicapi uses to parse every
+    response body. Anything other than a plain loads() falls through to the
+    stdlib module.
+    """
+
+    @staticmethod
+    def loads(s: str | bytes, **kwargs: Any) -> Any:
+        """Parse a JSON document, deferring to json.loads for custom options."""
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(json, name)
+
+
+if orjson is not None and getattr(ytmusicapi.ytmusic, "json", None) is json:
+    ytmusicapi.ytmusic.json = _OrjsonDecoder()
+
+
+def _build_session() -> requests.Session:
+    """Create the keep-alive HTTP session shared by all API calls of a client.
+
+    Retries are left to YTMusicClient._retry_on_failure, so the adapter
+    doesn't retry on its own. This stays a requests session (HTTP/1.1):
+    ytmusicapi calls session.post() with requests-only keywords such as
+    proxies= and cookies= and reads response.reason. Concurrent calls get
+    their own pooled keep-alive connections instead of HTTP/2 streams.
+
+    Returns:
+        Session with a pooled HTTPS adapter mounted.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SESSION_POOL_CONNECTIONS,
+        pool_maxsize=SESSION_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _duration_to_seconds(duration_str: str) -> int | None:
+    """Convert an "M:SS" or "H:MM:SS" duration string to seconds.
+
+    Args:
+        duration_str: Duration string like "3:45" or "1:23:45".
+
+    Returns:
+        Duration in seconds, or None if the string isn't in either format.
+    """
+    match = _DURATION_RE.fullmatch(duration_str)
+    if match is None:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Decide whether a failed API call was rejected for authentication.
+
+    Uses the HTTP status when one is available, from a requests HTTPError or
+    a ytmusicapi server error, and only falls back to matching the message
+    for errors that carry no status.
+
+    Args:
+        error: Exception raised by the API call.
+
+    Returns:
+        True if retrying can't help because the credentials were refused.
+    """
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None and isinstance(error, YTMusicServerError):
+        match = _SERVER_STATUS_RE.match(str(error))
+        if match:
+            status = int(match.group(1))
+    if status is not None:
+        return status in _AUTH_STATUS_CODES
+    return _AUTH_ERROR_RE.search(str(error)) is not None
+
 
 def _truncate_error(error: Exception, max_length: int = 200) -> str:
     """Truncate error message for logging to prevent massive log lines.
@@ -29,13 +174,18 @@ def _truncate_error(error: Exception, max_length: int = 200) -> str:
     Returns:
         Truncated error message.
     """
-    error_str = str(error)
+    args = error.args
+    # For a plain single-string exception str() would just return args[0]
+    if len(args) == 1 and isinstance(args[0], str) and type(error).__str__ is BaseException.__str__:
+        error_str = args[0]
+    else:
+        error_str = str(error)
     if len(error_str) <= max_length:
         return error_str
-    return error_str[:max_length] + "... (truncated)"
+    return f"{error_str[:max_length]}... (truncated)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Playlist:
     """Represents a YouTube Music playlist.
 
@@ -50,7 +200,7 @@ class Playlist:
     track_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Track:
     """Represents a track in a YouTube Music playlist.
 
@@ -74,23 +224,44 @@ class YTMusicClient:
     retrieving song information, and handling authentication.
     """
 
-    def __init__(self, auth_file: Path | None = None) -> None:
+    def __init__(self, auth_file: Path | None = None, cache_db: Path | None = None) -> None:
         """Initialize the YouTube Music client.
 
         Args:
             auth_file: Path to browser authentication file. If None, uses default location
                        (~/.config/ytmpd/browser.json).
+            cache_db: SQLite file that persists song details across restarts.
+                      If None, results are only cached in memory.
 
         Raises:
-            YTMusicAuthError: If authentication fails or credentials are invalid.
+            YTMusicAuthError: If the authentication file doesn't exist. Invalid
+                credentials surface on the first API call instead.
         """
         if auth_file is None:
             auth_file = get_config_dir() / "browser.json"
 
         self.auth_file = auth_file
-        self._client: YTMusic | None = None
+        # Built on first use by the _client property, since constructing YTMusic
+        # can make a network request
+        self._ytmusic: YTMusic | None = None
+        self._ytmusic_pending = True
+        self._init_lock = threading.Lock()
+        # Reused across API calls and auth refreshes so connections stay warm
+        self._session = _build_session()
+
+        # Parsed API results per kind (key[0]) as key -> (expires_at, result),
+        # each in LRU order and bounded separately so one kind can't evict another
+        self._result_cache: dict[str, dict[tuple[Any, ...], tuple[float, Any]]] = {}
+        self._result_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._disk_cache: sqlite3.Connection | None = None
+        self._disk_cache_lock = threading.Lock()
+        if cache_db is not None:
+            self._disk_cache = self._open_disk_cache(cache_db)
         self._last_request_time = 0.0
         self._min_request_interval = 0.1  # 100ms between requests (rate limiting)
+        self._rate_lock = threading.Lock()
 
         # Auth status caching (to avoid slow API calls on every status request)
         self._auth_cache_valid = True
@@ -98,8 +269,42 @@ class YTMusicClient:
         self._auth_cache_time = 0.0
         self._auth_cache_ttl = 300.0  # 5 minutes
 
-        # Initialize the client
-        self._init_client()
+        # Fail fast on missing credentials; the client itself is built lazily
+        self._check_auth_file()
+
+    @property
+    def _client(self) -> YTMusic | None:
+        """The ytmusicapi client, initialized on first access.
+
+        Returns:
+            The client, or None if initialization failed or it was cleared.
+
+        Raises:
+            YTMusicAuthError: If this access ran the initialization and it failed.
+        """
+        if self._ytmusic_pending:
+            with self._init_lock:
+                if self._ytmusic_pending:
+                    self._ytmusic_pending = False
+                    self._init_client()
+        return self._ytmusic
+
+    @_client.setter
+    def _client(self, client: YTMusic | None) -> None:
+        self._ytmusic = client
+        self._ytmusic_pending = False
+
+    def _check_auth_file(self) -> None:
+        """Ensure the browser authentication file exists.
+
+        Raises:
+            YTMusicAuthError: If the file is missing.
+        """
+        if not self.auth_file.exists():
+            raise YTMusicAuthError(
+                f"Browser authentication file not found: {self.auth_file}\n"
+                f"Please run: python -m ytmpd.ytmusic setup-browser"
+            )
 
     def _init_client(self) -> None:
         """Initialize the ytmusicapi client.
@@ -108,24 +313,101 @@ class YTMusicClient:
             YTMusicAuthError: If authentication fails.
         """
         try:
-            if not self.auth_file.exists():
-                raise YTMusicAuthError(
-                    f"Browser authentication file not found: {self.auth_file}\n"
-                    f"Please run: python -m ytmpd.ytmusic setup-browser"
-                )
+            self._check_auth_file()
 
             logger.info("Initializing YouTube Music client with browser authentication")
 
             # Initialize YTMusic with browser authentication file
-            self._client = YTMusic(str(self.auth_file))
+            self._client = YTMusic(str(self.auth_file), requests_session=self._session)
             logger.info("Successfully authenticated with YouTube Music")
 
         except YTMusicAuthError:
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize YouTube Music client: {e}")
+            logger.error("Failed to initialize YouTube Music client: %s", e)
             raise YTMusicAuthError(f"Authentication failed: {e}") from e
 
+    @staticmethod
+    def _open_disk_cache(cache_db: Path) -> sqlite3.Connection | None:
+        """Open the persistent song-details cache, dropping expired rows.
+
+        Args:
+            cache_db: Path to the SQLite cache file.
+
+        Returns:
+            Open connection, or None if the file can't be used (caching then
+            stays in memory only).
+        """
+        try:
+            cache_db.parent.mkdir(parents=True, exist_ok=True)
+            # Every access goes through _disk_cache_lock
+            conn = sqlite3.connect(str(cache_db), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS song_info (
+                    video_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("DELETE FROM song_info WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning("Song info disk cache disabled (%s): %s", cache_db, e)
+            return None
+
+    def _disk_get_song_info(self, video_id: str) -> dict[str, Any] | None:
+        """Return unexpired song details persisted by an earlier run.
+
+        Args:
+            video_id: YouTube video ID.
+
+        Returns:
+            Song info dictionary, or None if absent, expired or disk caching is off.
+        """
+        if self._disk_cache is None:
+            return None
+        with self._disk_cache_lock:
+            row = self._disk_cache.execute(
+                "SELECT data FROM song_info WHERE video_id = ? AND expires_at > ?",
+                (video_id, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_put_song_info(self, video_id: str, song_info: dict[str, Any]) -> None:
+        """Persist song details so later runs can skip the API call.
+
+        Args:
+            video_id: YouTube video ID.
+            song_info: Parsed song info dictionary.
+        """
+        if self._disk_cache is None:
+            return
+        with self._disk_cache_lock:
+            try:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO song_info (video_id, data, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (video_id, json.dumps(song_info), time.time() + SONG_INFO_DISK_TTL_SECONDS),
+                )
+                self._disk_cache.commit()
+            except sqlite3.Error as e:
+                logger.warning("Failed to persist song info for %s: %s", video_id, e)
+
+    def close(self) -> None:
+        """Close the HTTP session, its pooled connections and the disk cache.
+
+        Safe to call more than once.
+        """
+        self._session.close()
+        with self._disk_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+
     def refresh_auth(self, auth_file: Path | None = None) -> bool:
         """Reinitialize the client with fresh credentials.
 
@@ -139,13 +421,14 @@ class YTMusicClient:
             self.auth_file = auth_file
 
         try:
-            self._init_client()
+            with self._init_lock:
+                self._init_client()
             # Reset the auth cache so next is_authenticated() does a fresh check
             self._auth_cache_time = 0.0
             logger.info("Successfully refreshed YouTube Music authentication")
             return True
         except Exception as e:
-            logger.error(f"Failed to refresh authentication: {_truncate_error(e)}")
+            logger.error("Failed to refresh authentication: %s", _truncate_error(e))
             return False
 
     def is_authenticated(self) -> tuple[bool, str]:
@@ -156,8 +439,11 @@ class YTMusicClient:
         Returns:
             Tuple of (is_valid, error_message). error_message is empty string if valid.
         """
-        if not self._client:
-            return False, "Client not initialized"
+        try:
+            if not self._client:
+                return False, "Client not initialized"
+        except YTMusicAuthError as e:
+            return False, _truncate_error(e, max_length=150)
 
         # Check if cache is still valid
         current_time = time.time()
@@ -199,14 +485,25 @@ class YTMusicClient:
             return False, auth_error
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between API requests.
+
+        Thread-safe: each caller reserves the next start slot under a lock and
+        sleeps outside it, so concurrent requests start at least
+        _min_request_interval apart without being serialized end to end.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._last_request_time + self._min_request_interval)
+            self._last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def _retry_on_failure(self, func: Any, *args: Any, max_retries: int = 3, **kwargs: Any) -> Any:
-        """Retry a function call on transient failures.
+        """Call func with rate limiting, retrying on transient failures.
+
+        Backoff sleeps block only the calling thread. Code running on an
+        event loop must call client methods through run_in_executor, as
+        SyncEngine and the ICY proxy do, never directly.
 
         Args:
             func: Function to call.
@@ -223,16 +520,21 @@ class YTMusicClient:
         last_error = None
 
         for attempt in range(max_retries):
+            # Every attempt, retries included, keeps the request spacing
+            self._rate_limit()
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 last_error = e
                 logger.warning(
-                    f"API call failed (attempt {attempt + 1}/{max_retries}): {_truncate_error(e)}"
+                    "API call failed (attempt %s/%s): %s",
+                    attempt + 1,
+                    max_retries,
+                    _truncate_error(e),
                 )
 
                 # Don't retry on authentication errors or not found errors
-                if "auth" in str(e).lower() or "credential" in str(e).lower():
+                if _is_auth_error(e):
                     raise YTMusicAuthError(f"Authentication error: {e}") from e
                 if isinstance(e, YTMusicNotFoundError):
                     raise
@@ -240,15 +542,117 @@ class YTMusicClient:
                 # Exponential backoff
                 if attempt < max_retries - 1:
                     sleep_time = 2**attempt
-                    logger.info(f"Retrying in {sleep_time} seconds...")
+                    logger.info("Retrying in %s seconds...", sleep_time)
                     time.sleep(sleep_time)
 
         # All retries failed
-        logger.error(f"API call failed after {max_retries} attempts: {_truncate_error(last_error)}")
+        logger.error(
+            "API call failed after %s attempts: %s", max_retries, _truncate_error(last_error)
+        )
         raise YTMusicAPIError(
             f"API call failed: {_truncate_error(last_error, max_length=300)}"
         ) from last_error
 
+    def _cache_get(self, key: tuple[Any, ...]) -> Any | None:
+        """Return a cached, unexpired API result and mark it recently used.
+
+        Args:
+            key: Cache key, (method name, *arguments).
+
+        Returns:
+            The cached result (not a copy), or None on a miss.
+        """
+        with self._result_cache_lock:
+            cache = self._result_cache.get(key[0])
+            entry = cache.pop(key, None) if cache is not None else None
+            if entry is None or entry[0] <= time.monotonic():
+                self._cache_misses += 1
+                return None
+            # Re-insert to move the entry to the most recently used end
+            cache[key] = entry
+            self._cache_hits += 1
+            return entry[1]
+
+    def _cache_put(self, key: tuple[Any, ...], result: Any, ttl: float) -> None:
+        """Cache a parsed API result, evicting the least recently used entries.
+
+        Args:
+            key: Cache key, (method name, *arguments).
+            result: Parsed result to cache.
+            ttl: Seconds the result stays valid.
+        """
+        max_size = SONG_INFO_CACHE_SIZE if key[0] == "song_info" else RESULT_CACHE_SIZE
+        with self._result_cache_lock:
+            cache = self._result_cache.setdefault(key[0], {})
+            cache[key] = (time.monotonic() + ttl, result)
+            while len(cache) > max_size:
+                del cache[next(iter(cache))]
+
+    def _cache_drop(self, predicate: Callable[[tuple[Any, ...]], bool]) -> int:
+        """Remove cached results whose key matches predicate.
+
+        Args:
+            predicate: Callable taking a cache key and returning True to drop it.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._result_cache_lock:
+            removed = 0
+            for cache in self._result_cache.values():
+                stale = [key for key in cache if predicate(key)]
+                for key in stale:
+                    del cache[key]
+                removed += len(stale)
+            return removed
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory API results so the next calls hit the network.
+
+        Song details persisted on disk are kept; see clear_disk_cache().
+        """
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def clear_disk_cache(self) -> None:
+        """Drop the song details persisted across restarts."""
+        with self._disk_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.execute("DELETE FROM song_info")
+                self._disk_cache.commit()
+
+    def clear_playlist_cache(self) -> int:
+        """Drop cached playlist track lists and liked songs.
+
+        Returns:
+            Number of cached results removed.
+        """
+        return self._cache_drop(lambda key: key[0] in ("playlist_tracks", "liked_songs"))
+
+    def clear_cache_for_query(self, query: str) -> int:
+        """Drop cached search results for a query, whatever the limit.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            Number of cached results removed.
+        """
+        return self._cache_drop(lambda key: key[0] == "search" and key[1] == query)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get statistics about the API result cache.
+
+        Returns:
+            Dictionary with keys: entries, hits, misses.
+        """
+        with self._result_cache_lock:
+            return {
+                "entries": sum(len(cache) for cache in self._result_cache.values()),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            }
+
     def search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search for songs on YouTube Music.
 
@@ -266,8 +670,12 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
-        logger.info(f"Searching for: {query}")
-        self._rate_limit()
+        cache_key = ("search", query, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return [dict(song) for song in cached]
+
+        logger.info("Searching for: %s", query)
 
         def _search() -> list[dict[str, Any]]:
             results = self._client.search(query, filter="songs", limit=limit)
@@ -279,40 +687,22 @@ class YTMusicClient:
             if not raw_results:
                 raise YTMusicNotFoundError(f"No results found for query: {query}")
 
-            # Parse results into standardized format
-            songs = []
-            for result in raw_results:
-                try:
-                    # Extract artist name(s)
-                    artists = result.get("artists", [])
-                    artist_name = artists[0]["name"] if artists else "Unknown Artist"
-
-                    # Extract duration (in seconds)
-                    duration_text = result.get("duration", "0:00")
-                    duration_seconds = self._parse_duration(duration_text)
-
-                    song = {
-                        "video_id": result.get("videoId", ""),
-                        "title": result.get("title", "Unknown Title"),
-                        "artist": artist_name,
-                        "duration": duration_seconds,
-                    }
-                    songs.append(song)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse search result: {e}")
-                    continue
+            # Parse results into standardized format, dropping malformed ones
+            songs = [
+                song for song in map(self._parse_search_result, raw_results) if song is not None
+            ]
 
             if not songs:
                 raise YTMusicNotFoundError(f"No valid results found for query: {query}")
 
-            logger.info(f"Found {len(songs)} results for: {query}")
-            return songs
+            logger.info("Found %s results for: %s", len(songs), query)
+            self._cache_put(cache_key, songs, SEARCH_CACHE_TTL_SECONDS)
+            return [dict(song) for song in songs]
 
         except YTMusicNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise YTMusicAPIError(f"Search failed: {e}") from e
 
     def get_song_info(self, video_id: str) -> dict[str, Any]:
@@ -331,8 +721,17 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
-        logger.info(f"Getting song info for video_id: {video_id}")
-        self._rate_limit()
+        cache_key = ("song_info", video_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        persisted = self._disk_get_song_info(video_id)
+        if persisted is not None:
+            self._cache_put(cache_key, persisted, SONG_INFO_CACHE_TTL_SECONDS)
+            return dict(persisted)
+
+        logger.info("Getting song info for video_id: %s", video_id)
 
         def _get_song() -> dict[str, Any]:
             return self._client.get_song(video_id)
@@ -349,8 +748,8 @@ class YTMusicClient:
             # Parse song info into standardized format
             song_info = {
                 "video_id": video_id,
-                "title": video_details.get("title", "Unknown Title"),
-                "artist": video_details.get("author", "Unknown Artist"),
+                "title": video_details.get("title", _UNKNOWN_TITLE),
+                "artist": video_details.get("author", _UNKNOWN_ARTIST),
                 "album": "",  # Album info may not be available in videoDetails
                 "duration": int(video_details.get("lengthSeconds", 0)),
                 "thumbnail_url": "",
@@ -362,15 +761,55 @@ class YTMusicClient:
                 # Get the highest quality thumbnail
                 song_info["thumbnail_url"] = thumbnails[-1].get("url", "")
 
-            logger.info(f"Retrieved info for: {song_info['title']} by {song_info['artist']}")
-            return song_info
+            logger.info("Retrieved info for: %s by %s", song_info["title"], song_info["artist"])
+            self._cache_put(cache_key, song_info, SONG_INFO_CACHE_TTL_SECONDS)
+            self._disk_put_song_info(video_id, song_info)
+            return dict(song_info)
 
         except YTMusicNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get song info: {e}")
+            logger.error("Failed to get song info: %s", e)
             raise YTMusicAPIError(f"Failed to get song info: {e}") from e
 
+    def get_song_infos(self, video_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get song info for several videos concurrently.
+
+        Each video goes through get_song_info(), so cached results are reused
+        and uncached ones are fetched on SONG_INFO_WORKERS threads, still
+        subject to the client's rate limit.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates are fetched once).
+
+        Returns:
+            Dict mapping video_id -> song info, in input order, for videos that
+            were found. Failures are logged and left out.
+
+        Raises:
+            YTMusicAuthError: If client is not initialized.
+        """
+        if not self._client:
+            raise YTMusicAuthError("Client not initialized")
+
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return {}
+
+        def _get(video_id: str) -> dict[str, Any] | None:
+            try:
+                return self.get_song_info(video_id)
+            except (YTMusicAPIError, YTMusicNotFoundError) as e:
+                logger.warning("Failed to get song info for %s: %s", video_id, _truncate_error(e))
+                return None
+
+        workers = min(SONG_INFO_WORKERS, len(video_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ytmpd-songinfo") as pool:
+            infos = pool.map(_get, video_ids)
+            return {
+                video_id: info for video_id, info in zip(video_ids, infos) if info is not None
+            }
+
     def get_user_playlists(self) -> list[Playlist]:
         """Fetch all user playlists from YouTube Music.
 
@@ -386,7 +825,6 @@ class YTMusicClient:
             raise YTMusicAuthError("Client not initialized")
 
         logger.info("Fetching user playlists")
-        self._rate_limit()
 
         def _get_playlists() -> list[dict[str, Any]]:
             return self._client.get_library_playlists(limit=None)
@@ -415,26 +853,26 @@ class YTMusicClient:
                     # Filter out empty playlists
                     if track_count == 0:
                         logger.debug(
-                            f"Skipping empty playlist: {raw_playlist.get('title', 'Unknown')}"
+                            "Skipping empty playlist: %s", raw_playlist.get("title", "Unknown")
                         )
                         continue
 
                     playlist = Playlist(
                         id=playlist_id,
-                        name=raw_playlist.get("title", "Unknown Playlist"),
+                        name=raw_playlist.get("title", _UNKNOWN_PLAYLIST),
                         track_count=track_count,
                     )
                     playlists.append(playlist)
 
                 except Exception as e:
-                    logger.warning(f"Failed to parse playlist: {e}")
+                    logger.warning("Failed to parse playlist: %s", e)
                     continue
 
-            logger.info(f"Found {len(playlists)} playlists (filtered out empty playlists)")
+            logger.info("Found %s playlists (filtered out empty playlists)", len(playlists))
             return playlists
 
         except Exception as e:
-            logger.error(f"Failed to fetch playlists: {e}")
+            logger.error("Failed to fetch playlists: %s", e)
             raise YTMusicAPIError(f"Failed to fetch playlists: {e}") from e
 
     def get_playlist_tracks(self, playlist_id: str) -> list[Track]:
@@ -455,9 +893,19 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
-        logger.info(f"Fetching tracks for playlist: {playlist_id}")
-        self._rate_limit()
+        cache_key = ("playlist_tracks", playlist_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        logger.info("Fetching tracks for playlist: %s", playlist_id)
 
+        # Always a full fetch: the browse endpoint is a POST without ETags, and
+        # hashing ytmusicapi's parsed response costs more than re-parsing it.
+        # Unchanged playlists are skipped later by SyncEngine's content hash.
+        # Pages aren't streamed either: get_playlist() follows continuations
+        # internally without exposing them, and every consumer needs the
+        # whole playlist before writing it to MPD.
         def _get_tracks() -> dict[str, Any]:
             return self._client.get_playlist(playlist_id, limit=None)
 
@@ -470,67 +918,24 @@ class YTMusicClient:
             # Get tracks from playlist
             raw_tracks = raw_playlist.get("tracks", [])
             if not raw_tracks:
-                logger.info(f"No tracks found in playlist: {playlist_id}")
+                logger.info("No tracks found in playlist: %s", playlist_id)
                 return []
 
-            # Parse tracks into standardized format
-            tracks = []
-            for raw_track in raw_tracks:
-                try:
-                    video_id = raw_track.get("videoId")
+            # Parse tracks into standardized format, dropping unusable rows
+            tracks = [
+                track
+                for track in map(self._parse_track_row, raw_tracks)
+                if track is not None
+            ]
 
-                    # Skip tracks without video_id (podcasts, etc.)
-                    if not video_id:
-                        logger.debug(
-                            f"Skipping track without video_id: {raw_track.get('title', 'Unknown')}"
-                        )
-                        continue
-
-                    # Extract artist name(s)
-                    artists = raw_track.get("artists", [])
-                    if artists and isinstance(artists, list) and len(artists) > 0:
-                        artist_name = artists[0].get("name", "Unknown Artist")
-                    else:
-                        artist_name = "Unknown Artist"
-
-                    # Extract duration (YouTube Music API provides "duration" or "duration_seconds")
-                    duration_seconds = None
-                    if "duration_seconds" in raw_track:
-                        duration_seconds = float(raw_track["duration_seconds"])
-                    elif "duration" in raw_track:
-                        # Duration might be in string format like "3:45"
-                        duration_str = raw_track["duration"]
-                        if isinstance(duration_str, str) and ":" in duration_str:
-                            try:
-                                parts = duration_str.split(":")
-                                if len(parts) == 2:  # MM:SS
-                                    duration_seconds = int(parts[0]) * 60 + int(parts[1])
-                                elif len(parts) == 3:  # HH:MM:SS
-                                    duration_seconds = (
-                                        int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                                    )
-                            except (ValueError, IndexError):
-                                logger.debug(f"Could not parse duration: {duration_str}")
-
-                    track = Track(
-                        video_id=video_id,
-                        title=raw_track.get("title", "Unknown Title"),
-                        artist=artist_name,
-                        duration_seconds=duration_seconds,
-                    )
-                    tracks.append(track)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse track: {e}")
-                    continue
-
-            logger.info(f"Found {len(tracks)} valid tracks in playlist {playlist_id}")
-            return tracks
+            logger.info("Found %s valid tracks in playlist %s", len(tracks), playlist_id)
+            self._cache_put(cache_key, tracks, PLAYLIST_CACHE_TTL_SECONDS)
+            return list(tracks)
 
         except YTMusicNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to fetch playlist tracks: {e}")
+            logger.error("Failed to fetch playlist tracks: %s", e)
             raise YTMusicAPIError(f"Failed to fetch playlist tracks: {e}") from e
 
     def get_liked_songs(self, limit: int | None = None) -> list[Track]:
@@ -553,8 +958,12 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
+        cache_key = ("liked_songs", limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         logger.info("Fetching liked songs")
-        self._rate_limit()
 
         def _get_liked() -> dict[str, Any]:
             return self._client.get_liked_songs(limit=limit)
@@ -572,62 +981,19 @@ class YTMusicClient:
                 logger.info("No liked songs found")
                 return []
 
-            # Parse tracks into standardized format
-            tracks = []
-            for raw_track in raw_tracks:
-                try:
-                    video_id = raw_track.get("videoId")
-
-                    # Skip tracks without video_id (podcasts, etc.)
-                    if not video_id:
-                        logger.debug(
-                            f"Skipping track without video_id: {raw_track.get('title', 'Unknown')}"
-                        )
-                        continue
-
-                    # Extract artist name(s)
-                    artists = raw_track.get("artists", [])
-                    if artists and isinstance(artists, list) and len(artists) > 0:
-                        artist_name = artists[0].get("name", "Unknown Artist")
-                    else:
-                        artist_name = "Unknown Artist"
-
-                    # Extract duration (YouTube Music API provides "duration" or "duration_seconds")
-                    duration_seconds = None
-                    if "duration_seconds" in raw_track:
-                        duration_seconds = float(raw_track["duration_seconds"])
-                    elif "duration" in raw_track:
-                        # Duration might be in string format like "3:45"
-                        duration_str = raw_track["duration"]
-                        if isinstance(duration_str, str) and ":" in duration_str:
-                            try:
-                                parts = duration_str.split(":")
-                                if len(parts) == 2:  # MM:SS
-                                    duration_seconds = int(parts[0]) * 60 + int(parts[1])
-                                elif len(parts) == 3:  # HH:MM:SS
-                                    duration_seconds = (
-                                        int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                                    )
-                            except (ValueError, IndexError):
-                                logger.debug(f"Could not parse duration: {duration_str}")
-
-                    track = Track(
-                        video_id=video_id,
-                        title=raw_track.get("title", "Unknown Title"),
-                        artist=artist_name,
-                        duration_seconds=duration_seconds,
-                    )
-                    tracks.append(track)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse liked song: {e}")
-                    continue
+            # Parse tracks into standardized format, dropping unusable rows
+            tracks = [
+                track
+                for track in map(self._parse_track_row, raw_tracks)
+                if track is not None
+            ]
 
-            logger.info(f"Found {len(tracks)} liked songs")
-            return tracks
+            logger.info("Found %s liked songs", len(tracks))
+            self._cache_put(cache_key, tracks, PLAYLIST_CACHE_TTL_SECONDS)
+            return list(tracks)
 
         except Exception as e:
-            logger.error(f"Failed to fetch liked songs: {e}")
+            logger.error("Failed to fetch liked songs: %s", e)
             raise YTMusicAPIError(f"Failed to fetch liked songs: {e}") from e
 
     def get_track_rating(self, video_id: str) -> RatingState:
@@ -655,8 +1021,7 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
-        logger.info(f"Getting rating for video_id: {video_id}")
-        self._rate_limit()
+        logger.info("Getting rating for video_id: %s", video_id)
 
         def _get_rating() -> str:
             # Use get_watch_playlist with limit=1 to get track info including likeStatus
@@ -674,8 +1039,9 @@ class YTMusicClient:
             # Treat None as INDIFFERENT (neutral)
             if like_status is None:
                 logger.info(
-                    f"Track {video_id} has likeStatus=None (videoType: {track.get('videoType')}), "
-                    f"treating as INDIFFERENT"
+                    "Track %s has likeStatus=None (videoType: %s), treating as INDIFFERENT",
+                    video_id,
+                    track.get("videoType"),
                 )
                 return "INDIFFERENT"
 
@@ -686,13 +1052,13 @@ class YTMusicClient:
             rating_manager = RatingManager()
             rating_state = rating_manager.parse_api_rating(api_rating)
 
-            logger.info(f"Track {video_id} has rating: {rating_state.value}")
+            logger.info("Track %s has rating: %s", video_id, rating_state.api_value)
             return rating_state
 
         except (YTMusicNotFoundError, YTMusicAuthError):
             raise
         except Exception as e:
-            logger.error(f"Failed to get track rating: {_truncate_error(e)}")
+            logger.error("Failed to get track rating: %s", _truncate_error(e))
             raise YTMusicAPIError(f"Failed to get track rating: {_truncate_error(e)}") from e
 
     def set_track_rating(self, video_id: str, rating: RatingState) -> None:
@@ -709,8 +1075,7 @@ class YTMusicClient:
         if not self._client:
             raise YTMusicAuthError("Client not initialized")
 
-        logger.info(f"Setting rating for {video_id} to {rating.value}")
-        self._rate_limit()
+        logger.info("Setting rating for %s to %s", video_id, rating.api_value)
 
         def _set_rating() -> None:
             from ytmusicapi.models.content.enums import LikeStatus
@@ -727,12 +1092,14 @@ class YTMusicClient:
 
         try:
             self._retry_on_failure(_set_rating)
-            logger.info(f"Successfully set rating to {rating.value}")
+            logger.info("Successfully set rating to %s", rating.api_value)
+            # Liked songs changed; don't serve the cached list
+            self._cache_drop(lambda key: key[0] == "liked_songs")
 
         except YTMusicAuthError:
             raise
         except Exception as e:
-            logger.error(f"Failed to set track rating: {_truncate_error(e)}")
+            logger.error("Failed to set track rating: %s", _truncate_error(e))
             raise YTMusicAPIError(f"Failed to set track rating: {_truncate_error(e)}") from e
 
     def get_song(self, video_id: str) -> dict[str, Any]:
@@ -756,7 +1123,6 @@ class YTMusicClient:
             raise YTMusicAuthError("Client not initialized")
 
         logger.debug("Getting song for history reporting: %s", video_id)
-        self._rate_limit()
 
         def _get() -> dict[str, Any]:
             return self._client.get_song(video_id)
@@ -791,8 +1157,6 @@ class YTMusicClient:
             logger.warning("Cannot report history: client not initialized")
             return False
 
-        self._rate_limit()
-
         try:
             response = self._retry_on_failure(self._client.add_history_item, song)
             if response and hasattr(response, "status_code") and response.status_code == 204:
@@ -815,22 +1179,100 @@ class YTMusicClient:
         Returns:
             Duration in seconds.
         """
+        if not isinstance(duration_str, str):
+            logger.warning("Failed to parse duration: %s", duration_str)
+            return 0
+        seconds = _duration_to_seconds(duration_str)
+        if seconds is None:
+            logger.warning("Unexpected duration format: %s", duration_str)
+            return 0
+        return seconds
+
+    @classmethod
+    def _parse_search_result(cls, result: dict[str, Any]) -> dict[str, Any] | None:
+        """Parse one song search result into the search() result format.
+
+        Args:
+            result: Search result dict as returned by ytmusicapi.
+
+        Returns:
+            Song dictionary with keys video_id, title, artist and duration, or
+            None if the result is malformed.
+        """
+        try:
+            get = result.get
+            artists = get("artists")
+            return {
+                "video_id": get("videoId", ""),
+                "title": get("title", _UNKNOWN_TITLE),
+                "artist": artists[0]["name"] if artists else _UNKNOWN_ARTIST,
+                "duration": cls._parse_duration(get("duration", "0:00")),
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to parse search result: %s", e)
+            return None
+
+    @classmethod
+    def _parse_track_row(cls, raw_track: dict[str, Any]) -> Track | None:
+        """Parse one playlist or liked-songs entry into a Track.
+
+        Args:
+            raw_track: Track dict as returned by ytmusicapi.
+
+        Returns:
+            The parsed Track, or None for entries without a video ID (podcasts,
+            etc.) or that are malformed.
+        """
         try:
-            parts = duration_str.split(":")
-            if len(parts) == 2:
-                # M:SS format
-                minutes, seconds = parts
-                return int(minutes) * 60 + int(seconds)
-            elif len(parts) == 3:
-                # H:MM:SS format
-                hours, minutes, seconds = parts
-                return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+            video_id = raw_track.get("videoId")
+
+            # Skip tracks without video_id (podcasts, etc.)
+            if not video_id:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Skipping track without video_id: %s", raw_track.get("title", "Unknown")
+                    )
+                return None
+
+            # Extract artist name(s)
+            artists = raw_track.get("artists")
+            if artists and isinstance(artists, list):
+                artist_name = artists[0].get("name", _UNKNOWN_ARTIST)
             else:
-                logger.warning(f"Unexpected duration format: {duration_str}")
-                return 0
-        except (ValueError, AttributeError):
-            logger.warning(f"Failed to parse duration: {duration_str}")
-            return 0
+                artist_name = _UNKNOWN_ARTIST
+
+            return Track(
+                video_id=video_id,
+                title=raw_track.get("title", _UNKNOWN_TITLE),
+                artist=artist_name,
+                duration_seconds=cls._track_duration(raw_track),
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to parse track: %s", e)
+            return None
+
+    @staticmethod
+    def _track_duration(raw_track: dict[str, Any]) -> float | None:
+        """Extract a track's duration from a playlist or liked-songs entry.
+
+        The API provides either numeric "duration_seconds" or a "duration"
+        string like "3:45".
+
+        Args:
+            raw_track: Track dict as returned by ytmusicapi.
+
+        Returns:
+            Duration in seconds, or None if unavailable or unparseable.
+        """
+        if "duration_seconds" in raw_track:
+            return float(raw_track["duration_seconds"])
+        duration_str = raw_track.get("duration")
+        if not isinstance(duration_str, str):
+            return None
+        seconds = _duration_to_seconds(duration_str)
+        if seconds is None:
+            logger.debug("Could not parse duration: %s", duration_str)
+        return seconds
 
     @staticmethod
     def setup_browser() -> None:
@@ -911,7 +1353,7 @@ class YTMusicClient:
             print("\n\nSetup cancelled by user.")
             raise YTMusicAuthError("Browser setup cancelled by user")
         except Exception as e:
-            logger.error(f"Browser setup failed: {e}")
+            logger.error("Browser setup failed: %s", e)
             raise YTMusicAuthError(f"Browser setup failed: {e}") from e
 
 